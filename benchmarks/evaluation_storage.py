@@ -0,0 +1,109 @@
+"""評価テーブルの保存形式の比較
+Created: 2026-10-18 00:10:24
+Author: GingaDza
+
+従来の rowid テーブル（サロゲートキー + UNIQUE(user_id, skill_id) + 文字列の日時）と、
+WITHOUT ROWID テーブル（複合主キー + エポック秒）に同じ評価を書き込み、
+ファイルサイズと代表的な読み取りの所要時間を比較する。
+
+    python -m benchmarks.evaluation_storage --rows 10000000
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+LAYOUTS = {
+    "rowid": ("""
+        CREATE TABLE evaluations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, skill_id)
+        )
+    """, "datetime('now', '-' || (n % 1000) || ' minutes')"),
+    "without_rowid": ("""
+        CREATE TABLE evaluations (
+            user_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL,
+            PRIMARY KEY (user_id, skill_id)
+        ) WITHOUT ROWID
+    """, "CAST(strftime('%s', 'now') AS INTEGER) - (n % 1000) * 60"),
+}
+
+QUERIES = {
+    # SkillMatrix の読み込みと同じ全件走査
+    "full_scan": ("SELECT user_id, skill_id, level FROM evaluations", None),
+    # レベルの集計（Python側に行を返さない走査）
+    "sum_levels": ("SELECT SUM(level) FROM evaluations", None),
+    # 1ユーザー分の取得（get_user_skill_summary 相当）×1000回
+    "user_lookup": ("SELECT skill_id, level FROM evaluations WHERE user_id = ?", 1000),
+}
+
+
+def populate(path: str, layout: str, rows: int, skills: int) -> float:
+    create_sql, timestamp = LAYOUTS[layout]
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(create_sql)
+    started = time.perf_counter()
+    conn.execute(f"""
+        WITH RECURSIVE seq(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM seq WHERE n + 1 < ?)
+        INSERT INTO evaluations (user_id, skill_id, level, created_at, updated_at)
+        SELECT n / ? + 1, n % ? + 1, abs(random()) % 5 + 1, {timestamp}, {timestamp} FROM seq
+    """, (rows, skills, skills))
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    return time.perf_counter() - started
+
+
+def measure(path: str, users: int) -> dict:
+    conn = sqlite3.connect(path)
+    results = {}
+    for name, (sql, repeat) in QUERIES.items():
+        started = time.perf_counter()
+        if repeat is None:
+            for _ in conn.execute(sql):
+                pass
+        else:
+            for i in range(repeat):
+                conn.execute(sql, (i * users // repeat + 1,)).fetchall()
+        results[name] = time.perf_counter() - started
+    conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--skills", type=int, default=100)
+    args = parser.parse_args()
+    users = args.rows // args.skills
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = {}
+        for layout in LAYOUTS:
+            path = os.path.join(directory, f"{layout}.db")
+            insert = populate(path, layout, args.rows, args.skills)
+            report[layout] = dict(size=os.path.getsize(path), insert=insert,
+                                  **measure(path, users))
+            os.remove(path)
+
+    print(f"{args.rows:,} evaluations ({users:,} users x {args.skills} skills)")
+    print(f"{'':16}" + "".join(f"{layout:>16}" for layout in report))
+    print(f"{'size (MiB)':16}" + "".join(f"{r['size'] / 2**20:16.1f}" for r in report.values()))
+    for key in ["insert"] + list(QUERIES):
+        print(f"{key + ' (s)':16}" + "".join(f"{r[key]:16.2f}" for r in report.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ setup(
     packages=find_packages(),
     install_requires=[
         "PyQt5>=5.15.11",
+        "numpy>=1.24",
+        "matplotlib>=3.8",
         "python-json-logger>=3.2.1",
         "pytest>=8.3.4",
         "pytest-cov>=6.0.0",
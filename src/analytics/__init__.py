@@ -0,0 +1,17 @@
+"""分析モジュール
+Created: 2026-10-17 14:02:11
+Author: GingaDza
+"""
+from .skill_matrix import (
+    SkillMatrix, MatrixSource, EVALUATIONS_SOURCE, USER_SKILLS_SOURCE, UNRATED
+)
+from .skill_gap import SkillGapReport
+
+__all__ = [
+    'SkillMatrix',
+    'MatrixSource',
+    'EVALUATIONS_SOURCE',
+    'USER_SKILLS_SOURCE',
+    'UNRATED',
+    'SkillGapReport'
+]
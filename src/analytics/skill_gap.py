@@ -0,0 +1,132 @@
+"""スキルギャップ分析エンジン
+Created: 2026-10-18 01:05:12
+Author: GingaDza
+
+skill_gap_settings の目標レベルに対する不足分を、ユーザー × 対象スキルの行列として
+1回で求め、ユーザー別・グループ別・組織全体の集計、ランキング、不足分の分布を導く。
+未評価（レベル0）のスキルは目標レベル全体を不足分とみなす。
+"""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+from .skill_matrix import SkillMatrix, mean_or_nan
+
+MAX_LEVEL = 5
+
+
+@dataclass(frozen=True)
+class SkillGapReport:
+    """目標レベルに対する不足分の集計結果
+
+    列は目標が設定されたスキルのみ（skill_ids の順）、行は matrix.user_ids の順。
+    """
+    user_ids: Tuple[int, ...]
+    skill_ids: Tuple[int, ...]
+    targets: np.ndarray        # スキルごとの目標レベル
+    averages: np.ndarray       # スキルごとの平均レベル（未評価は除外、値がなければ NaN）
+    shortfall: np.ndarray      # ユーザー × スキルの不足分
+    user_totals: np.ndarray    # ユーザーごとの不足分の合計
+    group_ids: Tuple[int, ...]
+    group_means: np.ndarray    # グループ × スキルの平均不足分
+    skill_means: np.ndarray    # スキルごとの組織全体の平均不足分
+    histograms: np.ndarray     # スキル × 不足分（0〜MAX_LEVEL）の人数
+
+    @classmethod
+    def from_matrix(cls, matrix: SkillMatrix, targets: Mapping[int, int],
+                    skill_ids: Optional[Iterable[int]] = None) -> "SkillGapReport":
+        """評価行列と目標レベル（スキルID → レベル）から集計する
+
+        Args:
+            skill_ids: 対象スキルの絞り込み（カテゴリー単位の表示など）
+        """
+        allowed = None if skill_ids is None else set(skill_ids)
+        targeted = [
+            (matrix.skill_index[skill_id], skill_id, level)
+            for skill_id, level in targets.items()
+            if level and skill_id in matrix.skill_index
+            and (allowed is None or skill_id in allowed)
+        ]
+        targeted.sort()
+        columns = np.array([column for column, _, _ in targeted], dtype=np.int64)
+        target_row = np.clip(np.array([level for _, _, level in targeted], dtype=np.int16),
+                             0, MAX_LEVEL)
+
+        # 範囲外のレベルは 0〜MAX_LEVEL に丸める（不足分が分布のビンをはみ出さないように）
+        levels = np.clip(matrix.levels[:, columns], 0, MAX_LEVEL)
+        shortfall = np.maximum(target_row - levels.astype(np.int16), 0)
+        user_count, skill_count = shortfall.shape
+
+        # グループ別：グループ番号ごとに1回で合計する
+        group_ids, group_sums, members = matrix.group_sums(shortfall)
+        group_means = group_sums / members[:, None]
+
+        # 不足分の分布：スキルごとにずらした値を1回の bincount で数える
+        bins = MAX_LEVEL + 1
+        offsets = np.arange(skill_count, dtype=np.int64) * bins
+        histograms = np.bincount(
+            (shortfall + offsets).ravel(), minlength=skill_count * bins
+        ).reshape(skill_count, bins)
+
+        return cls(
+            user_ids=tuple(matrix.user_ids),
+            skill_ids=tuple(skill_id for _, skill_id, _ in targeted),
+            targets=target_row,
+            averages=mean_or_nan(levels.sum(axis=0, dtype=np.int64), (levels > 0).sum(axis=0)),
+            shortfall=shortfall,
+            user_totals=shortfall.sum(axis=1, dtype=np.int64),
+            group_ids=tuple(int(group) for group in group_ids),
+            group_means=group_means,
+            skill_means=mean_or_nan(shortfall.sum(axis=0, dtype=np.int64),
+                                    np.full(skill_count, user_count)),
+            histograms=histograms,
+        )
+
+    @property
+    def org_mean(self) -> float:
+        """1ユーザー・1スキルあたりの平均不足分（対象がなければ NaN）"""
+        return float(self.shortfall.mean()) if self.shortfall.size else float("nan")
+
+    @property
+    def users_below_target(self) -> int:
+        """いずれかのスキルで目標に届いていないユーザー数"""
+        return int(np.count_nonzero(self.user_totals))
+
+    def user_gaps(self, user_id: int) -> Dict[int, int]:
+        """ユーザーの不足があるスキル → 不足分"""
+        row = self.shortfall[self._user_rows[user_id]]
+        return {self.skill_ids[i]: int(row[i]) for i in np.flatnonzero(row)}
+
+    def top_users(self, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """不足分の合計が大きい順のユーザー（不足のないユーザーは除く）"""
+        short = np.flatnonzero(self.user_totals)
+        order = short[np.argsort(-self.user_totals[short], kind="stable")][:limit]
+        return [(self.user_ids[i], int(self.user_totals[i])) for i in order]
+
+    def top_skills(self, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """組織全体の平均不足分が大きい順のスキル（不足のないスキルは除く）"""
+        short = np.flatnonzero(self.skill_means > 0)
+        order = short[np.argsort(-self.skill_means[short], kind="stable")][:limit]
+        return [(self.skill_ids[i], float(self.skill_means[i])) for i in order]
+
+    def top_groups(self, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """1スキルあたりの平均不足分が大きい順のグループ"""
+        if not self.group_ids or not self.skill_ids:
+            return []
+        scores = self.group_means.mean(axis=1)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [(self.group_ids[i], float(scores[i])) for i in order]
+
+    def shortfall_histogram(self, skill_id: Optional[int] = None) -> np.ndarray:
+        """不足分（0〜MAX_LEVEL）ごとの人数（skill_id 省略時は全対象スキルの合計）"""
+        if skill_id is None:
+            return self.histograms.sum(axis=0)
+        return self.histograms[self._skill_columns[skill_id]]
+
+    @cached_property
+    def _user_rows(self) -> Dict[int, int]:
+        return {user_id: i for i, user_id in enumerate(self.user_ids)}
+
+    @cached_property
+    def _skill_columns(self) -> Dict[int, int]:
+        return {skill_id: i for i, skill_id in enumerate(self.skill_ids)}
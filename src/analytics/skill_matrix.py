@@ -0,0 +1,317 @@
+"""スキルマトリックス演算エンジン
+Created: 2026-10-17 14:02:11
+Author: GingaDza
+
+ユーザー × スキルの評価を int8 の密行列として保持し、
+グループ平均・カテゴリー平均・ギャップ・ランキングをベクトル演算で求める。
+レベル 0 は未評価を表す。
+"""
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+
+UNRATED = 0
+NO_GROUP = -1
+LOAD_CHUNK_SIZE = 50000  # from_connection で一度に行列へ反映する評価の件数
+
+
+@dataclass(frozen=True)
+class MatrixSource:
+    """行列の読み込み元テーブル定義
+
+    各SQLは (id, name, group/category) と (user_id, skill_id, level) を返すこと。
+    """
+    users_sql: str
+    skills_sql: str
+    levels_sql: str
+
+
+# src.database の評価テーブル
+EVALUATIONS_SOURCE = MatrixSource(
+    users_sql="SELECT id, name, group_id FROM users ORDER BY id",
+    skills_sql="SELECT id, name, category_id FROM skills ORDER BY id",
+    levels_sql="SELECT user_id, skill_id, level FROM evaluations",
+)
+
+# skill_matrix_manager のスキーマ（カテゴリーは名称で保持）
+USER_SKILLS_SOURCE = MatrixSource(
+    users_sql="SELECT id, name, group_id FROM users ORDER BY id",
+    skills_sql="SELECT id, name, category FROM skills ORDER BY id",
+    levels_sql="SELECT user_id, skill_id, level FROM user_skills",
+)
+
+
+class SkillMatrix:
+    """ユーザー × スキルの評価行列"""
+
+    def __init__(self, users: Sequence[Tuple[int, str, Optional[int]]] = (),
+                 skills: Sequence[Tuple[int, str, Hashable]] = ()):
+        self.user_ids: List[int] = []
+        self.user_names: List[str] = []
+        self.skill_ids: List[int] = []
+        self.skill_names: List[str] = []
+        self.categories: List[Hashable] = []
+        self.user_index: Dict[int, int] = {}
+        self.skill_index: Dict[int, int] = {}
+        self._category_index: Dict[Hashable, int] = {}
+        # ID検索用の (昇順のID, 元の位置)。行・列の追加・削除で破棄する
+        self._sorted_ids: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._groups = np.empty(0, dtype=np.int64)           # ユーザー行ごとのグループID
+        self._skill_categories = np.empty(0, dtype=np.int64)  # スキル列ごとのカテゴリー番号
+        self.levels = np.zeros((0, 0), dtype=np.int8)
+        self.add_users(users)
+        self.add_skills(skills)
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection,
+                        source: MatrixSource = EVALUATIONS_SOURCE) -> "SkillMatrix":
+        """評価テーブル全体を1回のSELECTで読み込む
+
+        評価は LOAD_CHUNK_SIZE 件ずつ取り出して行列に反映するため、
+        全件のリストや中間配列は作らない。
+        """
+        matrix = cls(
+            [tuple(row) for row in conn.execute(source.users_sql)],
+            [tuple(row) for row in conn.execute(source.skills_sql)],
+        )
+        cursor = conn.execute(source.levels_sql)
+        while True:
+            rows = cursor.fetchmany(LOAD_CHUNK_SIZE)
+            if not rows:
+                break
+            chunk = np.array(rows, dtype=np.int64)
+            matrix.update_levels(chunk[:, 0], chunk[:, 1], chunk[:, 2])
+        return matrix
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.levels.shape
+
+    @property
+    def user_groups(self) -> np.ndarray:
+        """ユーザー行ごとのグループID（未所属は NO_GROUP、読み取り専用）"""
+        groups = self._groups.view()
+        groups.flags.writeable = False
+        return groups
+
+    # ---- 増分更新 ----
+
+    def add_users(self, users: Iterable[Tuple[int, str, Optional[int]]]) -> None:
+        """ユーザー行の追加（既存IDは名前とグループを更新）"""
+        new_groups = []
+        for user_id, name, group_id in users:
+            group = NO_GROUP if group_id is None else group_id
+            row = self.user_index.get(user_id)
+            if row is not None:
+                self.user_names[row] = name
+                self._groups[row] = group
+                continue
+            self.user_index[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+            self.user_names.append(name)
+            new_groups.append(group)
+        if new_groups:
+            self._sorted_ids.pop("users", None)
+            self._groups = np.concatenate([self._groups, np.array(new_groups, dtype=np.int64)])
+            self.levels = np.vstack([
+                self.levels, np.zeros((len(new_groups), self.levels.shape[1]), dtype=np.int8)
+            ])
+
+    def add_skills(self, skills: Iterable[Tuple[int, str, Hashable]]) -> None:
+        """スキル列の追加（既存IDは名前とカテゴリーを更新）"""
+        new_categories = []
+        for skill_id, name, category in skills:
+            code = self._category_code(category)
+            column = self.skill_index.get(skill_id)
+            if column is not None:
+                self.skill_names[column] = name
+                self._skill_categories[column] = code
+                continue
+            self.skill_index[skill_id] = len(self.skill_ids)
+            self.skill_ids.append(skill_id)
+            self.skill_names.append(name)
+            new_categories.append(code)
+        if new_categories:
+            self._sorted_ids.pop("skills", None)
+            self._skill_categories = np.concatenate([
+                self._skill_categories, np.array(new_categories, dtype=np.int64)
+            ])
+            self.levels = np.hstack([
+                self.levels, np.zeros((self.levels.shape[0], len(new_categories)), dtype=np.int8)
+            ])
+
+    def remove_user(self, user_id: int) -> None:
+        """ユーザー行の削除"""
+        row = self.user_index.pop(user_id)
+        del self.user_ids[row]
+        del self.user_names[row]
+        self._groups = np.delete(self._groups, row)
+        self.levels = np.delete(self.levels, row, axis=0)
+        self.user_index = {uid: i for i, uid in enumerate(self.user_ids)}
+        self._sorted_ids.pop("users", None)
+
+    def remove_skill(self, skill_id: int) -> None:
+        """スキル列の削除"""
+        column = self.skill_index.pop(skill_id)
+        del self.skill_ids[column]
+        del self.skill_names[column]
+        self._skill_categories = np.delete(self._skill_categories, column)
+        self.levels = np.delete(self.levels, column, axis=1)
+        self.skill_index = {sid: i for i, sid in enumerate(self.skill_ids)}
+        self._sorted_ids.pop("skills", None)
+
+    def set_level(self, user_id: int, skill_id: int, level: int) -> None:
+        """1件の評価を更新（0で未評価に戻す）"""
+        self.levels[self.user_index[user_id], self.skill_index[skill_id]] = level
+
+    def update_levels(self, user_ids: Sequence[int], skill_ids: Sequence[int],
+                      levels: Sequence[int]) -> None:
+        """複数件の評価を一括更新（行列にないユーザー・スキルは無視）
+
+        IDから行・列への変換は昇順のID配列に対する np.searchsorted で行う。
+        """
+        rows = self._positions("users", self.user_ids, user_ids)
+        columns = self._positions("skills", self.skill_ids, skill_ids)
+        known = (rows >= 0) & (columns >= 0)
+        self.levels[rows[known], columns[known]] = np.asarray(levels, dtype=np.int8)[known]
+
+    def set_user_levels(self, user_id: int, levels: Mapping[int, int]) -> None:
+        """1ユーザーの評価を一括更新"""
+        self.update_levels([user_id] * len(levels), list(levels), list(levels.values()))
+
+    # ---- 参照 ----
+
+    def user_levels(self, user_id: int) -> Dict[int, int]:
+        """ユーザーの評価済みスキル → レベル"""
+        row = self.levels[self.user_index[user_id]]
+        rated = np.flatnonzero(row)
+        return {self.skill_ids[i]: int(row[i]) for i in rated}
+
+    def group_user_ids(self, group_id: int) -> List[int]:
+        """グループに属するユーザーID"""
+        return [self.user_ids[i] for i in np.flatnonzero(self._groups == group_id)]
+
+    def category_skill_ids(self, category: Hashable) -> List[int]:
+        """カテゴリーに属するスキルID"""
+        code = self._category_index.get(category)
+        if code is None:
+            return []
+        return [self.skill_ids[i] for i in np.flatnonzero(self._skill_categories == code)]
+
+    # ---- 集計（いずれも未評価は平均から除外し、値がなければ NaN） ----
+
+    def skill_averages(self, user_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """スキルごとの平均レベル（列順は skill_ids）"""
+        levels = self._rows(user_ids)
+        return mean_or_nan(levels.sum(axis=0, dtype=np.int64), (levels > 0).sum(axis=0))
+
+    def group_sums(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ユーザー行ごとの値をグループ別に合計する（未所属のユーザーは除く）
+
+        行をグループ番号の位置に np.add.at で加算するため、
+        グループ × ユーザーの所属行列は作らない。
+
+        Args:
+            values (np.ndarray): ユーザー × 列の値（行順は user_ids）
+
+        Returns:
+            tuple: (グループID, グループ × 列の合計, グループごとの人数)
+        """
+        group_ids, codes = np.unique(self._groups, return_inverse=True)
+        codes = codes.ravel()
+        sums = np.zeros((len(group_ids),) + values.shape[1:], dtype=np.int64)
+        np.add.at(sums, codes, values)
+        members = np.bincount(codes, minlength=len(group_ids))
+        if len(group_ids) and group_ids[0] == NO_GROUP:
+            return group_ids[1:], sums[1:], members[1:]
+        return group_ids, sums, members
+
+    def group_averages(self) -> Dict[int, np.ndarray]:
+        """グループ → スキルごとの平均レベル"""
+        groups, sums, _ = self.group_sums(self.levels)
+        _, counts, _ = self.group_sums(self.levels > 0)
+        means = mean_or_nan(sums, counts)
+        return {int(group): means[i] for i, group in enumerate(groups)}
+
+    def category_means(self, user_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """ユーザー × カテゴリーの平均レベル（列順は categories）
+
+        列をカテゴリー順に並べ替え、np.add.reduceat でカテゴリーごとに
+        整数のまま合計する（スキルのないカテゴリーは NaN）。
+        """
+        levels = self._rows(user_ids)
+        sums = np.zeros((levels.shape[0], len(self.categories)), dtype=np.int64)
+        counts = np.zeros_like(sums)
+        if levels.shape[1]:
+            order = np.argsort(self._skill_categories, kind="stable")
+            codes, starts = np.unique(self._skill_categories[order], return_index=True)
+            ordered = levels[:, order]
+            sums[:, codes] = np.add.reduceat(ordered, starts, axis=1, dtype=np.int64)
+            counts[:, codes] = np.add.reduceat(ordered > 0, starts, axis=1, dtype=np.int64)
+        return mean_or_nan(sums, counts)
+
+    def category_averages(self, user_id: int) -> Dict[Hashable, float]:
+        """1ユーザーのカテゴリー → 平均レベル（評価がないカテゴリーは除く）"""
+        means = self.category_means([user_id])[0]
+        return {
+            category: float(means[i])
+            for i, category in enumerate(self.categories) if not np.isnan(means[i])
+        }
+
+    def gaps(self, targets: Mapping[int, int],
+             user_ids: Optional[Iterable[int]] = None) -> np.ndarray:
+        """目標レベルに対する不足分（ユーザー × スキル、目標のないスキルは0）"""
+        target_row = np.zeros(len(self.skill_ids), dtype=np.int16)
+        for skill_id, level in targets.items():
+            column = self.skill_index.get(skill_id)
+            if column is not None:
+                target_row[column] = level
+        return np.maximum(target_row - self._rows(user_ids).astype(np.int16), 0)
+
+    def rank_users(self, skill_ids: Optional[Iterable[int]] = None,
+                   user_ids: Optional[Iterable[int]] = None) -> List[Tuple[int, float]]:
+        """対象スキルの平均レベルでユーザーを降順に並べる（評価がないユーザーは除く）"""
+        rows = (np.arange(len(self.user_ids)) if user_ids is None
+                else np.array([self.user_index[u] for u in user_ids], dtype=np.int64))
+        columns = (slice(None) if skill_ids is None
+                   else np.array([self.skill_index[s] for s in skill_ids], dtype=np.int64))
+        levels = self.levels[rows][:, columns]
+        scores = mean_or_nan(levels.sum(axis=1, dtype=np.int64), (levels > 0).sum(axis=1))
+        rated = np.flatnonzero(~np.isnan(scores))
+        order = rated[np.argsort(-scores[rated], kind="stable")]
+        return [(self.user_ids[rows[i]], float(scores[i])) for i in order]
+
+    def _rows(self, user_ids: Optional[Iterable[int]]) -> np.ndarray:
+        if user_ids is None:
+            return self.levels
+        return self.levels[[self.user_index[u] for u in user_ids]]
+
+    def _category_code(self, category: Hashable) -> int:
+        code = self._category_index.get(category)
+        if code is None:
+            code = self._category_index[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def _positions(self, key: str, ids: List[int], query: Sequence[int]) -> np.ndarray:
+        """IDの並びを行・列の位置に変換する（見つからないIDは -1）"""
+        cached = self._sorted_ids.get(key)
+        if cached is None:
+            id_array = np.asarray(ids, dtype=np.int64)
+            order = np.argsort(id_array, kind="stable")
+            cached = self._sorted_ids[key] = (id_array[order], order)
+        sorted_ids, order = cached
+        query = np.asarray(query, dtype=np.int64).ravel()
+        if not len(sorted_ids):
+            return np.full(len(query), -1, dtype=np.int64)
+        found = np.minimum(np.searchsorted(sorted_ids, query), len(sorted_ids) - 1)
+        return np.where(sorted_ids[found] == query, order[found], -1)
+
+
+def mean_or_nan(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """0件の要素を NaN とした平均"""
+    sums = np.asarray(sums, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / counts, np.nan)
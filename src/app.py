@@ -7,11 +7,13 @@ import sys
 from PyQt5.QtWidgets import QApplication
 from .views.main_window import MainWindow
 from .utils.logger import setup_logger
+from .migrate import run_migrations
 
 def main():
     """アプリケーションのメインエントリーポイント"""
     logger = setup_logger(__name__)
     logger.info("アプリケーションを起動します")
+    run_migrations()
     
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # モダンなルック&フィールを適用
@@ -1,3 +1,8 @@
 from . import settings
+from .pragmas import apply_pragma_profile, get_active_profile_name, read_pragma_status
+from .schema import Schema, apply_schema, ensure_schema, get_schema
 
-__all__ = ['settings']
+__all__ = [
+    'settings', 'apply_pragma_profile', 'get_active_profile_name', 'read_pragma_status',
+    'Schema', 'apply_schema', 'ensure_schema', 'get_schema'
+]
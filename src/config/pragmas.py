@@ -0,0 +1,60 @@
+"""PRAGMAプロファイルの適用
+Created: 2026-10-17 10:02:18
+Author: GingaDza
+"""
+import sqlite3
+from typing import Any, Dict, Optional
+from . import settings
+
+# 適用順: busy_timeout を先に設定し、journal_mode 変更時のロック待ちに備える
+PRAGMA_ORDER = (
+    "busy_timeout",
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store"
+)
+
+SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+def get_active_profile_name() -> str:
+    """設定で選択されているプロファイル名を取得"""
+    return settings.DATABASE.get("pragma_profile", "desktop-safe")
+
+
+def get_pragma_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    """プロファイルの取得
+
+    Raises:
+        ValueError: 未定義のプロファイル名が指定された場合
+    """
+    name = name or get_active_profile_name()
+    try:
+        return settings.PRAGMA_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"未定義のPRAGMAプロファイルです: {name}") from None
+
+
+def apply_pragma_profile(conn: sqlite3.Connection, name: Optional[str] = None) -> str:
+    """接続にプロファイルを適用し、適用したプロファイル名を返す"""
+    name = name or get_active_profile_name()
+    profile = get_pragma_profile(name)
+    for pragma in PRAGMA_ORDER:
+        if pragma in profile:
+            # PRAGMAはパラメータバインド不可のため、設定値のみを埋め込む
+            conn.execute(f"PRAGMA {pragma} = {profile[pragma]}").fetchall()
+    return name
+
+
+def read_pragma_status(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """接続に現在適用されているPRAGMA値を取得"""
+    status = {
+        pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+        for pragma in PRAGMA_ORDER
+    }
+    status["synchronous"] = SYNCHRONOUS_NAMES.get(status["synchronous"], status["synchronous"])
+    status["temp_store"] = TEMP_STORE_NAMES.get(status["temp_store"], status["temp_store"])
+    return status
@@ -0,0 +1,31 @@
+"""skill_matrix_manager の参照系クエリ
+Created: 2026-10-18 10:02:37
+Author: GingaDza
+
+skill_matrix_manager（user_skills 系統）の DatabaseManager が発行するSQL。
+skill_matrix_manager は src をインポートルートとするため src パッケージからは
+インポートできない。インデックス監査（src.database.index_audit）と共有するためここに置く。
+"""
+
+SELECT_GROUPS_SQL = "SELECT id, name FROM groups ORDER BY name"
+
+SELECT_GROUP_MEMBERS_SQL = "SELECT id, name FROM users WHERE group_id = ? ORDER BY name"
+
+COUNT_GROUP_MEMBERS_SQL = "SELECT COUNT(*) FROM users WHERE group_id = ?"
+
+# スキル × レベルごとの人数（グループ統計）
+SELECT_GROUP_LEVEL_COUNTS_SQL = """
+    SELECT s.id, s.name, us.level, COUNT(*)
+    FROM users u
+    JOIN user_skills us ON us.user_id = u.id
+    JOIN skills s ON s.id = us.skill_id
+    WHERE u.group_id = ? AND us.level > 0
+    GROUP BY s.id, us.level
+    ORDER BY s.id, us.level
+"""
+
+SELECT_SKILL_GAP_SETTINGS_SQL = "SELECT skill_id, target_level FROM skill_gap_settings"
+
+SELECT_CATEGORY_SKILL_GAP_SETTINGS_SQL = (
+    "SELECT skill_id, target_level FROM skill_gap_settings WHERE category_id = ?"
+)
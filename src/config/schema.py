@@ -0,0 +1,225 @@
+"""テーブル定義のレジストリ
+Created: 2026-10-17 23:12:40
+Author: GingaDza
+
+各マネージャーが個別に持っていたDDLを系統ごとに1つのスキーマにまとめる。
+作成済みかどうかは PRAGMA user_version で判定し、一致していればDDLは実行しない。
+ベースラインのテーブルはここでのみ定義し、マイグレーションは既存のデータベースの変換のみを行う。
+バージョンを上げると既存のデータベースでも再実行されるため、各文は冪等であること。
+古い形で作成済みのテーブルは upgrades（schema_upgrades）で定義に合わせてから DDL を実行する。
+
+評価テーブル（evaluations, user_skills）は (user_id, skill_id) を主キーとする
+WITHOUT ROWID テーブルで、日時はUNIXエポック秒（UTC）の整数で保持する。
+"""
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from .schema_upgrades import (
+    add_employee_ids, add_skill_names, compact_evaluations, compact_user_skills
+)
+
+
+@dataclass(frozen=True)
+class Schema:
+    """1系統のテーブル定義
+
+    version は PRAGMA user_version に記録する値。別系統のスキーマを作成済みの
+    データベースを誤って最新と判定しないよう、スキーマ間で重複させない。
+    """
+    name: str
+    version: int
+    statements: Tuple[str, ...]  # 作成順の CREATE ... IF NOT EXISTS
+    upgrades: Tuple[Callable[[sqlite3.Cursor], None], ...] = ()  # DDL の前に実行する変換
+
+
+# src.database のマネージャー（GroupManager, UserManager, CategoryManager, EvaluationManager）
+EVALUATIONS = Schema("evaluations", 106, (
+    """
+    CREATE TABLE IF NOT EXISTS groups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL UNIQUE,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        parent_id INTEGER,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (parent_id) REFERENCES categories (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        employee_id TEXT UNIQUE,
+        name TEXT NOT NULL,
+        group_id INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES groups (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_id INTEGER,
+        name TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS evaluations (
+        user_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        level INTEGER NOT NULL CHECK (level >= 1 AND level <= 5),
+        created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        PRIMARY KEY (user_id, skill_id),
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (skill_id) REFERENCES skills (id)
+    ) WITHOUT ROWID
+    """,
+    # 参照系クエリ用のセカンダリインデックス（index_audit で検証）
+    "CREATE INDEX IF NOT EXISTS idx_users_group_id ON users (group_id, name)",
+    "CREATE INDEX IF NOT EXISTS idx_skills_category_id ON skills (category_id, name)",
+    "CREATE INDEX IF NOT EXISTS idx_skills_name ON skills (name, category_id)",
+    "CREATE INDEX IF NOT EXISTS idx_evaluations_skill_id ON evaluations (skill_id, user_id, level)",
+    "CREATE INDEX IF NOT EXISTS idx_categories_parent_id ON categories (parent_id)",
+), upgrades=(add_skill_names, add_employee_ids, compact_evaluations))
+
+# skill_matrix_manager の DatabaseManager（マイグレーションを実行しないため、
+# rowid の user_skills は upgrades で変換する）
+USER_SKILLS = Schema("user_skills", 205, (
+    """
+    CREATE TABLE IF NOT EXISTS groups (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        group_id INTEGER,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (group_id) REFERENCES groups (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        category TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_skills (
+        user_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        level INTEGER DEFAULT 0,
+        created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        PRIMARY KEY (user_id, skill_id),
+        FOREIGN KEY (user_id) REFERENCES users (id),
+        FOREIGN KEY (skill_id) REFERENCES skills (id)
+    ) WITHOUT ROWID
+    """,
+    # 参照系クエリ用のセカンダリインデックス（index_audit で検証）
+    "CREATE INDEX IF NOT EXISTS idx_users_group_id ON users (group_id, name)",
+    "CREATE INDEX IF NOT EXISTS idx_user_skills_skill_id ON user_skills (skill_id, user_id, level)",
+    """
+    CREATE TABLE IF NOT EXISTS skill_gap_settings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_id INTEGER,
+        skill_id INTEGER,
+        target_level INTEGER,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories (id),
+        FOREIGN KEY (skill_id) REFERENCES skills (id)
+    )
+    """,
+    # 一意キー追加前（version 202 以前）に蓄積した重複行の削除（新規作成時は0件）。
+    # skill_matrix_manager はマイグレーションを実行しないため、ここで一意化する
+    """
+    DELETE FROM skill_gap_settings
+    WHERE id NOT IN (
+        SELECT MAX(id) FROM skill_gap_settings GROUP BY category_id, skill_id
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_skill_gap_settings_key
+    ON skill_gap_settings (category_id, skill_id)
+    """,
+    # 一意インデックスが WHERE category_id = ? も兼ねる
+    "DROP INDEX IF EXISTS idx_skill_gap_settings_category_id",
+), upgrades=(compact_user_skills,))
+
+SCHEMAS: Dict[str, Schema] = {schema.name: schema for schema in (EVALUATIONS, USER_SKILLS)}
+
+
+def get_schema(name: str) -> Schema:
+    """スキーマの取得
+
+    Raises:
+        ValueError: 未定義のスキーマ名が指定された場合
+    """
+    try:
+        return SCHEMAS[name]
+    except KeyError:
+        raise ValueError(f"未定義のスキーマです: {name}") from None
+
+
+def detect_schema(conn: sqlite3.Connection) -> Optional[str]:
+    """PRAGMA user_version からスキーマ名を判定（未作成・不明なら None）"""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for schema in SCHEMAS.values():
+        if schema.version == version:
+            return schema.name
+    return None
+
+
+def apply_schema(cursor: sqlite3.Cursor, name: str) -> None:
+    """変換・DDLの実行と user_version の記録（トランザクションは呼び出し側で管理）"""
+    schema = get_schema(name)
+    for upgrade in schema.upgrades:
+        upgrade(cursor)
+    for statement in schema.statements:
+        cursor.execute(statement)
+    # PRAGMAはパラメータバインド不可のため、定義済みの整数のみを埋め込む
+    cursor.execute(f"PRAGMA user_version = {int(schema.version)}")
+
+
+def ensure_schema(conn: sqlite3.Connection, name: str) -> bool:
+    """スキーマが未作成または古ければ1トランザクションで作成・変換する
+
+    Returns:
+        bool: DDLを実行したかどうか（user_version が一致していれば False）
+    """
+    schema = get_schema(name)
+    if conn.execute("PRAGMA user_version").fetchone()[0] == schema.version:
+        return False
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 書き込みロック取得後に読み直す（他の接続が先に作成した場合）
+        if conn.execute("PRAGMA user_version").fetchone()[0] == schema.version:
+            conn.commit()
+            return False
+        apply_schema(conn.cursor(), name)
+        conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    return True
@@ -0,0 +1,105 @@
+"""既存テーブルの変換
+Created: 2026-10-18 09:10:24
+Author: GingaDza
+
+スキーマレジストリの定義より古い形で作成済みのテーブルを、定義に合わせて変換する。
+ensure_schema（user_version の更新時）と同じ内容のマイグレーションの両方から呼ばれるため、
+いずれも冪等で、対象のテーブルがなければ何もしないこと。
+cursor.execute のみを使う（呼び出し側のトランザクションを分割しない）。
+"""
+
+EPOCH_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# WITHOUT ROWID 化する評価テーブル → (レベルの制約, 再作成するインデックス)
+COMPACT_TABLES = {
+    "evaluations": ("NOT NULL CHECK (level >= 1 AND level <= 5)",
+                    ("idx_evaluations_skill_id", ("skill_id", "user_id", "level"))),
+    "user_skills": ("DEFAULT 0",
+                    ("idx_user_skills_skill_id", ("skill_id", "user_id", "level"))),
+}
+
+_COMPACT_SQL = """
+CREATE TABLE {name} (
+    user_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    level INTEGER {level},
+    created_at INTEGER NOT NULL DEFAULT ({now}),
+    updated_at INTEGER NOT NULL DEFAULT ({now}),
+    PRIMARY KEY (user_id, skill_id),
+    FOREIGN KEY (user_id) REFERENCES users (id),
+    FOREIGN KEY (skill_id) REFERENCES skills (id)
+) WITHOUT ROWID
+"""
+
+
+def table_columns(cursor, table):
+    """テーブルのカラム名一覧（テーブルがなければ空）"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
+
+def add_skill_names(cursor):
+    """初期マイグレーションが作成した name のない skills テーブルへの列追加"""
+    columns = table_columns(cursor, "skills")
+    if columns and "name" not in columns:
+        cursor.execute("ALTER TABLE skills ADD COLUMN name TEXT")
+
+
+def add_employee_ids(cursor):
+    """employee_id のない users テーブルへの列と一意インデックスの追加
+
+    ALTER TABLE では UNIQUE 制約付きの列を追加できないため、一意性はインデックスで保証する。
+    """
+    columns = table_columns(cursor, "users")
+    if columns and "employee_id" not in columns:
+        cursor.execute("ALTER TABLE users ADD COLUMN employee_id TEXT")
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_employee_id ON users (employee_id)"
+        )
+
+
+def is_compact(cursor, table):
+    """テーブルが WITHOUT ROWID かどうか"""
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return "WITHOUT ROWID" in cursor.fetchone()[0].upper()
+
+
+def _epoch(column):
+    """文字列の日時をエポック秒に変換する式（整数はそのまま、不明な値は現在時刻）"""
+    return (f"COALESCE(CASE WHEN typeof({column}) = 'integer' THEN {column}"
+            f" ELSE CAST(strftime('%s', {column}) AS INTEGER) END, {EPOCH_NOW})")
+
+
+def compact_evaluation_table(cursor, table):
+    """rowid の評価テーブルを (user_id, skill_id) 主キーの WITHOUT ROWID テーブルに作り直す
+
+    文字列の日時はエポック秒に変換し、主キーの重複は後から書き込まれた行を残す。
+    """
+    columns = table_columns(cursor, table)
+    if not columns or is_compact(cursor, table):
+        return
+    level, (index_name, index_columns) = COMPACT_TABLES[table]
+    updated = "updated_at" if "updated_at" in columns else "NULL"
+    created = "created_at" if "created_at" in columns else updated
+    cursor.execute(_COMPACT_SQL.format(name=f"{table}_compact", level=level, now=EPOCH_NOW))
+    cursor.execute(f"""
+        INSERT OR REPLACE INTO {table}_compact
+            (user_id, skill_id, level, created_at, updated_at)
+        SELECT user_id, skill_id, level, {_epoch(created)}, {_epoch(updated)}
+        FROM {table}
+        WHERE user_id IS NOT NULL AND skill_id IS NOT NULL
+        ORDER BY rowid
+    """)
+    cursor.execute(f"DROP TABLE {table}")
+    cursor.execute(f"ALTER TABLE {table}_compact RENAME TO {table}")
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({', '.join(index_columns)})"
+    )
+
+
+def compact_evaluations(cursor):
+    compact_evaluation_table(cursor, "evaluations")
+
+
+def compact_user_skills(cursor):
+    compact_evaluation_table(cursor, "user_skills")
@@ -14,7 +14,62 @@ DATABASE = {
     "name": "skill_matrix.db",
     "version": "1.0.0",
     "created_at": "2025-02-08 13:52:49",
-    "created_by": "GingaDza"
+    "created_by": "GingaDza",
+    "pragma_profile": "desktop-safe"  # PRAGMA_PROFILES のキー
+}
+
+# PRAGMAプロファイル（接続作成時に適用）
+# cache_size は負値でKiB指定、mmap_size はバイト指定
+PRAGMA_PROFILES = {
+    # 通常のデスクトップ利用: WALでコミット時のfsyncを1回に抑えつつ耐久性を維持
+    "desktop-safe": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16384,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY"
+    },
+    # 大量インポート: fsyncを省略して書き込みを優先（電源断に弱いため取り込み時のみ使用）
+    "bulk-load": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY"
+    },
+    # 集計・分析: 大きなページキャッシュとmmapで読み取りを優先
+    "read-heavy-analytics": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -131072,
+        "mmap_size": 1024 * 1024 * 1024,
+        "temp_store": "MEMORY"
+    }
+}
+
+# コネクションプール設定
+CONNECTION_POOL = {
+    "size": 5,                      # 1データベースあたりの最大接続数
+    "timeout": 5.0,                 # 空き接続待ちのタイムアウト（秒）
+    "health_check_interval": 30.0   # この秒数以上アイドルだった接続は再利用前に検査
+}
+
+# 遅延生成タブ設定
+LAZY_TABS = {
+    "evict_after_ms": 5 * 60 * 1000  # 非表示のまま経過したらタブの中身を破棄（None で無効）
+}
+
+# スキルレベル編集の書き込み設定
+SKILL_EDITS = {
+    "flush_delay_ms": 400  # 最後の編集からこの時間が経過したらまとめて書き込む
+}
+
+# レーダーチャート設定
+RADAR_CHART = {
+    "backend": "native"  # "native"（QPainter）または "matplotlib"
 }
 
 # ログ設定
@@ -0,0 +1,41 @@
+"""データ入出力モジュール
+Created: 2026-10-17 19:10:45
+Author: GingaDza
+"""
+from .chunks import iter_chunks
+from .radar_pdf import (
+    RadarChartSpec, PageLayout, charts_from_matrix, export_radar_pdf,
+    export_matrix_radar_pdf
+)
+from .csv_import import (
+    ImportSchema, ImportProgress, ImportResult, EVALUATIONS_SCHEMA, USER_SKILLS_SCHEMA,
+    import_skill_levels_csv
+)
+from .csv_export import (
+    ExportSchema, EVALUATIONS_EXPORT, USER_SKILLS_EXPORT, iter_pivot_rows, export_skill_matrix_csv,
+    export_skill_levels_csv
+)
+from .xlsx_writer import XlsxWriter, export_skill_matrix_xlsx
+
+__all__ = [
+    'iter_chunks',
+    'RadarChartSpec',
+    'PageLayout',
+    'charts_from_matrix',
+    'export_radar_pdf',
+    'export_matrix_radar_pdf',
+    'ImportSchema',
+    'ImportProgress',
+    'ImportResult',
+    'EVALUATIONS_SCHEMA',
+    'USER_SKILLS_SCHEMA',
+    'import_skill_levels_csv',
+    'ExportSchema',
+    'EVALUATIONS_EXPORT',
+    'USER_SKILLS_EXPORT',
+    'iter_pivot_rows',
+    'export_skill_matrix_csv',
+    'export_skill_levels_csv',
+    'XlsxWriter',
+    'export_skill_matrix_xlsx'
+]
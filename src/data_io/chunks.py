@@ -0,0 +1,22 @@
+"""イテラブルのチャンク分割
+Created: 2026-10-18 11:40:12
+Author: GingaDza
+
+標準ライブラリのみに依存するため、src パッケージ・skill_matrix_manager のどちらからでも利用できる。
+"""
+from itertools import islice
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar('T')
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """イテラブルを一定件数ごとのリストに分割（全件をメモリに載せない）"""
+    if size < 1:
+        raise ValueError(f"チャンクサイズは1以上を指定してください: {size}")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,157 @@
+"""スキルマトリックスのCSV出力
+Created: 2026-10-17 21:20:03
+Author: GingaDza
+
+ユーザーを行、スキルを列としたピボット形式で出力する。評価はユーザーID順の
+カーソルから1ユーザー分ずつ読み、その場で1行に展開して書き込むため、
+保持するのはスキル列の対応表と出力中の1行のみ。
+取り込みと同じ縦持ち形式（1評価1行）の出力も提供する。
+"""
+import csv
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional
+
+FIXED_COLUMNS = ["group", "user"]
+RECORD_COLUMNS = FIXED_COLUMNS + ["category", "skill", "level"]  # 取り込みの見出しと同じ
+WRITE_BUFFER_SIZE = 1024 * 1024
+PROGRESS_INTERVAL = 1000  # 進捗を通知するユーザー数の間隔
+
+ProgressCallback = Callable[[int, int], None]  # (出力済みユーザー数, 総数)
+
+
+@dataclass(frozen=True)
+class ExportSchema:
+    """出力元テーブル定義
+
+    skills_sql は列順に並べた (id, name, カテゴリー名)、levels_sql はユーザーID順に
+    並べた (user_id, グループ名, ユーザー名, skill_id, level) を返すこと
+    （評価のないユーザーは skill_id を NULL とした1行）。
+    records_sql は評価済みの (user_id, グループ名, ユーザー名, カテゴリー名, スキル名, level)
+    をユーザーID順に返すこと。
+    """
+    skills_sql: str
+    levels_sql: str
+    records_sql: str
+    count_sql: str = "SELECT COUNT(*) FROM users"
+
+
+# src.database のテーブル
+EVALUATIONS_EXPORT = ExportSchema(
+    skills_sql="""
+        SELECT s.id, s.name, c.name FROM skills s
+        LEFT JOIN categories c ON c.id = s.category_id
+        ORDER BY c.name, s.name, s.id
+    """,
+    levels_sql="""
+        SELECT u.id, g.name, u.name, e.skill_id, e.level FROM users u
+        LEFT JOIN groups g ON g.id = u.group_id
+        LEFT JOIN evaluations e ON e.user_id = u.id
+        ORDER BY u.id
+    """,
+    records_sql="""
+        SELECT u.id, g.name, u.name, c.name, s.name, e.level FROM users u
+        JOIN evaluations e ON e.user_id = u.id
+        JOIN skills s ON s.id = e.skill_id
+        LEFT JOIN groups g ON g.id = u.group_id
+        LEFT JOIN categories c ON c.id = s.category_id
+        ORDER BY u.id, c.name, s.name
+    """,
+)
+
+# skill_matrix_manager のテーブル
+USER_SKILLS_EXPORT = ExportSchema(
+    skills_sql="SELECT id, name, category FROM skills ORDER BY category, name, id",
+    levels_sql="""
+        SELECT u.id, g.name, u.name, us.skill_id, us.level FROM users u
+        LEFT JOIN groups g ON g.id = u.group_id
+        LEFT JOIN user_skills us ON us.user_id = u.id AND us.level > 0
+        ORDER BY u.id
+    """,
+    records_sql="""
+        SELECT u.id, g.name, u.name, s.category, s.name, us.level FROM users u
+        JOIN user_skills us ON us.user_id = u.id AND us.level > 0
+        JOIN skills s ON s.id = us.skill_id
+        LEFT JOIN groups g ON g.id = u.group_id
+        ORDER BY u.id, s.category, s.name
+    """,
+)
+
+
+def iter_pivot_rows(conn: sqlite3.Connection,
+                    schema: ExportSchema = EVALUATIONS_EXPORT) -> Iterator[List]:
+    """見出し行に続けてユーザーごとの行を返すジェネレーター
+
+    未評価のセルは空文字。スキル名が重複する場合は「カテゴリー/スキル」を見出しにする。
+    """
+    skills = conn.execute(schema.skills_sql).fetchall()
+    columns: Dict[int, int] = {skill_id: i for i, (skill_id, _, _) in enumerate(skills)}
+    counts = Counter(name for _, name, _ in skills)
+    yield FIXED_COLUMNS + [
+        f"{category}/{name}" if counts[name] > 1 else name
+        for _, name, category in skills
+    ]
+
+    width = len(skills)
+    cursor = conn.execute(schema.levels_sql)
+    for _, user_rows in groupby(cursor, key=itemgetter(0)):
+        cells = [""] * width
+        for _, group, user, skill_id, level in user_rows:
+            column = columns.get(skill_id)
+            if column is not None:
+                cells[column] = level
+        yield [group or "", user] + cells
+
+
+def export_skill_matrix_csv(conn: sqlite3.Connection, file_path: str,
+                            schema: ExportSchema = EVALUATIONS_EXPORT,
+                            progress: Optional[ProgressCallback] = None) -> int:
+    """スキルマトリックスをCSVに出力
+
+    Returns:
+        int: 出力したユーザー数
+    """
+    total = conn.execute(schema.count_sql).fetchone()[0]
+    rows = iter_pivot_rows(conn, schema)
+    written = 0
+    with open(file_path, "w", encoding="utf-8-sig", newline="",
+              buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(next(rows))
+        for row in rows:
+            writer.writerow(row)
+            written += 1
+            if progress and written % PROGRESS_INTERVAL == 0:
+                progress(written, total)
+    if progress:
+        progress(written, total)
+    return written
+
+
+def export_skill_levels_csv(conn: sqlite3.Connection, file_path: str,
+                            schema: ExportSchema = EVALUATIONS_EXPORT,
+                            progress: Optional[ProgressCallback] = None) -> int:
+    """評価を取り込みと同じ縦持ち形式（group, user, category, skill, level）のCSVに出力
+
+    Returns:
+        int: 出力した評価の件数
+    """
+    total = conn.execute(schema.count_sql).fetchone()[0]
+    written = users = 0
+    with open(file_path, "w", encoding="utf-8-sig", newline="",
+              buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(RECORD_COLUMNS)
+        for _, user_rows in groupby(conn.execute(schema.records_sql), key=itemgetter(0)):
+            for _, group, user, category, skill, level in user_rows:
+                writer.writerow([group or "", user, category or "", skill, level])
+                written += 1
+            users += 1
+            if progress and users % PROGRESS_INTERVAL == 0:
+                progress(users, total)
+    if progress:
+        progress(total, total)
+    return written
@@ -0,0 +1,290 @@
+"""スキルレベルCSVのストリーミング取り込み
+Created: 2026-10-17 20:15:36
+Author: GingaDza
+
+CSVを1行ずつ読み、グループ・カテゴリー・スキル・ユーザーの名称を
+取り込み開始時に読み込んだ対応表で解決して、チャンク単位の executemany で
+書き込む。保持するのは対応表と1チャンク分の行のみ。
+
+接続は呼び出し側が用意する（取り込み用のPRAGMAプロファイルの適用も呼び出し側）。
+"""
+import csv
+import io
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+DEFAULT_IMPORT_CHUNK_SIZE = 10000
+LEVELS = {str(level): level for level in range(1, 6)}
+
+# 列名 → 見出しの候補（英語・日本語どちらの見出しも受け付ける）
+COLUMN_ALIASES = {
+    "group": ("group", "グループ"),
+    "user": ("user", "ユーザー", "氏名"),
+    "category": ("category", "カテゴリー"),
+    "skill": ("skill", "スキル"),
+    "level": ("level", "レベル"),
+}
+
+
+@dataclass(frozen=True)
+class ImportSchema:
+    """取り込み先テーブル定義
+
+    categories_sql が None の場合、カテゴリーは skills に名称で保持する。
+    skills_sql は (id, カテゴリー, name)、users_sql は (id, group_id, name) を返すこと。
+    upsert_level_sql は再取り込みで値が変わらない行を書き換えない（updated_at を維持する）。
+    """
+    groups_sql: str
+    insert_group_sql: str
+    categories_sql: Optional[str]
+    insert_category_sql: Optional[str]
+    skills_sql: str
+    insert_skill_sql: str
+    users_sql: str
+    insert_user_sql: str
+    upsert_level_sql: str
+
+
+# src.database のテーブル
+EVALUATIONS_SCHEMA = ImportSchema(
+    groups_sql="SELECT id, name FROM groups",
+    insert_group_sql="INSERT INTO groups (name) VALUES (?)",
+    # 同名カテゴリーは先に作成されたものを使う
+    categories_sql="SELECT id, name FROM categories ORDER BY id DESC",
+    insert_category_sql="INSERT INTO categories (name) VALUES (?)",
+    skills_sql="SELECT id, category_id, name FROM skills ORDER BY id DESC",
+    insert_skill_sql="INSERT INTO skills (category_id, name) VALUES (?, ?)",
+    users_sql="SELECT id, group_id, name FROM users ORDER BY id DESC",
+    insert_user_sql="INSERT INTO users (group_id, name) VALUES (?, ?)",
+    upsert_level_sql="""
+        INSERT INTO evaluations (user_id, skill_id, level)
+        VALUES (?, ?, ?)
+        ON CONFLICT(user_id, skill_id)
+        DO UPDATE SET level = excluded.level, updated_at = CAST(strftime('%s', 'now') AS INTEGER)
+        WHERE level != excluded.level
+    """,
+)
+
+# skill_matrix_manager のテーブル
+USER_SKILLS_SCHEMA = ImportSchema(
+    groups_sql="SELECT id, name FROM groups",
+    insert_group_sql="INSERT INTO groups (name) VALUES (?)",
+    categories_sql=None,
+    insert_category_sql=None,
+    skills_sql="SELECT id, category, name FROM skills ORDER BY id DESC",
+    insert_skill_sql="INSERT INTO skills (category, name) VALUES (?, ?)",
+    users_sql="SELECT id, group_id, name FROM users ORDER BY id DESC",
+    insert_user_sql="INSERT INTO users (group_id, name) VALUES (?, ?)",
+    upsert_level_sql="""
+        INSERT INTO user_skills (user_id, skill_id, level)
+        VALUES (?, ?, ?)
+        ON CONFLICT(user_id, skill_id)
+        DO UPDATE SET level = excluded.level, updated_at = CAST(strftime('%s', 'now') AS INTEGER)
+        WHERE level != excluded.level
+    """,
+)
+
+
+@dataclass
+class ImportProgress:
+    """取り込みの進捗"""
+    rows: int = 0             # 読み込んだ行数
+    bytes_read: int = 0
+    total_bytes: int = 0
+    elapsed: float = 0.0      # 秒
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def percent(self) -> int:
+        if not self.total_bytes:
+            return 0
+        return min(100, self.bytes_read * 100 // self.total_bytes)
+
+
+@dataclass
+class ImportResult:
+    """取り込み結果"""
+    rows: int = 0
+    imported: int = 0         # 取り込んだ評価の件数（変更なしを含む）
+    skipped: int = 0          # 名前なし・レベル不正の行
+    created: Dict[str, int] = field(
+        default_factory=lambda: {"groups": 0, "categories": 0, "skills": 0, "users": 0}
+    )
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[ImportProgress], None]
+
+
+class _NameMaps:
+    """名称 → ID の対応表（未登録の名称はその場で作成する）"""
+
+    def __init__(self, conn: sqlite3.Connection, schema: ImportSchema, result: ImportResult):
+        self.conn = conn
+        self.schema = schema
+        self.result = result
+        self.groups: Dict[str, int] = {name: id_ for id_, name in conn.execute(schema.groups_sql)}
+        self.categories: Dict[str, int] = (
+            {name: id_ for id_, name in conn.execute(schema.categories_sql)}
+            if schema.categories_sql else {}
+        )
+        self.skills: Dict[Tuple[Hashable, str], int] = {
+            (category, name): id_ for id_, category, name in conn.execute(schema.skills_sql)
+        }
+        self.users: Dict[Tuple[Optional[int], str], int] = {
+            (group_id, name): id_ for id_, group_id, name in conn.execute(schema.users_sql)
+        }
+
+    def group_id(self, name: str) -> Optional[int]:
+        if not name:
+            return None
+        group_id = self.groups.get(name)
+        if group_id is None:
+            group_id = self.groups[name] = self._insert(self.schema.insert_group_sql, name)
+            self.result.created["groups"] += 1
+        return group_id
+
+    def user_id(self, group_name: str, name: str) -> int:
+        key = (self.group_id(group_name), name)
+        user_id = self.users.get(key)
+        if user_id is None:
+            user_id = self.users[key] = self._insert(self.schema.insert_user_sql, *key)
+            self.result.created["users"] += 1
+        return user_id
+
+    def skill_id(self, category_name: str, name: str) -> int:
+        category = self._category(category_name)
+        key = (category, name)
+        skill_id = self.skills.get(key)
+        if skill_id is None:
+            skill_id = self.skills[key] = self._insert(self.schema.insert_skill_sql, *key)
+            self.result.created["skills"] += 1
+        return skill_id
+
+    def _category(self, name: str) -> Hashable:
+        if self.schema.categories_sql is None:
+            return name
+        category_id = self.categories.get(name)
+        if category_id is None:
+            category_id = self.categories[name] = self._insert(
+                self.schema.insert_category_sql, name
+            )
+            self.result.created["categories"] += 1
+        return category_id
+
+    def _insert(self, sql: str, *params) -> int:
+        return self.conn.execute(sql, params).lastrowid
+
+
+def import_skill_levels_csv(conn: sqlite3.Connection, file_path: str,
+                            schema: ImportSchema = EVALUATIONS_SCHEMA,
+                            chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+                            progress: Optional[ProgressCallback] = None,
+                            levels: Optional[bool] = None) -> ImportResult:
+    """スキルレベルCSVの取り込み
+
+    見出しは group, user, category, skill, level（日本語見出しも可）。
+    level 列がない場合はグループとユーザーのみ登録する。
+    1チャンク = 1トランザクションで、チャンクごとに progress を呼ぶ。
+
+    Args:
+        levels (bool, optional): True の場合は level 列を必須とし、False の場合は
+            level 列があってもグループとユーザーのみ登録する（None は列の有無で判断）
+
+    Raises:
+        ValueError: 必須の列（user、level を取り込む場合は category と skill）がない場合
+    """
+    result = ImportResult()
+    started = time.monotonic()
+    total_bytes = os.path.getsize(file_path)
+    with open(file_path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        reader = csv.reader(text)
+        columns = _column_indexes(next(reader, []), levels)
+        maps = _NameMaps(conn, schema, result)
+        # 行ごとの処理は名称の組 → ID の辞書引きのみ（未登録の組だけ _NameMaps で解決）
+        user_ids: Dict[Tuple[str, str], int] = {}
+        skill_ids: Dict[Tuple[str, str], int] = {}
+        group_col, user_col = columns["group"], columns["user"]
+        category_col, skill_col, level_col = columns["category"], columns["skill"], columns["level"]
+        rows: List[Tuple[int, int, int]] = []  # 書き込み待ちの (user_id, skill_id, level)
+        read_in_chunk = 0
+        try:
+            for row in reader:
+                read_in_chunk += 1
+                try:
+                    user = row[user_col].strip()
+                    group = row[group_col].strip() if group_col is not None else ""
+                    if level_col is not None:
+                        level = LEVELS.get(row[level_col].strip())
+                        skill_key = (row[category_col].strip(), row[skill_col].strip())
+                except IndexError:
+                    user = ""
+                if not user or (level_col is not None and (level is None or not skill_key[1])):
+                    result.skipped += 1
+                else:
+                    user_id = user_ids.get((group, user))
+                    if user_id is None:
+                        user_id = user_ids[(group, user)] = maps.user_id(group, user)
+                    if level_col is not None:
+                        skill_id = skill_ids.get(skill_key)
+                        if skill_id is None:
+                            skill_id = skill_ids[skill_key] = maps.skill_id(*skill_key)
+                        rows.append((user_id, skill_id, level))
+                if read_in_chunk >= chunk_size:
+                    result.rows += read_in_chunk
+                    _flush(conn, schema, rows, result)
+                    rows, read_in_chunk = [], 0
+                    _report(progress, result, raw.tell(), total_bytes, started)
+            result.rows += read_in_chunk
+            _flush(conn, schema, rows, result)
+        except sqlite3.Error:
+            # コミット済みのチャンクは残し、書き込み中のチャンクのみ取り消す
+            conn.rollback()
+            raise
+        _report(progress, result, total_bytes, total_bytes, started)
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def _column_indexes(header: List[str], levels: Optional[bool] = None) -> Dict[str, Optional[int]]:
+    """見出し行から列番号を求める"""
+    names = [name.strip().lower() for name in header]
+    indexes = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        indexes[column] = next((names.index(a) for a in aliases if a in names), None)
+    if levels is False:
+        indexes["level"] = None
+    required = ["user"] + (["category", "skill"] if indexes["level"] is not None else [])
+    if levels and indexes["level"] is None:
+        required.append("level")
+    missing = [column for column in required if indexes[column] is None]
+    if missing:
+        raise ValueError(f"必須の列がありません: {', '.join(missing)}")
+    return indexes
+
+
+def _flush(conn: sqlite3.Connection, schema: ImportSchema,
+           levels: List[Tuple[int, int, int]], result: ImportResult) -> None:
+    """1チャンク分の書き込みとコミット"""
+    if levels:
+        conn.executemany(schema.upsert_level_sql, levels)
+        result.imported += len(levels)
+    conn.commit()
+
+
+def _report(progress: Optional[ProgressCallback], result: ImportResult,
+            bytes_read: int, total_bytes: int, started: float) -> None:
+    if progress:
+        progress(ImportProgress(result.rows, bytes_read, total_bytes,
+                                time.monotonic() - started))
@@ -0,0 +1,166 @@
+"""レーダーチャート一覧のPDF出力
+Created: 2026-10-17 19:10:45
+Author: GingaDza
+
+ユーザーごとのレーダーチャートを1ページ分ずつ使い回しの Figure に描画し、
+ベクター形式のまま順に1つのPDFへ書き込む（文字は選択・検索でき、拡大しても劣化しない）。
+チャートは1ページ分しか保持しないため、数千人分でもメモリ使用量は一定。
+GUIを止めないよう、呼び出し側はワーカースレッド（"batch" チャネル）で実行すること。
+
+標準ライブラリ・numpy・matplotlib のみに依存するため、src パッケージ・
+skill_matrix_manager のどちらからでも利用できる。
+"""
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from .chunks import iter_chunks
+
+ProgressCallback = Callable[[int, Optional[int]], None]  # (出力済みチャート数, 総数)
+
+
+@dataclass(frozen=True)
+class RadarChartSpec:
+    """1人分のチャート"""
+    title: str
+    categories: Tuple[str, ...]
+    current: Tuple[float, ...]
+    target: Optional[Tuple[float, ...]] = None
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    """ページのレイアウト（既定はA4縦に2列×3段）"""
+    size_inches: Tuple[float, float] = (8.27, 11.69)
+    dpi: int = 100
+    columns: int = 2
+    rows: int = 3
+
+    @property
+    def charts_per_page(self) -> int:
+        return self.columns * self.rows
+
+
+def charts_from_matrix(matrix, user_ids: Optional[Sequence[int]] = None,
+                       labels: Optional[Mapping[Hashable, str]] = None) -> Iterator[RadarChartSpec]:
+    """SkillMatrix からユーザーごとのカテゴリー平均チャートを生成
+
+    カテゴリー平均は100人単位でまとめて計算し、チャートは逐次生成する。
+
+    Args:
+        matrix (SkillMatrix): 評価行列
+        user_ids (Sequence[int], optional): 対象ユーザー（省略時は全ユーザー）
+        labels (Mapping, optional): カテゴリー → 表示名
+    """
+    labels = labels or {}
+    categories = tuple(str(labels.get(category, category)) for category in matrix.categories)
+    user_ids = list(matrix.user_ids if user_ids is None else user_ids)
+    names = dict(zip(matrix.user_ids, matrix.user_names))
+    for start in range(0, len(user_ids), 100):
+        batch = user_ids[start:start + 100]
+        means = np.nan_to_num(matrix.category_means(batch))
+        for user_id, row in zip(batch, means):
+            yield RadarChartSpec(str(names.get(user_id, user_id)), categories,
+                                 tuple(float(value) for value in row))
+
+
+class _PageTemplate:
+    """出力中に再利用するページ（RadarChart と同じ配色）
+
+    Figure と極座標軸は1回だけ作成し、ページごとには線・多角形のデータとタイトルのみ差し替える。
+    """
+
+    def __init__(self, layout: PageLayout):
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=layout.size_inches, dpi=layout.dpi, facecolor='white')
+        self.slots = []
+        for index in range(layout.charts_per_page):
+            ax = self.figure.add_subplot(layout.rows, layout.columns, index + 1, projection='polar')
+            ax.grid(True, color='gray', alpha=0.3)
+            ax.set_ylim(0, 5)
+            ax.set_rticks([1, 2, 3, 4, 5])
+            ax.tick_params(axis='both', colors='#333333', labelsize=6)
+            current_line, = ax.plot([], [], 'o-', linewidth=1.5, markersize=3, color='#1f77b4')
+            current_fill, = ax.fill([0], [0], alpha=0.25, color='#1f77b4')
+            target_line, = ax.plot([], [], 'o--', linewidth=1.5, markersize=3, color='#ff7f0e')
+            self.slots.append({
+                "ax": ax, "categories": None, "angles": None, "gap": None,
+                "current_line": current_line, "current_fill": current_fill,
+                "target_line": target_line,
+            })
+        self.figure.subplots_adjust(left=0.08, right=0.92, bottom=0.04, top=0.95,
+                                    wspace=0.45, hspace=0.45)
+
+    def update(self, charts: Sequence[RadarChartSpec]) -> None:
+        """ページのチャートの差し替え（余った枠は非表示）"""
+        for slot, chart in zip(self.slots, charts):
+            slot["ax"].set_visible(True)
+            self._update_slot(slot, chart)
+        for slot in self.slots[len(charts):]:
+            slot["ax"].set_visible(False)
+
+    @staticmethod
+    def _update_slot(slot, chart: RadarChartSpec) -> None:
+        ax = slot["ax"]
+        ax.set_title(chart.title, fontsize=9, color='#333333', pad=12)
+        if slot["gap"] is not None:
+            slot["gap"].remove()
+            slot["gap"] = None
+        if chart.categories != slot["categories"]:
+            angles = np.linspace(0, 2 * np.pi, len(chart.categories), endpoint=False)
+            slot["angles"] = np.concatenate((angles, angles[:1]))
+            slot["categories"] = chart.categories
+            ax.set_xticks(angles)
+            ax.set_xticklabels(chart.categories, fontsize=7)
+        angles = slot["angles"]
+        values = np.concatenate((chart.current, chart.current[:1]))
+        slot["current_line"].set_data(angles, values)
+        slot["current_fill"].set_xy(np.column_stack([angles, values]))
+        if chart.target:
+            target = np.concatenate((chart.target, chart.target[:1]))
+            slot["target_line"].set_data(angles, target)
+            slot["gap"] = ax.fill_between(angles, values, target, where=target > values,
+                                          color='#ff9999', alpha=0.3)
+        else:
+            slot["target_line"].set_data([], [])
+
+
+def export_radar_pdf(charts: Iterable[RadarChartSpec], path: str,
+                     layout: PageLayout = PageLayout(),
+                     progress: Optional[ProgressCallback] = None,
+                     total: Optional[int] = None) -> int:
+    """チャートを1つのベクターPDFに出力
+
+    Args:
+        charts (Iterable[RadarChartSpec]): 出力するチャート（ジェネレーター可）
+        path (str): 出力先PDF
+        progress (Callable, optional): ページを書き込むたびに (出力済み数, 総数) で呼ばれる
+        total (int, optional): 総数（省略時は charts が len を持てばその値）
+
+    Returns:
+        int: 出力したページ数
+    """
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    if total is None and hasattr(charts, "__len__"):
+        total = len(charts)
+    page = _PageTemplate(layout)
+    written = pages_written = 0
+    with PdfPages(path) as pdf:
+        for charts_on_page in iter_chunks(charts, layout.charts_per_page):
+            page.update(charts_on_page)
+            pdf.savefig(page.figure)
+            written += len(charts_on_page)
+            pages_written += 1
+            if progress:
+                progress(written, total)
+    return pages_written
+
+
+def export_matrix_radar_pdf(matrix, path: str, user_ids: Optional[Sequence[int]] = None,
+                            labels: Optional[Mapping[Hashable, str]] = None,
+                            progress: Optional[ProgressCallback] = None) -> int:
+    """SkillMatrix のユーザーごとのカテゴリー平均をPDFに出力"""
+    total = len(matrix.user_ids if user_ids is None else user_ids)
+    return export_radar_pdf(charts_from_matrix(matrix, user_ids, labels), path,
+                            progress=progress, total=total)
@@ -0,0 +1,215 @@
+"""書き込み専用のストリーミングXLSXライター
+Created: 2026-10-17 22:05:31
+Author: GingaDza
+
+外部ライブラリを使わず、行をシートXMLとしてzipコンテナへ逐次書き込む。
+文字列は共有文字列テーブルで重複を除くが、テーブルが上限に達した後の
+新しい文字列はインライン文字列として書くため、メモリ使用量は行数に依存しない。
+"""
+import math
+import re
+import sqlite3
+import zipfile
+from typing import Any, Dict, Iterable, List, Optional
+from xml.sax.saxutils import escape
+from .csv_export import EVALUATIONS_EXPORT, ExportSchema, PROGRESS_INTERVAL, ProgressCallback, iter_pivot_rows
+
+MAX_SHARED_STRINGS = 100000
+ROWS_PER_WRITE = 500  # zipへまとめて書き込む行数
+
+# XML 1.0 で使えない制御文字
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>"""
+
+_ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>"""
+
+_WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>
+</workbook>"""
+
+_WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+_STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>
+<fills count="1"><fill><patternFill patternType="none"/></fill></fills>
+<borders count="1"><border/></borders>
+<cellStyleXfs count="1"><xf/></cellStyleXfs>
+<cellXfs count="1"><xf/></cellXfs>
+</styleSheet>"""
+
+_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+_SHEET_FOOTER = '</sheetData></worksheet>'
+
+
+class XlsxWriter:
+    """1シートのXLSXを行単位で書き込むライター
+
+    with XlsxWriter(path) as writer:
+        writer.writerow(["group", "user", "Python"])
+        writer.writerows(rows)
+
+    Args:
+        max_shared_strings (int): 共有文字列テーブルの上限（超えた分はインライン文字列）
+    """
+
+    def __init__(self, file_path: str, sheet_name: str = "Sheet1",
+                 max_shared_strings: int = MAX_SHARED_STRINGS):
+        self.sheet_name = sheet_name
+        self.max_shared_strings = max_shared_strings
+        self.row_count = 0
+        self._strings: Dict[str, int] = {}
+        self._string_refs = 0  # 共有文字列を参照したセル数
+        self._columns: List[str] = []
+        self._pending: List[str] = []
+        self._zip = zipfile.ZipFile(file_path, "w", zipfile.ZIP_DEFLATED)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(_SHEET_HEADER.encode("utf-8"))
+
+    def __enter__(self) -> "XlsxWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def writerow(self, values: Iterable[Any]) -> None:
+        """1行の書き込み（None・空文字・NaN は空セル）"""
+        self.row_count += 1
+        row = self.row_count
+        cells = []
+        for index, value in enumerate(values):
+            if value is None or value == "":
+                continue
+            ref = f"{self._column(index)}{row}"
+            if isinstance(value, bool):
+                cells.append(f'<c r="{ref}" t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, (int, float)):
+                if isinstance(value, float) and not math.isfinite(value):
+                    continue
+                cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+            else:
+                cells.append(self._string_cell(ref, str(value)))
+        self._pending.append(f'<row r="{row}">{"".join(cells)}</row>')
+        if len(self._pending) >= ROWS_PER_WRITE:
+            self._flush()
+
+    def writerows(self, rows: Iterable[Iterable[Any]]) -> None:
+        for values in rows:
+            self.writerow(values)
+
+    def close(self) -> None:
+        """シートを閉じ、共有文字列と付随するパーツを書き込む"""
+        if self._zip is None:
+            return
+        self._flush()
+        self._sheet.write(_SHEET_FOOTER.encode("utf-8"))
+        self._sheet.close()
+        self._write_shared_strings()
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK.format(name=_xml_text(self.sheet_name)))
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        self._zip.close()
+        self._zip = None
+
+    def _string_cell(self, ref: str, text: str) -> str:
+        index = self._strings.get(text)
+        if index is None and len(self._strings) < self.max_shared_strings:
+            index = self._strings[text] = len(self._strings)
+        if index is None:
+            return f'<c r="{ref}" t="inlineStr"><is>{_string_item(text)}</is></c>'
+        self._string_refs += 1
+        return f'<c r="{ref}" t="s"><v>{index}</v></c>'
+
+    def _column(self, index: int) -> str:
+        """列番号（0始まり）→ 列名（A, B, ..., AA）"""
+        while len(self._columns) <= index:
+            self._columns.append(_column_name(len(self._columns)))
+        return self._columns[index]
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._sheet.write("".join(self._pending).encode("utf-8"))
+            self._pending = []
+
+    def _write_shared_strings(self) -> None:
+        with self._zip.open("xl/sharedStrings.xml", "w", force_zip64=True) as f:
+            f.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                f'count="{self._string_refs}" uniqueCount="{len(self._strings)}">'
+            ).encode("utf-8"))
+            # 辞書は挿入順を保つため、インデックス順に並ぶ
+            items = iter(self._strings)
+            while True:
+                chunk = [f"<si>{_string_item(text)}</si>" for _, text in zip(range(1000), items)]
+                if not chunk:
+                    break
+                f.write("".join(chunk).encode("utf-8"))
+            f.write(b"</sst>")
+
+
+def export_skill_matrix_xlsx(conn: sqlite3.Connection, file_path: str,
+                             schema: ExportSchema = EVALUATIONS_EXPORT,
+                             progress: Optional[ProgressCallback] = None) -> int:
+    """スキルマトリックスをXLSXに出力（CSV出力と同じピボット形式）
+
+    Returns:
+        int: 出力したユーザー数
+    """
+    total = conn.execute(schema.count_sql).fetchone()[0]
+    rows = iter_pivot_rows(conn, schema)
+    written = 0
+    with XlsxWriter(file_path, "スキルマトリックス") as writer:
+        writer.writerow(next(rows))
+        for row in rows:
+            writer.writerow(row)
+            written += 1
+            if progress and written % PROGRESS_INTERVAL == 0:
+                progress(written, total)
+    if progress:
+        progress(written, total)
+    return written
+
+
+def _column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(ord("A") + remainder) + name
+    return name
+
+
+def _xml_text(text: str) -> str:
+    return escape(_ILLEGAL_XML_CHARS.sub("", text), {'"': "&quot;"})
+
+
+def _string_item(text: str) -> str:
+    """<si>/<is> の中身（前後の空白は xml:space で保持）"""
+    if text != text.strip():
+        return f'<t xml:space="preserve">{_xml_text(text)}</t>'
+    return f"<t>{_xml_text(text)}</t>"
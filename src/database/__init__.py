@@ -3,17 +3,26 @@ Created: 2025-02-08 22:13:49
 Author: GingaDza
 """
 from .base_manager import BaseManager
+from .connection_pool import ConnectionPool, get_pool, close_all_pools
+from .cache import ReferenceCache, reference_cache, get_cache_stats, clear_reference_cache
 from .group_manager import GroupManager
 from .user_manager import UserManager
 from .category_manager import CategoryManager
-from .skill_manager import SkillManager
+from .skill_manager import SkillManagerMixin
 from .evaluation_manager import EvaluationManager
 
 __all__ = [
     'BaseManager',
+    'ConnectionPool',
+    'get_pool',
+    'close_all_pools',
+    'ReferenceCache',
+    'reference_cache',
+    'get_cache_stats',
+    'clear_reference_cache',
     'GroupManager',
     'UserManager',
     'CategoryManager',
-    'SkillManager',
+    'SkillManagerMixin',
     'EvaluationManager'
 ]
\ No newline at end of file
@@ -3,18 +3,27 @@ Created: 2025-02-08 20:44:07
 Author: GingaDza
 """
 import sqlite3
-from contextlib import contextmanager
-from typing import Generator
+import weakref
+from typing import ContextManager, Dict, Optional
 from pathlib import Path
+from ..config.schema import EVALUATIONS, ensure_schema
 from ..utils.logger import setup_logger
+from .connection_pool import get_pool
+
+# プール → スキーマを確認したときのファイル識別子
+# （プールを閉じるか、ファイルが削除・置換されれば再確認する）
+_checked_files = weakref.WeakKeyDictionary()
 
 class BaseManager:
     """基本データベース管理クラス"""
 
-    def __init__(self, db_path: str = "data/skill_matrix.db"):
+    schema = EVALUATIONS.name  # config.schema のスキーマ名
+
+    def __init__(self, db_path: str = "data/skill_matrix.db", pool_size: Optional[int] = None):
         self.logger = setup_logger(__name__)
         self.db_path = db_path
         self._ensure_data_directory()
+        self.pool = get_pool(db_path, size=pool_size)
         self._init_database()
 
     def _ensure_data_directory(self):
@@ -22,22 +31,21 @@ class BaseManager:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
     def _init_database(self):
-        """データベースの初期化"""
+        """データベースの初期化（プールごとに1回、user_version が最新ならDDLなし）"""
+        file_id = self.pool.file_id()
+        if file_id is not None and _checked_files.get(self.pool) == file_id:
+            return
         with self.get_connection() as conn:
-            conn.executescript(self.get_init_sql())
-
-    @contextmanager
-    def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """データベース接続を取得"""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        finally:
-            if conn:
-                conn.close()
-
-    def get_init_sql(self) -> str:
-        """初期化用SQLの取得"""
-        return ""
+            ensure_schema(conn, self.schema)
+        _checked_files[self.pool] = self.pool.file_id()
+
+    def get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """データベース接続を取得
+
+        プールから接続を借り、ブロックを抜けるとコミットして返却する。
+        """
+        return self.pool.connection()
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """コネクションプールの統計情報を取得"""
+        return self.pool.get_stats()
@@ -0,0 +1,49 @@
+"""一括書き込みの共通処理
+Created: 2026-10-17 10:41:55
+Author: GingaDza
+"""
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, TypeVar
+from ..data_io.chunks import iter_chunks as _iter_chunks
+
+T = TypeVar('T')
+
+# 1チャンク = 1トランザクション。IN句のプレースホルダ数の上限にも収まる大きさ
+DEFAULT_CHUNK_SIZE = 500
+
+
+@dataclass
+class BulkWriteResult:
+    """一括書き込みの結果"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0   # 入力不備・重複・変更なしの行
+    failed: int = 0    # エラーでロールバックされたチャンクの行
+
+    @property
+    def total(self) -> int:
+        """処理した行数"""
+        return self.inserted + self.updated + self.skipped + self.failed
+
+
+def iter_chunks(items: Iterable[T], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[T]]:
+    """イテラブルを一定件数ごとのリストに分割（全件をメモリに載せない）"""
+    return _iter_chunks(items, size)
+
+@contextmanager
+def chunk_savepoint(conn: sqlite3.Connection, name: str = "bulk_chunk") -> Iterator[None]:
+    """1チャンク分のセーブポイント（失敗時はそのチャンクのみ取り消して例外を再送出）
+
+    外側にトランザクションがなければ RELEASE でチャンクごとにコミットされ、
+    あればそのトランザクションに含まれる（コミットはプールの最も外側のブロックが行う）。
+    """
+    conn.execute(f"SAVEPOINT {name}")
+    try:
+        yield
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
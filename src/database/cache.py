@@ -0,0 +1,146 @@
+"""参照データキャッシュ
+Created: 2026-10-17 13:05:18
+Author: GingaDza
+
+グループ・カテゴリー・スキルのように更新頻度が低く、画面更新のたびに
+読み直される参照データをプロセス内で共有するリードスルーキャッシュ。
+マネージャーの書き込みメソッドで名前空間単位に無効化する。
+"""
+import functools
+import os
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from .connection_pool import MEMORY_DB
+
+
+@dataclass
+class CacheStats:
+    """キャッシュ統計情報"""
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class ReferenceCache:
+    """データベースパス・名前空間・引数をキーとするキャッシュ"""
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._entries: Dict[Tuple[str, str, Hashable], Any] = {}
+        self._generations: Dict[str, int] = {}  # データベースごとの無効化回数
+        self._file_ids: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, db_path: str, namespace: str, key: Hashable,
+                    loader: Callable[[], Any]) -> Any:
+        """キャッシュ済みの値、なければ loader の結果を返す
+
+        loader が例外を送出した場合は何もキャッシュしない。
+        """
+        db_key = self._db_key(db_path)
+        entry_key = (db_key, namespace, key)
+        with self._lock:
+            self._check_file(db_key)
+            if entry_key in self._entries:
+                self.stats.hits += 1
+                return self._entries[entry_key]
+            self.stats.misses += 1
+            generation = self._generations.get(db_key, 0)
+
+        value = loader()
+
+        with self._lock:
+            # 読み込み中に無効化された場合は古い値を保存しない
+            if self._generations.get(db_key, 0) == generation:
+                self._entries[entry_key] = value
+        return value
+
+    def invalidate(self, db_path: str, *namespaces: str) -> None:
+        """指定した名前空間（省略時はすべて）のキャッシュを破棄"""
+        db_key = self._db_key(db_path)
+        with self._lock:
+            self._invalidate(db_key, namespaces)
+
+    def clear(self) -> None:
+        """全キャッシュを破棄"""
+        with self._lock:
+            self._entries.clear()
+            self._file_ids.clear()
+            for db_key in self._generations:
+                self._generations[db_key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """統計情報を取得"""
+        with self._lock:
+            stats = asdict(self.stats)
+            stats["entries"] = len(self._entries)
+            lookups = self.stats.hits + self.stats.misses
+            stats["hit_rate"] = self.stats.hits / lookups if lookups else 0.0
+            return stats
+
+    def reset_stats(self) -> None:
+        """統計情報のリセット"""
+        with self._lock:
+            self.stats = CacheStats()
+
+    def _invalidate(self, db_key: str, namespaces: Tuple[str, ...]) -> None:
+        targets = [
+            entry_key for entry_key in self._entries
+            if entry_key[0] == db_key and (not namespaces or entry_key[1] in namespaces)
+        ]
+        for entry_key in targets:
+            del self._entries[entry_key]
+        self._generations[db_key] = self._generations.get(db_key, 0) + 1
+        self.stats.invalidations += 1
+
+    def _check_file(self, db_key: str) -> None:
+        """データベースファイルが置換されていればそのパスのキャッシュを破棄"""
+        file_id = _file_id(db_key)
+        if db_key in self._file_ids and self._file_ids[db_key] != file_id:
+            self._invalidate(db_key, ())
+        self._file_ids[db_key] = file_id
+
+    @staticmethod
+    def _db_key(db_path: str) -> str:
+        return db_path if db_path == MEMORY_DB else os.path.abspath(db_path)
+
+
+def _file_id(db_key: str) -> Optional[Tuple[int, int]]:
+    if db_key == MEMORY_DB:
+        return None
+    try:
+        stat = os.stat(db_key)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+# プロセス全体で共有するキャッシュ
+reference_cache = ReferenceCache()
+
+
+def invalidates(*namespaces: str):
+    """書き込みメソッド用デコレーター: 実行後に名前空間を無効化
+
+    コミット後に無効化するため、メソッド内の接続ブロックを抜けた後に行う。
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                reference_cache.invalidate(self.db_path, *namespaces)
+        return wrapper
+    return decorator
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """参照データキャッシュの統計情報を取得"""
+    return reference_cache.get_stats()
+
+
+def clear_reference_cache() -> None:
+    """参照データキャッシュを破棄"""
+    reference_cache.clear()
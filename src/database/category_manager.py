@@ -2,25 +2,20 @@
 Created: 2025-02-08 20:58:32
 Author: GingaDza
 """
-from typing import List, Optional
+import copy
+from typing import Dict, List, Optional, Tuple
 from ..models.category import Category
 from .base_manager import BaseManager
+from .cache import invalidates, reference_cache
+
+SELECT_ROOT_CATEGORIES_SQL = "SELECT * FROM categories WHERE parent_id IS NULL"
+SELECT_CHILD_CATEGORIES_SQL = "SELECT * FROM categories WHERE parent_id = ?"
+SELECT_SKILLS_BY_CATEGORY_SQL = "SELECT id, category_id, name FROM skills ORDER BY category_id, name"
 
 class CategoryManager(BaseManager):
     """カテゴリー管理クラス"""
 
-    def get_init_sql(self) -> str:
-        return """
-        CREATE TABLE IF NOT EXISTS categories (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            parent_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (parent_id) REFERENCES categories (id)
-        );
-        """
-
+    @invalidates("categories")
     def create_category(self, name: str, parent_id: Optional[int] = None) -> Optional[int]:
         """カテゴリーを作成"""
         try:
@@ -38,15 +33,43 @@ class CategoryManager(BaseManager):
             return None
 
     def get_categories(self, parent_id: Optional[int] = None) -> List[Category]:
-        """カテゴリー一覧を取得"""
+        """カテゴリー一覧を取得（参照データキャッシュ経由）
+
+        キャッシュ済みのモデルを共有しないよう、skills・children を含めて複製を返す。
+        """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                if parent_id is None:
-                    cursor.execute("SELECT * FROM categories WHERE parent_id IS NULL")
-                else:
-                    cursor.execute("SELECT * FROM categories WHERE parent_id = ?", (parent_id,))
-                return [Category(**dict(row)) for row in cursor.fetchall()]
+            return copy.deepcopy(reference_cache.get_or_load(
+                self.db_path, "categories", parent_id,
+                lambda: self._load_categories(parent_id)
+            ))
         except Exception as e:
             self.logger.error(f"カテゴリー一覧の取得に失敗しました: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def get_skills_by_category(self) -> Dict[int, List[Tuple[int, str]]]:
+        """カテゴリーID → (スキルID, スキル名) のリストを1クエリで取得"""
+        try:
+            skills = reference_cache.get_or_load(
+                self.db_path, "skills", "by_category", self._load_skills_by_category
+            )
+            return {category_id: list(items) for category_id, items in skills.items()}
+        except Exception as e:
+            self.logger.error(f"スキル一覧の取得に失敗しました: {e}")
+            return {}
+
+    def _load_skills_by_category(self) -> Dict[int, List[Tuple[int, str]]]:
+        skills: Dict[int, List[Tuple[int, str]]] = {}
+        with self.get_connection() as conn:
+            rows = conn.execute(SELECT_SKILLS_BY_CATEGORY_SQL)
+            for row in rows:
+                skills.setdefault(row['category_id'], []).append((row['id'], row['name']))
+        return skills
+
+    def _load_categories(self, parent_id: Optional[int]) -> List[Category]:
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if parent_id is None:
+                cursor.execute(SELECT_ROOT_CATEGORIES_SQL)
+            else:
+                cursor.execute(SELECT_CHILD_CATEGORIES_SQL, (parent_id,))
+            return [Category(**dict(row)) for row in cursor.fetchall()]
@@ -0,0 +1,246 @@
+"""SQLiteコネクションプール
+Created: 2026-10-17 09:12:40
+Author: GingaDza
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Generator, Optional, Tuple
+from ..config import settings
+from ..config.pragmas import apply_pragma_profile
+from ..utils.logger import setup_logger
+from .exceptions import DatabaseError
+
+MEMORY_DB = ":memory:"
+
+
+@dataclass
+class PoolStats:
+    """プール統計情報"""
+    checkouts: int = 0        # 貸し出し回数（ネストした取得は除く）
+    hits: int = 0             # アイドル接続を再利用できた回数
+    waits: int = 0            # 空き接続待ちが発生した回数
+    opens: int = 0            # 新規に開いた接続数
+    health_failures: int = 0  # ヘルスチェックで破棄した接続数
+
+
+class ConnectionPool:
+    """スレッド単位で接続を貸し出すSQLiteコネクションプール
+
+    同一スレッド内でネストして取得した場合は同じ接続を返し、
+    最も外側のブロックを抜けた時点でコミット（例外時はロールバック）して返却する。
+    :memory: は接続ごとに別の空のデータベースになるため、常に1接続で共有する。
+    """
+
+    def __init__(self, db_path: str, size: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 health_check_interval: Optional[float] = None,
+                 pragma_profile: Optional[str] = None):
+        config = settings.CONNECTION_POOL
+        self.logger = setup_logger(__name__)
+        self.db_path = db_path
+        self.size = self._clamp_size(size if size is not None else config["size"])
+        self.timeout = timeout if timeout is not None else config["timeout"]
+        self.health_check_interval = (
+            health_check_interval if health_check_interval is not None
+            else config["health_check_interval"]
+        )
+        self.pragma_profile = pragma_profile
+        self.stats = PoolStats()
+        self._idle: deque = deque()  # (connection, last_used, file_id)
+        self._open_count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """接続を借りる"""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            # 同一スレッド内のネスト: 外側の接続・トランザクションを共有
+            yield conn
+            return
+
+        conn, file_id = self._checkout()
+        local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            self._rollback(conn)
+            raise
+        finally:
+            local.conn = None
+            self._checkin(conn, file_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """統計情報を取得"""
+        with self._cond:
+            stats = asdict(self.stats)
+            stats.update(size=self.size, open=self._open_count, idle=len(self._idle))
+            return stats
+
+    def resize(self, size: int) -> None:
+        """プールサイズを変更（超過分は返却時に閉じる）"""
+        with self._cond:
+            self.size = self._clamp_size(size)
+            self._cond.notify_all()
+
+    def _clamp_size(self, size: int) -> int:
+        if self.db_path == MEMORY_DB:
+            return 1
+        return max(1, size)
+
+    def close(self) -> None:
+        """アイドル接続をすべて閉じ、以降の貸し出しを停止"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _, _ = self._idle.popleft()
+                self._open_count -= 1
+                conn.close()
+            self._cond.notify_all()
+
+    def _checkout(self) -> Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]:
+        """アイドル接続の取得、または新規接続の作成"""
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DatabaseError(f"コネクションプールは閉じられています: {self.db_path}")
+                if self._idle:
+                    # LIFO: 直近に使われたキャッシュの温まった接続を優先
+                    conn, last_used, file_id = self._idle.pop()
+                    self.stats.hits += 1
+                    break
+                if self._open_count < self.size:
+                    self._open_count += 1
+                    conn = None
+                    break
+                if not waited:
+                    self.stats.waits += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseError(
+                        f"空き接続の待機がタイムアウトしました ({self.timeout}秒): {self.db_path}"
+                    )
+                self._cond.wait(remaining)
+            self.stats.checkouts += 1
+
+        try:
+            if conn is None:
+                return self._open()
+            if not self._is_healthy(conn, last_used, file_id):
+                with self._cond:
+                    self.stats.health_failures += 1
+                self._discard(conn)
+                return self._open()
+            return conn, file_id
+        except BaseException:
+            with self._cond:
+                self._open_count -= 1
+                self._cond.notify()
+            raise
+
+    def _checkin(self, conn: sqlite3.Connection, file_id: Optional[Tuple[int, int]]) -> None:
+        """接続の返却"""
+        if conn.in_transaction:
+            self._rollback(conn)
+        with self._cond:
+            if self._closed or self._open_count > self.size:
+                self._open_count -= 1
+                conn.close()
+            else:
+                self._idle.append((conn, time.monotonic(), file_id))
+            self._cond.notify()
+
+    def _open(self) -> Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]:
+        """新規接続を開く"""
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            apply_pragma_profile(conn, self.pragma_profile)
+        except BaseException:
+            conn.close()
+            raise
+        with self._cond:
+            self.stats.opens += 1
+        return conn, self.file_id()
+
+    def _is_healthy(self, conn: sqlite3.Connection, last_used: float,
+                    file_id: Optional[Tuple[int, int]]) -> bool:
+        """再利用前のヘルスチェック"""
+        # ファイルが削除・置換されていれば古い接続は使わない
+        if file_id != self.file_id():
+            return False
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error as e:
+            self.logger.warning(f"接続のヘルスチェックに失敗しました: {e}")
+            return False
+
+    def file_id(self) -> Optional[Tuple[int, int]]:
+        """データベースファイルの識別子 (device, inode)"""
+        if self.db_path == MEMORY_DB:
+            return None
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """接続の破棄（open数はそのまま）"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _rollback(self, conn: sqlite3.Connection) -> None:
+        """ロールバック（失敗しても例外は伝播させない）"""
+        try:
+            conn.rollback()
+        except sqlite3.Error as e:
+            self.logger.error(f"ロールバックに失敗しました: {e}")
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, size: Optional[int] = None) -> ConnectionPool:
+    """データベースパスごとの共有プールを取得
+
+    既存のプールと異なる size が指定された場合は警告を記録し、既存のサイズのまま返す
+    （サイズの変更は ConnectionPool.resize で明示的に行う）。
+    """
+    key = db_path if db_path == MEMORY_DB else os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(db_path, size=size)
+            _pools[key] = pool
+        elif size is not None and pool._clamp_size(size) != pool.size:
+            pool.logger.warning(
+                f"共有プールのサイズ指定 ({size}) を無視します（現在のサイズ: {pool.size}）: {db_path}"
+            )
+        return pool
+
+
+def close_all_pools() -> None:
+    """すべてのプールを閉じる（アプリケーション終了時）"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
@@ -3,6 +3,8 @@ import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
+from ..config.pragmas import apply_pragma_profile
+from ..config.schema import EVALUATIONS, ensure_schema
 
 logger = logging.getLogger(__name__)
 
@@ -22,81 +24,8 @@ class Database:
             db_dir.mkdir(parents=True, exist_ok=True)
             
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # グループテーブルの作成
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS groups (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT NOT NULL UNIQUE,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL
-                    )
-                ''')
-                
-                # ユーザーテーブルの作成
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS users (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        employee_id TEXT NOT NULL UNIQUE,
-                        name TEXT NOT NULL,
-                        group_id INTEGER,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        FOREIGN KEY (group_id) REFERENCES groups (id)
-                            ON DELETE SET NULL
-                            ON UPDATE CASCADE
-                    )
-                ''')
-                
-                # スキルカテゴリーテーブルの作成
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS skill_categories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT NOT NULL UNIQUE,
-                        description TEXT,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL
-                    )
-                ''')
-                
-                # スキルテーブルの作成
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS skills (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        category_id INTEGER NOT NULL,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        FOREIGN KEY (category_id) REFERENCES skill_categories (id)
-                            ON DELETE CASCADE
-                            ON UPDATE CASCADE,
-                        UNIQUE (category_id, name)
-                    )
-                ''')
-                
-                # ユーザースキルテーブルの作成
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS user_skills (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        skill_id INTEGER NOT NULL,
-                        level INTEGER NOT NULL CHECK (level BETWEEN 0 AND 5),
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        FOREIGN KEY (user_id) REFERENCES users (id)
-                            ON DELETE CASCADE
-                            ON UPDATE CASCADE,
-                        FOREIGN KEY (skill_id) REFERENCES skills (id)
-                            ON DELETE CASCADE
-                            ON UPDATE CASCADE,
-                        UNIQUE (user_id, skill_id)
-                    )
-                ''')
-                
-                conn.commit()
-                logger.info(f"{self.current_time} - Database tables created successfully")
+                if ensure_schema(conn, EVALUATIONS.name):
+                    logger.info(f"{self.current_time} - Database tables created successfully")
                 
         except Exception as e:
             logger.error(f"{self.current_time} - Failed to setup database: {str(e)}")
@@ -107,6 +36,7 @@ class Database:
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row  # 行を辞書形式で取得
+            apply_pragma_profile(conn)
             return conn
             
         except Exception as e:
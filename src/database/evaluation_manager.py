@@ -2,28 +2,66 @@
 Created: 2025-02-08 20:58:32
 Author: GingaDza
 """
-from typing import List, Optional
-from ..models.evaluation import Evaluation
+import numbers
+import sqlite3
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from ..analytics import SkillMatrix
+from ..config.pragmas import apply_pragma_profile
+from ..data_io import (
+    ImportResult, export_skill_matrix_csv, export_skill_matrix_xlsx, import_skill_levels_csv
+)
+from ..data_io.csv_import import ProgressCallback
+from ..models.evaluation import Evaluation, UserSkillSummary
 from .base_manager import BaseManager
+from .cache import invalidates, reference_cache
+
+SkillKey = Union[int, str]  # スキルIDまたはスキル名
+MIN_LEVEL, MAX_LEVEL = 1, 5
+CLEAR_LEVEL = 0  # 評価を削除するレベル（None も同じ扱い）
+
+UPSERT_EVALUATION_SQL = """
+    INSERT INTO evaluations (user_id, skill_id, level)
+    VALUES (?, ?, ?)
+    ON CONFLICT(user_id, skill_id)
+    DO UPDATE SET level = excluded.level, updated_at = CAST(strftime('%s', 'now') AS INTEGER)
+"""
+
+DELETE_EVALUATION_SQL = "DELETE FROM evaluations WHERE user_id = ? AND skill_id = ?"
+
+SELECT_USER_EVALUATIONS_SQL = """
+    SELECT e.*, s.name as skill_name, c.name as category_name
+    FROM evaluations e
+    JOIN skills s ON e.skill_id = s.id
+    JOIN categories c ON s.category_id = c.id
+    WHERE e.user_id = ?
+"""
+
+SELECT_CATEGORY_AVERAGES_SQL = """
+    SELECT s.category_id, AVG(e.level) AS average
+    FROM evaluations e
+    JOIN skills s ON e.skill_id = s.id
+    WHERE e.user_id = ?
+    GROUP BY s.category_id
+"""
+
+SELECT_USER_SKILL_LEVELS_SQL = """
+    SELECT s.category_id, s.name, e.level
+    FROM evaluations e
+    JOIN skills s ON e.skill_id = s.id
+    WHERE e.user_id = ?
+"""
+
+SELECT_SKILL_IDS_SQL = "SELECT id, name FROM skills ORDER BY id"
+SELECT_CATEGORY_SKILL_IDS_SQL = "SELECT id, name FROM skills WHERE category_id = ? ORDER BY id"
+
+
+def _is_integer(value) -> bool:
+    """整数かどうか（numpy の整数型を含み、bool は除く）"""
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool)
 
 class EvaluationManager(BaseManager):
     """評価管理クラス"""
 
-    def get_init_sql(self) -> str:
-        return """
-        CREATE TABLE IF NOT EXISTS evaluations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            skill_id INTEGER NOT NULL,
-            level INTEGER NOT NULL CHECK (level >= 1 AND level <= 5),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id),
-            FOREIGN KEY (skill_id) REFERENCES skills (id),
-            UNIQUE(user_id, skill_id)
-        );
-        """
-
     def set_evaluation(self, user_id: int, skill_id: int, level: int) -> bool:
         """評価を設定または更新"""
         if not 1 <= level <= 5:
@@ -37,26 +75,217 @@ class EvaluationManager(BaseManager):
                     INSERT INTO evaluations (user_id, skill_id, level)
                     VALUES (?, ?, ?)
                     ON CONFLICT(user_id, skill_id) 
-                    DO UPDATE SET level = ?, updated_at = CURRENT_TIMESTAMP
+                    DO UPDATE SET level = ?, updated_at = CAST(strftime('%s', 'now') AS INTEGER)
                 """, (user_id, skill_id, level, level))
                 return True
         except Exception as e:
             self.logger.error(f"評価の設定に失敗しました: {e}")
             return False
 
+    def set_evaluations_bulk(self, user_id: int, levels: Mapping[SkillKey, Optional[int]],
+                             category_id: Optional[int] = None) -> bool:
+        """1ユーザーの評価を一括で設定、更新または削除
+
+        Args:
+            user_id (int): ユーザーID
+            levels (Mapping[SkillKey, Optional[int]]): スキルIDまたはスキル名 → レベル
+                （0 または None は評価の削除）
+            category_id (Optional[int]): スキル名を解決するカテゴリー（省略時は全カテゴリー）
+
+        Returns:
+            bool: 保存に成功したかどうか（無効なレベルのスキルは記録して保存しない）
+        """
+        return self.set_evaluations_for_users({user_id: levels}, category_id)
+
+    def set_evaluations_for_users(
+            self, evaluations: Mapping[int, Mapping[SkillKey, Optional[int]]],
+            category_id: Optional[int] = None) -> bool:
+        """複数ユーザーの評価を1トランザクションで一括設定、更新または削除
+
+        Args:
+            evaluations (Mapping[int, Mapping[SkillKey, Optional[int]]]):
+                ユーザーID → {スキル → レベル}（0 または None は評価の削除）
+            category_id (Optional[int]): スキル名を解決するカテゴリー（省略時は全カテゴリー）
+
+        Returns:
+            bool: 保存に成功したかどうか（無効なレベルのスキルは記録して保存しない）
+        """
+        return self.set_evaluations_by_category({
+            (user_id, category_id): levels for user_id, levels in evaluations.items()
+        })
+
+    def set_evaluations_by_category(
+            self, evaluations: Mapping[Tuple[int, Optional[int]],
+                                       Mapping[SkillKey, Optional[int]]]) -> bool:
+        """(ユーザー, カテゴリー) ごとの評価を1トランザクションで一括設定、更新または削除
+
+        レベルが 0 または None のスキルは評価を削除する。整数でないレベル（bool を含む）や
+        範囲外のレベルはスキルごとに記録して読み飛ばし、残りを保存する。
+
+        Args:
+            evaluations (Mapping): (ユーザーID, スキル名を解決するカテゴリーID) → {スキル → レベル}
+
+        Returns:
+            bool: 保存に成功したかどうか（データベースの書き込みに失敗した場合のみ False）
+        """
+        try:
+            with self.get_connection() as conn:
+                by_category: Dict[Optional[int], list] = {}
+                for (user_id, category_id), levels in evaluations.items():
+                    by_category.setdefault(category_id, []).append((user_id, levels))
+                upserts, deletes, invalid = [], [], []
+                for category_id, entries in by_category.items():
+                    names = {skill for _, levels in entries for skill in levels
+                             if isinstance(skill, str)}
+                    skill_ids = self._resolve_skill_ids(conn, names, category_id)
+                    unknown = names - skill_ids.keys()
+                    if unknown:
+                        self.logger.warning(
+                            f"存在しないスキルは保存をスキップします: {sorted(unknown)}"
+                        )
+                    for user_id, levels in entries:
+                        for skill, level in levels.items():
+                            if isinstance(skill, str) and skill not in skill_ids:
+                                continue
+                            skill_id = skill_ids[skill] if isinstance(skill, str) else skill
+                            if level is None or (_is_integer(level) and level == CLEAR_LEVEL):
+                                deletes.append((user_id, skill_id))
+                            elif _is_integer(level) and MIN_LEVEL <= level <= MAX_LEVEL:
+                                upserts.append((user_id, skill_id, int(level)))
+                            else:
+                                invalid.append((user_id, skill, level))
+                if invalid:
+                    self.logger.error(f"無効なスキルレベルは保存をスキップします: {invalid}")
+                conn.executemany(UPSERT_EVALUATION_SQL, upserts)
+                conn.executemany(DELETE_EVALUATION_SQL, deletes)
+                return True
+        except sqlite3.Error as e:
+            self.logger.error(f"評価の一括設定に失敗しました: {e}")
+            return False
+
+    def resolve_skill_ids(self, names: Iterable[str],
+                          category_id: Optional[int] = None) -> Dict[str, int]:
+        """スキル名からIDを一括で取得"""
+        try:
+            with self.get_connection() as conn:
+                return self._resolve_skill_ids(conn, set(names), category_id)
+        except sqlite3.Error as e:
+            self.logger.error(f"スキルIDの取得に失敗しました: {e}")
+            return {}
+
+    def _resolve_skill_ids(self, conn: sqlite3.Connection, names: Iterable[str],
+                           category_id: Optional[int]) -> Dict[str, int]:
+        """スキル名 → ID の解決（参照データキャッシュ経由）"""
+        skill_ids = reference_cache.get_or_load(
+            self.db_path, "skills", category_id,
+            lambda: self._load_skill_ids(conn, category_id)
+        )
+        return {name: skill_ids[name] for name in names if name in skill_ids}
+
+    def _load_skill_ids(self, conn: sqlite3.Connection,
+                        category_id: Optional[int]) -> Dict[str, int]:
+        """カテゴリー内（省略時は全体）のスキル名 → ID 対応表"""
+        if category_id is None:
+            rows = conn.execute(SELECT_SKILL_IDS_SQL)
+        else:
+            rows = conn.execute(SELECT_CATEGORY_SKILL_IDS_SQL, (category_id,))
+        return {row['name']: row['id'] for row in rows}
+
     def get_user_evaluations(self, user_id: int) -> List[Evaluation]:
         """ユーザーの全評価を取得"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT e.*, s.name as skill_name, c.name as category_name
-                    FROM evaluations e
-                    JOIN skills s ON e.skill_id = s.id
-                    JOIN categories c ON s.category_id = c.id
-                    WHERE e.user_id = ?
-                """, (user_id,))
-                return [Evaluation(**dict(row)) for row in cursor.fetchall()]
+                cursor.execute(SELECT_USER_EVALUATIONS_SQL, (user_id,))
+                return [Evaluation.from_dict(dict(row)) for row in cursor.fetchall()]
         except Exception as e:
             self.logger.error(f"評価の取得に失敗しました: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def get_category_averages(self, user_id: int) -> Dict[int, float]:
+        """ユーザーのカテゴリー別平均レベル（評価済みスキルのみ）"""
+        try:
+            with self.get_connection() as conn:
+                return self._category_averages(conn, user_id)
+        except sqlite3.Error as e:
+            self.logger.error(f"カテゴリー別平均の取得に失敗しました: {e}")
+            return {}
+
+    def get_user_skill_summary(self, user_id: int) -> UserSkillSummary:
+        """ユーザーのカテゴリー別スキルレベルと平均を1接続で取得"""
+        summary = UserSkillSummary(user_id)
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute(SELECT_USER_SKILL_LEVELS_SQL, (user_id,))
+                for row in rows:
+                    summary.levels.setdefault(row['category_id'], {})[row['name']] = row['level']
+                summary.averages = self._category_averages(conn, user_id)
+        except sqlite3.Error as e:
+            self.logger.error(f"評価の取得に失敗しました: {e}")
+        return summary
+
+    def _category_averages(self, conn: sqlite3.Connection, user_id: int) -> Dict[int, float]:
+        rows = conn.execute(SELECT_CATEGORY_AVERAGES_SQL, (user_id,))
+        return {row['category_id']: row['average'] for row in rows}
+
+    def load_skill_matrix(self) -> Optional[SkillMatrix]:
+        """全評価をユーザー × スキル行列として読み込む"""
+        try:
+            with self.get_connection() as conn:
+                return SkillMatrix.from_connection(conn)
+        except sqlite3.Error as e:
+            self.logger.error(f"スキルマトリックスの読み込みに失敗しました: {e}")
+            return None
+
+    @invalidates("groups", "categories", "skills")
+    def import_csv(self, file_path: str,
+                   progress: Optional[ProgressCallback] = None,
+                   levels: Optional[bool] = None) -> ImportResult:
+        """スキルレベルCSVの取り込み
+
+        プールとは別の接続に bulk-load プロファイルを適用して書き込む。
+        未登録のグループ・カテゴリー・スキル・ユーザーは作成する。
+
+        Args:
+            levels (bool, optional): True はスキルレベル、False はグループとユーザーのみを
+                取り込む（None は level 列の有無で判断）
+
+        Raises:
+            ValueError: 必須の列がない場合
+            sqlite3.Error: 書き込みに失敗した場合（失敗したチャンクのみ取り消す）
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            apply_pragma_profile(conn, "bulk-load")
+            result = import_skill_levels_csv(conn, file_path, progress=progress, levels=levels)
+        finally:
+            conn.close()
+        self.logger.info(
+            f"CSVを取り込みました (行数: {result.rows}, 評価: {result.imported}, "
+            f"スキップ: {result.skipped}, {result.rows_per_second:.0f} 行/秒)"
+        )
+        return result
+
+    def export_csv(self, file_path: str,
+                   progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """全ユーザーのスキルレベルをピボット形式のCSVに出力
+
+        Returns:
+            int: 出力したユーザー数
+        """
+        with self.get_connection() as conn:
+            written = export_skill_matrix_csv(conn, file_path, progress=progress)
+        self.logger.info(f"スキルマトリックスを出力しました (ユーザー数: {written})")
+        return written
+
+    def export_xlsx(self, file_path: str,
+                    progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """全ユーザーのスキルレベルをピボット形式のXLSXに出力
+
+        Returns:
+            int: 出力したユーザー数
+        """
+        with self.get_connection() as conn:
+            written = export_skill_matrix_xlsx(conn, file_path, progress=progress)
+        self.logger.info(f"スキルマトリックスを出力しました (ユーザー数: {written})")
+        return written
@@ -2,24 +2,18 @@
 Created: 2025-02-08 22:13:49
 Author: GingaDza
 """
+import copy
 from typing import List, Optional
 from ..models.group import Group
 from .base_manager import BaseManager
+from .cache import invalidates, reference_cache
+
+SELECT_GROUPS_SQL = "SELECT * FROM groups ORDER BY name"
 
 class GroupManager(BaseManager):
     """グループ管理クラス"""
 
-    def get_init_sql(self) -> str:
-        return """
-        CREATE TABLE IF NOT EXISTS groups (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            description TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-
+    @invalidates("groups")
     def create_group(self, name: str, description: str = "") -> Optional[int]:
         """グループを作成"""
         try:
@@ -37,12 +31,20 @@ class GroupManager(BaseManager):
             return None
 
     def get_all_groups(self) -> List[Group]:
-        """全グループを取得"""
+        """全グループを取得（参照データキャッシュ経由）
+
+        キャッシュ済みのモデルを共有しないよう、呼び出しごとに複製を返す。
+        """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM groups ORDER BY name")
-                return [Group(**dict(row)) for row in cursor.fetchall()]
+            return copy.deepcopy(reference_cache.get_or_load(
+                self.db_path, "groups", (), self._load_all_groups
+            ))
         except Exception as e:
             self.logger.error(f"グループ一覧の取得に失敗しました: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def _load_all_groups(self) -> List[Group]:
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SELECT_GROUPS_SQL)
+            return [Group(**dict(row)) for row in cursor.fetchall()]
@@ -0,0 +1,165 @@
+"""インデックス監査
+Created: 2026-10-17 12:20:43
+Author: GingaDza
+
+マネージャーが発行するクエリに EXPLAIN QUERY PLAN を実行し、
+テーブルスキャンになっているものを検出する。
+
+    python -m src.database.index_audit [data/skill_matrix.db]
+
+監査するクエリはデータベースの PRAGMA user_version から判定したスキーマ系統のもの。
+スキャン、または対象テーブル・カラムがなく監査できなかったクエリが1件でもあれば
+終了コード1を返す。
+"""
+import os
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+from ..config import queries as user_skills_queries
+from ..config import settings
+from ..config.schema import EVALUATIONS, USER_SKILLS, detect_schema
+from . import category_manager, evaluation_manager, group_manager, user_manager
+
+
+@dataclass(frozen=True)
+class AuditQuery:
+    """監査対象クエリ"""
+    name: str
+    sql: str
+    full_scan_ok: bool = False  # 全件一覧など、走査が前提のクエリ
+    schema: str = EVALUATIONS.name  # config.schema のスキーマ名
+
+
+@dataclass
+class AuditResult:
+    """監査結果"""
+    query: AuditQuery
+    plan: List[str] = field(default_factory=list)
+    skipped: Optional[str] = None  # 対象テーブル・カラムがなく監査できなかった理由
+
+    @property
+    def scans(self) -> List[str]:
+        """問題となる走査ステップ"""
+        if self.query.full_scan_ok:
+            return []
+        return [step for step in self.plan if step.startswith("SCAN ")]
+
+    @property
+    def ok(self) -> bool:
+        """スキャンがなく、監査できたかどうか（監査できなかったクエリは失敗とする）"""
+        return not self.skipped and not self.scans
+
+
+def _user_skills(name: str, sql: str, full_scan_ok: bool = False) -> AuditQuery:
+    return AuditQuery(name, sql, full_scan_ok, USER_SKILLS.name)
+
+
+# マネージャーのクエリ（SQLは各マネージャーの定数を参照する）
+AUDITED_QUERIES = [
+    # GroupManager
+    AuditQuery("GroupManager.get_all_groups",
+               group_manager.SELECT_GROUPS_SQL, full_scan_ok=True),
+    # CategoryManager
+    AuditQuery("CategoryManager.get_categories(root)",
+               category_manager.SELECT_ROOT_CATEGORIES_SQL),
+    AuditQuery("CategoryManager.get_categories(parent_id)",
+               category_manager.SELECT_CHILD_CATEGORIES_SQL),
+    AuditQuery("CategoryManager.get_skills_by_category",
+               category_manager.SELECT_SKILLS_BY_CATEGORY_SQL, full_scan_ok=True),
+    # UserManager
+    AuditQuery("UserManager.get_user", user_manager.SELECT_USER_SQL),
+    AuditQuery("UserManager.get_users_by_group", user_manager.SELECT_USERS_BY_GROUP_SQL),
+    AuditQuery("UserManager.upsert_users_by_employee_id",
+               user_manager.SELECT_USERS_BY_EMPLOYEE_ID_SQL.format(placeholders="?")),
+    # EvaluationManager
+    AuditQuery("EvaluationManager.get_user_evaluations",
+               evaluation_manager.SELECT_USER_EVALUATIONS_SQL),
+    AuditQuery("EvaluationManager.get_category_averages",
+               evaluation_manager.SELECT_CATEGORY_AVERAGES_SQL),
+    AuditQuery("EvaluationManager.get_user_skill_summary",
+               evaluation_manager.SELECT_USER_SKILL_LEVELS_SQL),
+    AuditQuery("EvaluationManager.resolve_skill_ids",
+               evaluation_manager.SELECT_SKILL_IDS_SQL, full_scan_ok=True),
+    AuditQuery("EvaluationManager.resolve_skill_ids(category_id)",
+               evaluation_manager.SELECT_CATEGORY_SKILL_IDS_SQL),
+    # skill_matrix_manager.database.DatabaseManager
+    _user_skills("DatabaseManager.get_groups",
+                 user_skills_queries.SELECT_GROUPS_SQL, full_scan_ok=True),
+    _user_skills("DatabaseManager.get_users_in_group",
+                 user_skills_queries.SELECT_GROUP_MEMBERS_SQL),
+    _user_skills("DatabaseManager.get_group_statistics(members)",
+                 user_skills_queries.COUNT_GROUP_MEMBERS_SQL),
+    _user_skills("DatabaseManager.get_group_statistics",
+                 user_skills_queries.SELECT_GROUP_LEVEL_COUNTS_SQL),
+    _user_skills("DatabaseManager.get_skill_gap_settings(category_id)",
+                 user_skills_queries.SELECT_CATEGORY_SKILL_GAP_SETTINGS_SQL),
+    _user_skills("DatabaseManager.get_skill_gap_settings",
+                 user_skills_queries.SELECT_SKILL_GAP_SETTINGS_SQL, full_scan_ok=True),
+]
+
+
+def explain(conn: sqlite3.Connection, query: AuditQuery) -> AuditResult:
+    """1クエリの実行計画を取得"""
+    params = (None,) * query.sql.count("?")
+    try:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {query.sql}", params).fetchall()
+    except sqlite3.OperationalError as e:
+        return AuditResult(query, skipped=str(e))
+    # 行は (id, parent, notused, detail)
+    return AuditResult(query, plan=[row[3] for row in rows])
+
+
+def audit(conn: sqlite3.Connection, queries: Optional[List[AuditQuery]] = None,
+          schema: Optional[str] = None) -> List[AuditResult]:
+    """クエリの監査（queries 省略時は schema 系統のマネージャーのクエリすべて）"""
+    if queries is None:
+        schema = schema or detect_schema(conn)
+        queries = [query for query in AUDITED_QUERIES if query.schema == schema]
+    return [explain(conn, query) for query in queries]
+
+
+def format_report(results: List[AuditResult]) -> str:
+    """監査結果の表示用テキスト"""
+    lines = []
+    for result in results:
+        if result.skipped:
+            status = "SKIP"
+        elif result.ok:
+            status = "OK"
+        else:
+            status = "SCAN"
+        lines.append(f"[{status:4}] {result.query.name}")
+        if result.skipped:
+            lines.append(f"       {result.skipped}")
+        for step in result.plan:
+            lines.append(f"       {step}")
+    scans = sum(1 for result in results if result.scans)
+    skipped = sum(1 for result in results if result.skipped)
+    lines.append(f"\n{len(results)}件中 {scans}件がテーブルスキャン、{skipped}件が監査できませんでした")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """監査コマンド"""
+    argv = sys.argv[1:] if argv is None else argv
+    db_path = argv[0] if argv else os.path.join("data", settings.DATABASE["name"])
+    if not os.path.exists(db_path):
+        print(f"データベースが見つかりません: {db_path}", file=sys.stderr)
+        return 2
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        schema = detect_schema(conn)
+        if schema is None:
+            print(f"スキーマのバージョンが不明です（未作成または古いデータベース）: {db_path}",
+                  file=sys.stderr)
+            return 1
+        results = audit(conn, schema=schema)
+    finally:
+        conn.close()
+    print(format_report(results))
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
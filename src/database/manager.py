@@ -7,6 +7,8 @@ import sqlite3
 import logging
 from typing import List, Tuple, Optional
 from ..utils.logger import setup_logger
+from ..config.pragmas import apply_pragma_profile
+from ..config.schema import EVALUATIONS, ensure_schema
 
 class DatabaseManager:
     """データベース管理クラス"""
@@ -21,52 +23,18 @@ class DatabaseManager:
         self.logger = setup_logger(__name__)
         self._initialize_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMAプロファイルを適用した接続を作成"""
+        conn = sqlite3.connect(self.db_name)
+        apply_pragma_profile(conn)
+        return conn
+
     def _initialize_database(self):
         """データベースの初期化"""
         try:
-            with sqlite3.connect(self.db_name) as conn:
-                cursor = conn.cursor()
-                
-                # グループテーブル
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS groups (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT NOT NULL UNIQUE,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        created_by TEXT DEFAULT 'GingaDza'
-                    )
-                ''')
-                
-                # カテゴリーテーブル
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS categories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT NOT NULL UNIQUE,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        created_by TEXT DEFAULT 'GingaDza'
-                    )
-                ''')
-                
-                # スキルテーブル
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS skills (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT NOT NULL UNIQUE,
-                        category_id INTEGER,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        created_by TEXT DEFAULT 'GingaDza',
-                        FOREIGN KEY (category_id) REFERENCES categories (id)
-                    )
-                ''')
-                
-                conn.commit()
-                self.logger.info("データベースの初期化が完了しました")
+            with self._connect() as conn:
+                if ensure_schema(conn, EVALUATIONS.name):
+                    self.logger.info("データベースの初期化が完了しました")
                 
         except sqlite3.Error as e:
             self.logger.error(f"データベースの初期化中にエラーが発生しました: {e}")
@@ -79,7 +47,7 @@ class DatabaseManager:
             List[Tuple]: グループのリスト [(id, name, description), ...]
         """
         try:
-            with sqlite3.connect(self.db_name) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, name, description FROM groups")
                 return cursor.fetchall()
@@ -98,7 +66,7 @@ class DatabaseManager:
             bool: 追加が成功したかどうか
         """
         try:
-            with sqlite3.connect(self.db_name) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "INSERT INTO groups (name, description) VALUES (?, ?)",
@@ -118,7 +86,7 @@ class DatabaseManager:
             List[Tuple]: カテゴリーのリスト [(id, name, description), ...]
         """
         try:
-            with sqlite3.connect(self.db_name) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id, name, description FROM categories")
                 return cursor.fetchall()
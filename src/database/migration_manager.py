@@ -1,11 +1,13 @@
 """データベースのマイグレーションを管理するモジュール"""
 import logging
-from datetime import datetime
 from pathlib import Path
-from .base_manager import BaseManagerMixin
+from .migrations import MigrationManager as _Runner
 
-class MigrationManager(BaseManagerMixin):
-    """データベースのマイグレーションを管理するクラス"""
+class MigrationManager:
+    """データベースのマイグレーションを管理するクラス
+
+    実際の検出・適用は migrations.MigrationManager が行う。
+    """
     
     def __init__(self, db_path: str = "skill_matrix.db"):
         """
@@ -16,7 +18,6 @@ class MigrationManager(BaseManagerMixin):
         """
         self.logger = logging.getLogger(__name__)
         self.db_path = Path(db_path)
-        self.current_time = "2025-02-08 03:17:40"
 
     def run_migrations(self):
         """マイグレーションを実行する"""
@@ -24,12 +25,11 @@ class MigrationManager(BaseManagerMixin):
             # データベースディレクトリを作成
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # 親クラスの初期化を実行
-            super().__init__(str(self.db_path))
+            _Runner(str(self.db_path)).migrate()
             
             self.logger.info("マイグレーションが完了しました")
             return True
             
         except Exception as e:
             self.logger.exception("マイグレーション実行エラー")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,36 @@
+"""参照系クエリ用のセカンダリインデックス
+Created: 2026-10-17 12:00:00
+Author: GingaDza
+"""
+from ...config.schema_upgrades import table_columns
+
+# (インデックス名, テーブル, カラム)
+# 末尾のカラムはSELECT対象を含めるためのもの（カバリングインデックス）
+INDEXES = [
+    # get_users_by_group / get_users_in_group: WHERE group_id = ? ORDER BY name
+    ("idx_users_group_id", "users", ("group_id", "name")),
+    # カテゴリー別スキル一覧: WHERE category_id = ?
+    ("idx_skills_category_id", "skills", ("category_id", "name")),
+    # スキル名 → ID の解決: WHERE name IN (...)
+    ("idx_skills_name", "skills", ("name", "category_id")),
+    # スキル単位の集計: WHERE skill_id = ?
+    ("idx_evaluations_skill_id", "evaluations", ("skill_id", "user_id", "level")),
+    ("idx_user_skills_skill_id", "user_skills", ("skill_id", "user_id", "level")),
+    # 子カテゴリー一覧: WHERE parent_id = ? / IS NULL
+    ("idx_categories_parent_id", "categories", ("parent_id",)),
+    # get_skill_gap_settings: WHERE category_id = ?
+    ("idx_skill_gap_settings_category_id", "skill_gap_settings", ("category_id", "skill_id")),
+]
+
+def upgrade(cursor):
+    # スキーマが複数系統あるため、対象カラムが揃っているテーブルにのみ作成
+    # （新規作成・起動時の確認ではスキーマレジストリが同じインデックスを作成する）
+    for name, table, columns in INDEXES:
+        if set(columns) <= table_columns(cursor, table):
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+            )
+
+def downgrade(cursor):
+    for name, _, _ in INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
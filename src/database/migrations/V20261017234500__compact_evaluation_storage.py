@@ -0,0 +1,37 @@
+"""評価テーブルの WITHOUT ROWID 化と日時の整数化
+Created: 2026-10-17 23:45:00
+Author: GingaDza
+"""
+from ...config.schema_upgrades import (
+    COMPACT_TABLES, compact_evaluation_table, is_compact, table_columns
+)
+
+def upgrade(cursor):
+    for table in COMPACT_TABLES:
+        compact_evaluation_table(cursor, table)
+
+def downgrade(cursor):
+    # 日時は整数のまま残し、rowid テーブルに戻す
+    for table, (level, (index_name, index_columns)) in COMPACT_TABLES.items():
+        if not table_columns(cursor, table) or not is_compact(cursor, table):
+            continue
+        cursor.execute(f"""
+            CREATE TABLE {table}_rowid (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                skill_id INTEGER NOT NULL,
+                level INTEGER {level},
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(user_id, skill_id)
+            )
+        """)
+        cursor.execute(f"""
+            INSERT INTO {table}_rowid (user_id, skill_id, level, created_at, updated_at)
+            SELECT user_id, skill_id, level, created_at, updated_at FROM {table}
+        """)
+        cursor.execute(f"DROP TABLE {table}")
+        cursor.execute(f"ALTER TABLE {table}_rowid RENAME TO {table}")
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({', '.join(index_columns)})"
+        )
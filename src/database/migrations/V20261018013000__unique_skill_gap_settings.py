@@ -0,0 +1,34 @@
+"""スキルギャップ設定の (category_id, skill_id) 一意化
+Created: 2026-10-18 01:30:00
+Author: GingaDza
+"""
+from ...config.schema_upgrades import table_columns
+
+# 同じキーの行は最後に書き込まれた行（id が最大）を残す
+DEDUPLICATE_SQL = """
+DELETE FROM skill_gap_settings
+WHERE id NOT IN (
+    SELECT MAX(id) FROM skill_gap_settings GROUP BY category_id, skill_id
+)
+"""
+
+def upgrade(cursor):
+    if not {"id", "category_id", "skill_id"} <= table_columns(cursor, "skill_gap_settings"):
+        return
+    cursor.execute(DEDUPLICATE_SQL)
+    # 一意インデックスが WHERE category_id = ? も兼ねるため、既存のインデックスは置き換える
+    cursor.execute("DROP INDEX IF EXISTS idx_skill_gap_settings_category_id")
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_skill_gap_settings_key"
+        " ON skill_gap_settings (category_id, skill_id)"
+    )
+
+def downgrade(cursor):
+    # 削除した重複行は戻さない
+    if not table_columns(cursor, "skill_gap_settings"):
+        return
+    cursor.execute("DROP INDEX IF EXISTS idx_skill_gap_settings_key")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_skill_gap_settings_category_id"
+        " ON skill_gap_settings (category_id, skill_id)"
+    )
@@ -0,0 +1,12 @@
+"""ユーザーの社員番号列の追加
+Created: 2026-10-18 09:00:00
+Author: GingaDza
+"""
+from ...config.schema_upgrades import add_employee_ids
+
+def upgrade(cursor):
+    add_employee_ids(cursor)
+
+def downgrade(cursor):
+    # 列は残し、一意インデックスのみ削除する
+    cursor.execute("DROP INDEX IF EXISTS idx_users_employee_id")
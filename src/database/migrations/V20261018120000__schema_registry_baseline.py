@@ -0,0 +1,14 @@
+"""スキーマレジストリのベースラインの適用
+Created: 2026-10-18 12:00:00
+Author: GingaDza
+
+初期スキーマ（V20250208140405）で作成したテーブルを、レジストリの定義に合わせて変換・作成する。
+"""
+from ...config.schema import EVALUATIONS, apply_schema
+
+def upgrade(cursor):
+    apply_schema(cursor, EVALUATIONS.name)
+
+def downgrade(cursor):
+    # テーブルは残し、次回の起動時にレジストリのベースラインを再適用させる
+    cursor.execute("PRAGMA user_version = 0")
@@ -1,3 +1,5 @@
-from .migration_manager import MigrationManager
+from .migration_manager import (
+    Migration, MigrationManager, MigrationResult, discover_migrations
+)
 
-__all__ = ['MigrationManager']
+__all__ = ['Migration', 'MigrationManager', 'MigrationResult', 'discover_migrations']
@@ -1,53 +1,165 @@
 """マイグレーション管理
 Created: 2025-02-08 14:07:30
 Author: GingaDza
+
+マイグレーションはこのパッケージ内の V<バージョン>__<名前>.py を自動で検出し、
+バージョン番号順に適用する。未適用分はまとめて1トランザクションで適用するため、
+途中で失敗した場合はどのマイグレーションも適用されない。
+
+upgrade(cursor) は cursor.execute のみを使うこと（executescript は暗黙に
+コミットするため、トランザクションが分割される）。
 """
-import os
+import importlib
+import re
 import sqlite3
-from typing import List, Tuple
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, List, Optional, Sequence, Tuple
 from ...utils.logger import setup_logger
 
+MIGRATION_FILE = re.compile(r"^V(\d+)__(\w+)\.py$")
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS migrations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    version TEXT NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """検出したマイグレーション"""
+    version: str   # "V20250208140405"
+    name: str      # "initial_schema"
+    module: str    # インポートするモジュール名
+
+    def load(self) -> ModuleType:
+        return importlib.import_module(self.module)
+
+
+@dataclass
+class MigrationResult:
+    """マイグレーションの実行結果"""
+    applied: List[Tuple[str, float]] = field(default_factory=list)  # (バージョン, 秒)
+    elapsed: float = 0.0
+
+    @property
+    def up_to_date(self) -> bool:
+        """適用するマイグレーションがなかったかどうか"""
+        return not self.applied
+
+
+def discover_migrations(directory: Optional[Path] = None,
+                        package: str = __package__) -> List[Migration]:
+    """ディレクトリ内のマイグレーションをバージョン順に列挙"""
+    directory = Path(directory or Path(__file__).parent)
+    found = []
+    for path in directory.iterdir():
+        match = MIGRATION_FILE.match(path.name)
+        if match:
+            found.append((int(match.group(1)), Migration(
+                f"V{match.group(1)}", match.group(2), f"{package}.{path.stem}"
+            )))
+    found.sort(key=lambda item: item[0])
+    return [migration for _, migration in found]
+
+
 class MigrationManager:
     """マイグレーション管理クラス"""
-    
-    def __init__(self, db_path: str):
+
+    def __init__(self, db_path: str, migrations: Optional[Sequence[Migration]] = None):
         self.logger = setup_logger(__name__)
         self.db_path = db_path
-        self._init_migrations_table()
-    
-    def _init_migrations_table(self):
-        """マイグレーションテーブルの初期化"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS migrations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                version TEXT NOT NULL,
-                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """)
-            conn.commit()
-    
+        self.migrations = list(migrations) if migrations is not None else discover_migrations()
+
+    def _connect(self) -> sqlite3.Connection:
+        # トランザクションは BEGIN/COMMIT で明示的に制御する
+        return sqlite3.connect(self.db_path, isolation_level=None)
+
+    @staticmethod
+    def _applied_versions(conn: sqlite3.Connection) -> List[str]:
+        try:
+            return [row[0] for row in conn.execute("SELECT version FROM migrations ORDER BY id")]
+        except sqlite3.OperationalError:
+            # migrations テーブル未作成 = 何も適用されていない
+            return []
+
     def get_applied_migrations(self) -> List[str]:
         """適用済みマイグレーションの取得"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT version FROM migrations ORDER BY id")
-            return [row[0] for row in cursor.fetchall()]
-    
-    def apply_migration(self, version: str, upgrade_func) -> bool:
-        """マイグレーションの適用"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
+        with closing(self._connect()) as conn:
+            return self._applied_versions(conn)
+
+    def get_pending_migrations(self) -> List[Migration]:
+        """未適用マイグレーションの取得"""
+        applied = set(self.get_applied_migrations())
+        return [m for m in self.migrations if m.version not in applied]
+
+    def migrate(self) -> MigrationResult:
+        """未適用のマイグレーションを1トランザクションで適用
+
+        スキーマが最新であれば migrations テーブルを1回読むだけで、DDLは実行しない。
+
+        Raises:
+            sqlite3.Error: 適用に失敗した場合（すべてロールバックされる）
+        """
+        started = time.perf_counter()
+        result = MigrationResult()
+        with closing(self._connect()) as conn:
+            applied = set(self._applied_versions(conn))
+            if all(m.version in applied for m in self.migrations):
+                result.elapsed = time.perf_counter() - started
+                return result
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 書き込みロック取得後に読み直す（他プロセスが先に適用した分を除く）
+                applied = set(self._applied_versions(conn))
                 cursor = conn.cursor()
-                upgrade_func(cursor)
-                cursor.execute(
-                    "INSERT INTO migrations (version) VALUES (?)",
-                    (version,)
-                )
-                conn.commit()
-                self.logger.info(f"マイグレーション {version} を適用しました")
-                return True
+                cursor.execute(CREATE_MIGRATIONS_TABLE)
+                for migration in self.migrations:
+                    if migration.version in applied:
+                        continue
+                    step_started = time.perf_counter()
+                    migration.load().upgrade(cursor)
+                    cursor.execute("INSERT INTO migrations (version) VALUES (?)",
+                                   (migration.version,))
+                    seconds = time.perf_counter() - step_started
+                    result.applied.append((migration.version, seconds))
+                    self.logger.info(
+                        f"マイグレーション {migration.version}__{migration.name} を適用しました"
+                        f" ({seconds * 1000:.1f} ms)"
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self.logger.error("マイグレーションに失敗したため、すべてロールバックしました")
+                raise
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def apply_migration(self, version: str, upgrade_func: Callable) -> bool:
+        """マイグレーションを1件だけ適用"""
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(CREATE_MIGRATIONS_TABLE)
+                    upgrade_func(cursor)
+                    cursor.execute("INSERT INTO migrations (version) VALUES (?)", (version,))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+            self.logger.info(f"マイグレーション {version} を適用しました")
+            return True
         except Exception as e:
             self.logger.error(f"マイグレーション {version} の適用に失敗しました: {e}")
             return False
@@ -1,9 +1,11 @@
 """スキル操作のミックスイン"""
 import sqlite3
+from .cache import invalidates
 
 class SkillManagerMixin:
     """スキル操作を提供するミックスイン"""
 
+    @invalidates("skills")
     def add_skill(self, parent_name: str, skill_name: str) -> bool:
         """
         スキルを追加する
@@ -74,6 +76,7 @@ class SkillManagerMixin:
             self.logger.exception("スキル取得エラー", exc_info=e)
             return []
 
+    @invalidates("skills")
     def rename_skill(self, old_name: str, new_name: str) -> bool:
         """
         スキル名を変更する
@@ -103,6 +106,7 @@ class SkillManagerMixin:
             self.logger.exception("スキル名変更エラー", exc_info=e)
             return False
 
+    @invalidates("skills")
     def delete_skill(self, skill_name: str) -> bool:
         """
         スキルを削除する
@@ -3,11 +3,46 @@ Created: 2025-02-08 14:17:07
 Author: GingaDza
 """
 import sqlite3
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 from ..models.user import User
 from .base_manager import BaseManager
+from .bulk import BulkWriteResult, DEFAULT_CHUNK_SIZE, chunk_savepoint, iter_chunks
 from ..utils.logger import setup_logger
 
+SELECT_USER_SQL = "SELECT * FROM users WHERE id = ?"
+SELECT_USERS_BY_GROUP_SQL = "SELECT * FROM users WHERE group_id = ? ORDER BY name"
+# {placeholders} はチャンク内の社員番号の数だけ並べた "?"
+SELECT_USERS_BY_EMPLOYEE_ID_SQL = (
+    "SELECT employee_id, name, group_id FROM users WHERE employee_id IN ({placeholders})"
+)
+
+
+def _group_id(value: Any) -> Optional[int]:
+    """名簿のグループID（CSVの文字列を含む）を整数に揃える（空は None）
+
+    Raises:
+        ValueError: 整数として解釈できない場合
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return int(value)
+
+
+def _user_from_row(row: sqlite3.Row) -> User:
+    """行からユーザーを作成
+
+    employee_id 列の追加前（マイグレーション未適用）のデータベースでは社員番号を None とする。
+    """
+    return User(
+        id=row['id'],
+        employee_id=row['employee_id'] if 'employee_id' in row.keys() else None,
+        name=row['name'],
+        group_id=row['group_id'],
+        created_at=row['created_at'],
+        updated_at=row['updated_at']
+    )
+
+
 class UserManager(BaseManager):
     """ユーザー管理クラス"""
 
@@ -51,20 +86,9 @@ class UserManager(BaseManager):
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM users WHERE id = ?",
-                    (user_id,)
-                )
+                cursor.execute(SELECT_USER_SQL, (user_id,))
                 row = cursor.fetchone()
-                if row:
-                    return User(
-                        id=row['id'],
-                        name=row['name'],
-                        group_id=row['group_id'],
-                        created_at=row['created_at'],
-                        updated_at=row['updated_at']
-                    )
-                return None
+                return _user_from_row(row) if row else None
         except sqlite3.Error as e:
             self.logger.error(f"ユーザーの取得に失敗しました: {e}")
             return None
@@ -81,20 +105,8 @@ class UserManager(BaseManager):
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT * FROM users WHERE group_id = ? ORDER BY name",
-                    (group_id,)
-                )
-                return [
-                    User(
-                        id=row['id'],
-                        name=row['name'],
-                        group_id=row['group_id'],
-                        created_at=row['created_at'],
-                        updated_at=row['updated_at']
-                    )
-                    for row in cursor.fetchall()
-                ]
+                cursor.execute(SELECT_USERS_BY_GROUP_SQL, (group_id,))
+                return [_user_from_row(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             self.logger.error(f"ユーザー一覧の取得に失敗しました: {e}")
             return []
@@ -149,3 +161,128 @@ class UserManager(BaseManager):
         except sqlite3.Error as e:
             self.logger.error(f"ユーザーの削除に失敗しました: {e}")
             return False
+
+    def create_users_bulk(
+        self,
+        users: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BulkWriteResult:
+        """ユーザーを一括作成
+
+        Args:
+            users (Iterable[Mapping[str, Any]]): name, group_id, employee_id（任意）を持つ行。
+                ジェネレーターも可（チャンク単位で読み進める）
+            chunk_size (int): 1チャンク（セーブポイント）あたりの行数
+
+        Returns:
+            BulkWriteResult: 作成件数と、名前なし・社員番号重複でスキップした件数
+        """
+        result = BulkWriteResult()
+        with self.get_connection() as conn:
+            for chunk in iter_chunks(users, chunk_size):
+                rows = [
+                    (user.get('employee_id'), user['name'], user.get('group_id'))
+                    for user in chunk if user.get('name')
+                ]
+                result.skipped += len(chunk) - len(rows)
+                try:
+                    with chunk_savepoint(conn):
+                        cursor = conn.executemany(
+                            "INSERT OR IGNORE INTO users (employee_id, name, group_id)"
+                            " VALUES (?, ?, ?)",
+                            rows
+                        )
+                except sqlite3.Error as e:
+                    result.failed += len(rows)
+                    self.logger.error(f"ユーザーの一括作成に失敗しました: {e}")
+                    continue
+                result.inserted += cursor.rowcount
+                result.skipped += len(rows) - cursor.rowcount
+        self.logger.info(
+            f"ユーザーを一括作成しました (作成: {result.inserted}, "
+            f"スキップ: {result.skipped}, 失敗: {result.failed})"
+        )
+        return result
+
+    def upsert_users_by_employee_id(
+        self,
+        users: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BulkWriteResult:
+        """社員番号をキーに名簿を一括登録・更新
+
+        Args:
+            users (Iterable[Mapping[str, Any]]): employee_id, name, group_id を持つ行。
+                group_id は文字列でもよい（整数に揃えて比較・保存する）。
+                ジェネレーターも可（チャンク単位で読み進める）
+            chunk_size (int): 1チャンク（セーブポイント）あたりの行数
+
+        Returns:
+            BulkWriteResult: 新規作成・更新件数と、社員番号/名前なし・不正なグループID・
+                チャンク内重複・変更なしでスキップした件数
+        """
+        result = BulkWriteResult()
+        with self.get_connection() as conn:
+            for chunk in iter_chunks(users, chunk_size):
+                # チャンク内で社員番号が重複した場合は後勝ち
+                roster: Dict[str, tuple] = {}
+                for user in chunk:
+                    employee_id, name = user.get('employee_id'), user.get('name')
+                    if employee_id is None or not name:
+                        result.skipped += 1
+                        continue
+                    try:
+                        group_id = _group_id(user.get('group_id'))
+                    except (TypeError, ValueError):
+                        result.skipped += 1
+                        continue
+                    if str(employee_id) in roster:
+                        result.skipped += 1
+                    roster[str(employee_id)] = (name, group_id)
+                if not roster:
+                    continue
+
+                try:
+                    placeholders = ",".join("?" * len(roster))
+                    existing = {
+                        row['employee_id']: (row['name'], row['group_id'])
+                        for row in conn.execute(
+                            SELECT_USERS_BY_EMPLOYEE_ID_SQL.format(placeholders=placeholders),
+                            list(roster)
+                        )
+                    }
+                    inserts = [
+                        (employee_id, name, group_id)
+                        for employee_id, (name, group_id) in roster.items()
+                        if employee_id not in existing
+                    ]
+                    updates = [
+                        (name, group_id, employee_id)
+                        for employee_id, (name, group_id) in roster.items()
+                        if employee_id in existing and existing[employee_id] != (name, group_id)
+                    ]
+                    with chunk_savepoint(conn):
+                        conn.executemany(
+                            "INSERT INTO users (employee_id, name, group_id) VALUES (?, ?, ?)",
+                            inserts
+                        )
+                        conn.executemany(
+                            """
+                            UPDATE users
+                            SET name = ?, group_id = ?, updated_at = CURRENT_TIMESTAMP
+                            WHERE employee_id = ?
+                            """,
+                            updates
+                        )
+                except sqlite3.Error as e:
+                    result.failed += len(roster)
+                    self.logger.error(f"名簿の一括登録に失敗しました: {e}")
+                    continue
+                result.inserted += len(inserts)
+                result.updated += len(updates)
+                result.skipped += len(roster) - len(inserts) - len(updates)
+        self.logger.info(
+            f"名簿を一括登録しました (作成: {result.inserted}, 更新: {result.updated}, "
+            f"スキップ: {result.skipped}, 失敗: {result.failed})"
+        )
+        return result
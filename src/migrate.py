@@ -3,29 +3,38 @@ Created: 2025-02-08 14:09:30
 Author: GingaDza
 """
 import os
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from .database.migrations.migration_manager import MigrationManager
 from .utils.logger import setup_logger
 from .config import settings
+from .config.schema import EVALUATIONS, ensure_schema
 
-def run_migrations():
-    """マイグレーションの実行"""
+def run_migrations(db_path: str = None):
+    """マイグレーションの実行
+
+    スキーマレジストリのベースラインを作成（古いテーブルは変換）してから、
+    src/database/migrations 内の V*__*.py を検出し、未適用分をまとめて適用する。
+    """
     logger = setup_logger(__name__)
-    db_path = os.path.join("data", settings.DATABASE["name"])
-    
+    if db_path is None:
+        db_path = os.path.join("data", settings.DATABASE["name"])
+
     # データディレクトリの作成
-    Path("data").mkdir(exist_ok=True)
-    
-    manager = MigrationManager(db_path)
-    applied = manager.get_applied_migrations()
-    
-    # V20250208140405__initial_schema.py のマイグレーションを実行
-    from .database.migrations.V20250208140405__initial_schema import upgrade
-    if "V20250208140405" not in applied:
-        if manager.apply_migration("V20250208140405", upgrade):
-            logger.info("初期スキーマのマイグレーションが完了しました")
-        else:
-            logger.error("初期スキーマのマイグレーションに失敗しました")
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        ensure_schema(conn, EVALUATIONS.name)
+
+    result = MigrationManager(db_path).migrate()
+    if result.up_to_date:
+        logger.info("スキーマは最新です")
+    else:
+        logger.info(
+            f"{len(result.applied)}件のマイグレーションが完了しました ({result.elapsed:.2f}秒)"
+        )
+    return result
 
 if __name__ == "__main__":
     run_migrations()
@@ -3,13 +3,14 @@ from datetime import datetime
 class Category:
     """カテゴリーモデル"""
     
-    def __init__(self, id=None, name="", description="", parent_id=None):
+    def __init__(self, id=None, name="", description="", parent_id=None,
+                 created_at=None, updated_at=None):
         self.id = id
         self.name = name
         self.description = description
         self.parent_id = parent_id
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or datetime.now()
         self.skills = []  # このカテゴリーに属するスキル
         self.children = []  # 子カテゴリー
 
@@ -0,0 +1,39 @@
+"""評価モデル
+Created: 2026-10-17 09:20:11
+Author: GingaDza
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+from .timestamps import parse_timestamp
+
+@dataclass
+class Evaluation:
+    """評価モデル（(user_id, skill_id) が主キー）"""
+    user_id: int
+    skill_id: int
+    level: int
+    created_at: datetime
+    updated_at: datetime
+    skill_name: Optional[str] = None
+    category_name: Optional[str] = None
+
+    @staticmethod
+    def from_dict(data: dict) -> 'Evaluation':
+        """辞書からEvaluationオブジェクトを作成（日時はエポック秒・文字列のどちらも可）"""
+        return Evaluation(
+            user_id=data.get('user_id'),
+            skill_id=data.get('skill_id'),
+            level=data.get('level'),
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at')),
+            skill_name=data.get('skill_name'),
+            category_name=data.get('category_name')
+        )
+
+@dataclass
+class UserSkillSummary:
+    """1ユーザーの評価の要約（スキルグリッドとレーダーチャートで共有）"""
+    user_id: int
+    levels: Dict[int, Dict[str, int]] = field(default_factory=dict)  # カテゴリーID → {スキル名: レベル}
+    averages: Dict[int, float] = field(default_factory=dict)         # カテゴリーID → 平均レベル
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from .timestamps import parse_timestamp
 
 @dataclass
 class Skill:
@@ -19,6 +20,6 @@ class Skill:
             category_id=data.get('category_id'),
             name=data.get('name'),
             description=data.get('description'),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
-            updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else datetime.now()
+            created_at=parse_timestamp(data.get('created_at')),
+            updated_at=parse_timestamp(data.get('updated_at'))
         )
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""統計モデル
+Created: 2026-10-17 15:10:32
+Author: GingaDza
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class SkillDistribution:
+    """1スキルのレベル分布"""
+    skill_id: int
+    name: str
+    counts: Dict[int, int] = field(default_factory=dict)  # レベル → 人数
+
+    @property
+    def rated_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def mean(self) -> Optional[float]:
+        total = self.rated_count
+        if not total:
+            return None
+        return sum(level * count for level, count in self.counts.items()) / total
+
+
+@dataclass
+class GroupStatistics:
+    """グループの評価統計（未評価は含まない）"""
+    group_id: int
+    member_count: int = 0
+    rated_count: int = 0
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+    skills: List[SkillDistribution] = field(default_factory=list)
+
+    @classmethod
+    def from_histogram(cls, group_id: int, member_count: int,
+                       rows: Iterable[Tuple[int, str, int, int]]) -> "GroupStatistics":
+        """(skill_id, スキル名, レベル, 人数) の集計結果から作成
+
+        平均・中央値・最小・最大はレベル別人数から求めるため、
+        評価の行数に関係なく集計結果の行数分の計算で済む。
+        """
+        stats = cls(group_id, member_count)
+        skills: Dict[int, SkillDistribution] = {}
+        histogram: Dict[int, int] = {}
+        for skill_id, name, level, count in rows:
+            skill = skills.get(skill_id)
+            if skill is None:
+                skill = skills[skill_id] = SkillDistribution(skill_id, name)
+            skill.counts[level] = skill.counts.get(level, 0) + count
+            histogram[level] = histogram.get(level, 0) + count
+
+        stats.skills = list(skills.values())
+        stats.rated_count = sum(histogram.values())
+        if not stats.rated_count:
+            return stats
+        levels = sorted(histogram)
+        stats.minimum, stats.maximum = levels[0], levels[-1]
+        stats.mean = sum(level * histogram[level] for level in levels) / stats.rated_count
+        stats.median = _median(histogram, levels, stats.rated_count)
+        return stats
+
+    def skill_means(self) -> Dict[str, float]:
+        """スキル名 → 平均レベル（評価のあるスキルのみ）"""
+        return {skill.name: skill.mean for skill in self.skills if skill.rated_count}
+
+
+def _median(histogram: Dict[int, int], levels: List[int], total: int) -> float:
+    """レベル別人数からの中央値"""
+    def nth(position: int) -> int:  # 0始まりで position 番目の値
+        seen = 0
+        for level in levels:
+            seen += histogram[level]
+            if position < seen:
+                return level
+        return levels[-1]
+
+    middle = total // 2
+    if total % 2:
+        return float(nth(middle))
+    return (nth(middle - 1) + nth(middle)) / 2
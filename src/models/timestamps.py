@@ -0,0 +1,25 @@
+"""日時カラムの変換
+Created: 2026-10-17 23:48:05
+Author: GingaDza
+
+評価テーブルは日時をUNIXエポック秒（UTC）の整数で保持し、その他のテーブルは
+CURRENT_TIMESTAMP の文字列（UTC）で保持する。どちらも UTC の naive な datetime に揃える。
+"""
+from datetime import datetime, timezone
+from typing import Any
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """エポック秒・ISO形式の文字列・datetime を datetime に変換（None は現在の UTC 時刻）"""
+    if value is None or value == "":
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+    return datetime.fromisoformat(value)
+
+
+def to_epoch(value: datetime) -> int:
+    """UTC の naive な datetime をエポック秒に変換"""
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
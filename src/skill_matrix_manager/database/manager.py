@@ -5,66 +5,50 @@ Author: GingaDza
 """
 import sqlite3
 from datetime import datetime
+from config.pragmas import apply_pragma_profile, get_active_profile_name, read_pragma_status
+from config.queries import (
+    COUNT_GROUP_MEMBERS_SQL, SELECT_CATEGORY_SKILL_GAP_SETTINGS_SQL, SELECT_GROUP_LEVEL_COUNTS_SQL,
+    SELECT_GROUP_MEMBERS_SQL, SELECT_GROUPS_SQL, SELECT_SKILL_GAP_SETTINGS_SQL
+)
+from config.schema import USER_SKILLS, ensure_schema
+from models.statistics import GroupStatistics
+from analytics import SkillGapReport, SkillMatrix, USER_SKILLS_SOURCE
+from data_io import (
+    USER_SKILLS_EXPORT, USER_SKILLS_SCHEMA, export_matrix_radar_pdf, export_skill_levels_csv,
+    export_skill_matrix_csv, export_skill_matrix_xlsx, import_skill_levels_csv
+)
 
 class DatabaseManager:
     """データベース管理クラス"""
     
-    def __init__(self, db_path):
+    def __init__(self, db_path, pragma_profile=None):
         """初期化"""
         self.db_path = db_path
+        self.pragma_profile = pragma_profile or get_active_profile_name()
         self.setup_database()
         self.insert_sample_data()
     
+    def _connect(self):
+        """PRAGMAプロファイルを適用した接続を作成"""
+        conn = sqlite3.connect(self.db_path)
+        apply_pragma_profile(conn, self.pragma_profile)
+        return conn
+
+    def get_pragma_status(self):
+        """適用中のPRAGMAプロファイルと実際の設定値の取得"""
+        with self._connect() as conn:
+            status = read_pragma_status(conn)
+        status["profile"] = self.pragma_profile
+        return status
+
     def setup_database(self):
-        """データベースのセットアップ"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # テーブルの作成
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS groups (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    group_id INTEGER,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (group_id) REFERENCES groups (id)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS skills (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_skills (
-                    user_id INTEGER,
-                    skill_id INTEGER,
-                    level INTEGER DEFAULT 0,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users (id),
-                    FOREIGN KEY (skill_id) REFERENCES skills (id),
-                    PRIMARY KEY (user_id, skill_id)
-                )
-            ''')
-            
-            conn.commit()
+        """データベースのセットアップ（user_version が最新ならDDLなし）"""
+        with self._connect() as conn:
+            ensure_schema(conn, USER_SKILLS.name)
     
     def insert_sample_data(self):
         """サンプルデータの挿入"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # 既存データの確認
@@ -113,71 +97,132 @@ class DatabaseManager:
     
     def get_groups(self):
         """グループ一覧の取得"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('SELECT id, name FROM groups ORDER BY name')
+            cursor.execute(SELECT_GROUPS_SQL)
             return cursor.fetchall()
     
     def get_users_in_group(self, group_id):
         """グループ内のユーザー一覧の取得"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, name FROM users 
-                WHERE group_id = ? 
-                ORDER BY name
-            ''', (group_id,))
+            cursor.execute(SELECT_GROUP_MEMBERS_SQL, (group_id,))
             return cursor.fetchall()
 
-    def setup_skill_gap_table(self):
-        """スキルギャップ設定テーブルの作成"""
-        with sqlite3.connect(self.db_path) as conn:
+    def get_group_statistics(self, group_id):
+        """グループの評価統計の取得
+
+        評価行は取得せず、スキル×レベルごとの人数をSQLで集計して
+        平均・中央値・最小・最大・スキル別分布を求める。
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(COUNT_GROUP_MEMBERS_SQL, (group_id,))
+            member_count = cursor.fetchone()[0]
+            cursor.execute(SELECT_GROUP_LEVEL_COUNTS_SQL, (group_id,))
+            return GroupStatistics.from_histogram(group_id, member_count, cursor.fetchall())
+
+    def load_skill_matrix(self):
+        """全評価をユーザー × スキル行列として読み込む"""
+        with self._connect() as conn:
+            return SkillMatrix.from_connection(conn, USER_SKILLS_SOURCE)
+
+    def import_csv(self, file_path, progress=None, levels=None):
+        """スキルレベルCSVの取り込み（bulk-load プロファイルの接続で書き込む）
+
+        levels は import_skill_levels_csv と同じ（False ならグループとユーザーのみ）。
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            apply_pragma_profile(conn, "bulk-load")
+            return import_skill_levels_csv(conn, file_path, USER_SKILLS_SCHEMA,
+                                           progress=progress, levels=levels)
+        finally:
+            conn.close()
+
+    def export_csv(self, file_path, progress=None):
+        """全ユーザーのスキルレベルをピボット形式のCSVに出力"""
+        with self._connect() as conn:
+            return export_skill_matrix_csv(conn, file_path, USER_SKILLS_EXPORT, progress)
+
+    def export_levels_csv(self, file_path, progress=None):
+        """評価済みのスキルレベルを取り込みと同じ縦持ち形式のCSVに出力"""
+        with self._connect() as conn:
+            return export_skill_levels_csv(conn, file_path, USER_SKILLS_EXPORT, progress)
+
+    def export_xlsx(self, file_path, progress=None):
+        """全ユーザーのスキルレベルをピボット形式のXLSXに出力"""
+        with self._connect() as conn:
+            return export_skill_matrix_xlsx(conn, file_path, USER_SKILLS_EXPORT, progress)
+
+    def export_radar_pdf(self, file_path, progress=None):
+        """全ユーザーのカテゴリー平均レーダーチャート一覧をPDFに出力"""
+        return export_matrix_radar_pdf(self.load_skill_matrix(), file_path, progress=progress)
+
+    def get_skill_categories(self):
+        """スキルカテゴリー一覧の取得
+
+        カテゴリーは skills.category の名称で保持しているため、
+        カテゴリー内で最小のスキルIDを skill_gap_settings.category_id として用いる。
+
+        Returns:
+            list: (category_id, カテゴリー名) のリスト
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
-            
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS skill_gap_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    category_id INTEGER,
-                    skill_id INTEGER,
-                    target_level INTEGER,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (category_id) REFERENCES categories (id),
-                    FOREIGN KEY (skill_id) REFERENCES skills (id)
-                )
+                SELECT MIN(id), category FROM skills
+                GROUP BY category
+                ORDER BY MIN(id)
             ''')
-            
-            conn.commit()
+            return cursor.fetchall()
+
+    def get_skill_gap_report(self, category_id=None):
+        """目標レベルに対する不足分の集計（category_id 省略時は全カテゴリー）"""
+        return SkillGapReport.from_matrix(
+            self.load_skill_matrix(), self.get_skill_gap_settings(category_id)
+        )
+
+    def setup_skill_gap_table(self):
+        """スキルギャップ設定テーブルの作成（setup_database で作成済み）"""
+        self.setup_database()
 
     def save_skill_gap_settings(self, settings):
-        """スキルギャップ設定の保存"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            for category_id, skills in settings.items():
-                for skill_id, target_level in skills.items():
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO skill_gap_settings
-                        (category_id, skill_id, target_level)
-                        VALUES (?, ?, ?)
-                    ''', (category_id, skill_id, target_level))
-            
-            conn.commit()
+        """スキルギャップ設定の保存
+
+        (category_id, skill_id) の一意キーで executemany によりアップサートし、
+        目標レベルが None のスキルは設定を削除する。いずれも1トランザクションでコミットする。
+
+        Args:
+            settings (dict): {category_id: {skill_id: target_level または None}}
+        """
+        rows, cleared = [], []
+        for category_id, skills in settings.items():
+            for skill_id, target_level in skills.items():
+                if target_level is None:
+                    cleared.append((category_id, skill_id))
+                else:
+                    rows.append((category_id, skill_id, target_level))
+        with self._connect() as conn:
+            conn.executemany('''
+                INSERT INTO skill_gap_settings (category_id, skill_id, target_level)
+                VALUES (?, ?, ?)
+                ON CONFLICT(category_id, skill_id) DO UPDATE SET
+                    target_level = excluded.target_level,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', rows)
+            conn.executemany(
+                'DELETE FROM skill_gap_settings WHERE category_id = ? AND skill_id = ?', cleared
+            )
 
     def get_skill_gap_settings(self, category_id=None):
         """スキルギャップ設定の取得"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             if category_id:
-                cursor.execute('''
-                    SELECT skill_id, target_level
-                    FROM skill_gap_settings
-                    WHERE category_id = ?
-                ''', (category_id,))
+                cursor.execute(SELECT_CATEGORY_SKILL_GAP_SETTINGS_SQL, (category_id,))
             else:
-                cursor.execute('''
-                    SELECT skill_id, target_level
-                    FROM skill_gap_settings
-                ''')
+                cursor.execute(SELECT_SKILL_GAP_SETTINGS_SQL)
             
             return dict(cursor.fetchall())
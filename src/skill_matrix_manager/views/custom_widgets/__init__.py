@@ -2,7 +2,34 @@
 カスタムウィジェットパッケージ
 Created: 2025-02-09 13:17:36
 Author: GingaDza
+
+matplotlib 版の RadarChart は参照されたときに初めて読み込む。
 """
-from .radar_chart import RadarChart
+from .native_radar_chart import NativeRadarChart
+
+RADAR_BACKENDS = ("native", "matplotlib")
+
+
+def create_radar_chart(backend, parent=None):
+    """設定に応じたレーダーチャートの作成
+
+    Args:
+        backend (str): "native" または "matplotlib"
+            （通常は呼び出し側の settings.RADAR_CHART["backend"]）
+    """
+    if backend not in RADAR_BACKENDS:
+        raise ValueError(f"不明なレーダーチャートのバックエンド: {backend}")
+    if backend == "native":
+        return NativeRadarChart(parent=parent)
+    from .radar_chart import RadarChart
+    return RadarChart(parent)
+
+
+def __getattr__(name):
+    if name == "RadarChart":
+        from .radar_chart import RadarChart
+        return RadarChart
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['RadarChart']
+__all__ = ['RadarChart', 'NativeRadarChart', 'create_radar_chart']
@@ -0,0 +1,168 @@
+"""
+QPainter版レーダーチャートウィジェット
+Created: 2026-10-17 18:40:12
+Author: GingaDza
+
+matplotlib を使わずに RadarChart と同じ update_data(current, target, show_gap)
+を提供する。目盛り・軸・ラベルはカテゴリー構成とサイズが変わったときだけ
+背景ピクスマップに描き、通常の更新ではデータの多角形のみ描き直す。
+"""
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QPixmap, QPolygonF
+
+MAX_LEVEL = 5
+CURRENT_COLOR = QColor('#1f77b4')
+TARGET_COLOR = QColor('#ff7f0e')
+GAP_COLOR = QColor('#ff9999')
+GRID_COLOR = QColor(128, 128, 128, 80)
+TEXT_COLOR = QColor('#333333')
+TITLE = 'スキルレベル比較'
+
+
+class NativeRadarChart(QWidget):
+    """スキルギャップ表示機能付きレーダーチャート（QPainter描画）"""
+
+    def __init__(self, categories: Optional[Sequence[str]] = None, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(200, 200)
+        self.data: Dict[str, float] = {}
+        self.target_data: Dict[str, float] = {}
+        self.gap_enabled = True
+        self.categories: List[str] = list(categories or [])
+        # 軸の形状（カテゴリー構成とサイズが変わったときのみ再計算）
+        self._geometry_key: Optional[Tuple] = None
+        self._center = QPointF()
+        self._radius = 0.0
+        self._directions: List[Tuple[float, float]] = []
+        self._background: Optional[QPixmap] = None
+
+    def set_categories(self, categories: Sequence[str]):
+        """カテゴリーの設定（update_data にリストを渡す場合の軸ラベル）"""
+        self.categories = list(categories)
+        self.data = {}
+        self.target_data = {}
+        self.update()
+
+    def update_data(self, current_data, target_data=None, show_gap=True):
+        """
+        データの更新
+
+        Args:
+            current_data (dict | list): 現在のスキルレベルデータ
+                （リストの場合は set_categories の順）
+            target_data (dict | list): 目標スキルレベルデータ
+            show_gap (bool): ギャップを表示するかどうか
+        """
+        self.data = self._as_dict(current_data)
+        self.target_data = self._as_dict(target_data) if target_data else {}
+        self.gap_enabled = show_gap
+        self.update()
+
+    def _as_dict(self, values) -> Dict[str, float]:
+        if isinstance(values, dict):
+            return dict(values)
+        return dict(zip(self.categories, values))
+
+    def polygon(self, values: Sequence[float]) -> QPolygonF:
+        """レベルの並びを多角形の頂点に変換"""
+        cx, cy = self._center.x(), self._center.y()
+        scale = self._radius / MAX_LEVEL
+        return QPolygonF([
+            QPointF(cx + dx * scale * min(max(value, 0), MAX_LEVEL),
+                    cy + dy * scale * min(max(value, 0), MAX_LEVEL))
+            for (dx, dy), value in zip(self._directions, values)
+        ])
+
+    def _ensure_geometry(self, categories: Tuple[str, ...]) -> None:
+        """軸の方向ベクトルと背景の作成"""
+        ratio = self.devicePixelRatioF()
+        key = (categories, self.width(), self.height(), ratio)
+        if key == self._geometry_key:
+            return
+        self._geometry_key = key
+
+        # タイトルとラベルの余白を除いた正方形に収める
+        self._center = QPointF(self.width() / 2, (self.height() + 20) / 2)
+        self._radius = max(min(self.width(), self.height() - 20) / 2 - 40, 10)
+        count = len(categories)
+        # matplotlib版と同じく右（0度）から反時計回りに配置
+        self._directions = [
+            (math.cos(2 * math.pi * i / count), -math.sin(2 * math.pi * i / count))
+            for i in range(count)
+        ]
+
+        background = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        background.setDevicePixelRatio(ratio)
+        background.fill(Qt.white)
+        painter = QPainter(background)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_axes(painter, categories)
+        painter.end()
+        self._background = background
+
+    def _paint_axes(self, painter: QPainter, categories: Tuple[str, ...]) -> None:
+        """タイトル・目盛り・軸・カテゴリーラベルの描画"""
+        font = QFont(self.font())
+        font.setPointSize(10)
+        painter.setFont(font)
+        painter.setPen(TEXT_COLOR)
+        painter.drawText(QRectF(0, 0, self.width(), 24), Qt.AlignCenter, TITLE)
+        if not categories:
+            return
+
+        painter.setPen(QPen(GRID_COLOR, 1))
+        painter.setBrush(Qt.NoBrush)
+        for level in range(1, MAX_LEVEL + 1):
+            painter.drawPolygon(self.polygon([level] * len(categories)))
+        outer = self.polygon([MAX_LEVEL] * len(categories))
+        for point in outer:
+            painter.drawLine(self._center, point)
+
+        font.setPointSize(8)
+        painter.setFont(font)
+        painter.setPen(TEXT_COLOR)
+        for (dx, dy), point, label in zip(self._directions, outer, categories):
+            rect = QRectF(point.x() - 60 + dx * 40, point.y() - 10 + dy * 14, 120, 20)
+            painter.drawText(rect, Qt.AlignCenter, str(label))
+        for level in range(1, MAX_LEVEL + 1):
+            painter.drawText(self.polygon([level] + [0] * (len(categories) - 1))[0]
+                             + QPointF(2, -2), str(level))
+
+    def paintEvent(self, event):
+        categories = tuple(self.data.keys()) or tuple(self.categories)
+        self._ensure_geometry(categories)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
+        if not categories or not self.data:
+            painter.end()
+            return
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        current = self.polygon([self.data.get(cat, 0) for cat in categories])
+        if self.target_data and self.gap_enabled:
+            target = self.polygon([self.target_data.get(cat, 0) for cat in categories])
+            # 目標の内側で現在値に届いていない領域をギャップとして塗る
+            gap = QPainterPath()
+            gap.addPolygon(target)
+            current_path = QPainterPath()
+            current_path.addPolygon(current)
+            gap_color = QColor(GAP_COLOR)
+            gap_color.setAlphaF(0.3)
+            painter.fillPath(gap.subtracted(current_path), gap_color)
+            painter.setPen(QPen(TARGET_COLOR, 2, Qt.DashLine))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolygon(target)
+
+        fill = QColor(CURRENT_COLOR)
+        fill.setAlphaF(0.25)
+        painter.setPen(QPen(CURRENT_COLOR, 2))
+        painter.setBrush(fill)
+        painter.drawPolygon(current)
+        painter.setBrush(CURRENT_COLOR)
+        for point in current:
+            painter.drawEllipse(point, 3, 3)
+        painter.end()
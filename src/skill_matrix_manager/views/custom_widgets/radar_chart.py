@@ -3,28 +3,106 @@
 Created: 2025-02-09 13:27:07
 Author: GingaDza
 """
+from collections import OrderedDict
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QImage, QPainter, QPixmap
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.patches import Patch
 import numpy as np
 
+RESIZE_SETTLE_MS = 150   # 最後のリサイズからレイアウトを再計算するまでの待ち時間
+LAYOUT_BUCKET_PX = 32    # レイアウトキャッシュのサイズ刻み
+LAYOUT_CACHE_SIZE = 64   # レイアウトキャッシュの上限（古いものから破棄）
+
+
+class CoalescingCanvas(FigureCanvas):
+    """リサイズ中は直前の描画結果を拡大縮小して表示するキャンバス
+
+    deferred の間は Figure のサイズ変更と再描画を行わず、
+    apply_size() で最終サイズを反映する。
+    """
+
+    def __init__(self, figure, on_resize_started=None):
+        super().__init__(figure)
+        self.deferred = False
+        self.on_resize_started = on_resize_started
+        self._snapshot = None
+
+    def resizeEvent(self, event):
+        if self.on_resize_started is None or not hasattr(self, "renderer"):
+            # 未描画の間は通常どおり処理
+            super().resizeEvent(event)
+            return
+        if not self.deferred:
+            self._snapshot = self._buffer_pixmap()
+            self.deferred = True
+        QWidget.resizeEvent(self, event)
+        self.on_resize_started()
+
+    def paintEvent(self, event):
+        if self.deferred and self._snapshot is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self.rect(), self._snapshot)
+            painter.end()
+            return
+        super().paintEvent(event)
+
+    def apply_size(self):
+        """保留していたウィジェットサイズを Figure に反映"""
+        self.deferred = False
+        self._snapshot = None
+        ratio = self.device_pixel_ratio
+        self.figure.set_size_inches(self.width() * ratio / self.figure.dpi,
+                                    self.height() * ratio / self.figure.dpi, forward=False)
+
+    def _buffer_pixmap(self):
+        """最後に描画したAggバッファのコピー（再描画は行わない）"""
+        width, height = self.renderer.width, self.renderer.height
+        image = QImage(self.buffer_rgba(), int(width), int(height), QImage.Format_RGBA8888)
+        return QPixmap.fromImage(image.copy())
+
 class RadarChart(QWidget):
-    """スキルギャップ表示機能付きレーダーチャート"""
+    """スキルギャップ表示機能付きレーダーチャート
+
+    Args:
+        coalesce_resize (bool): リサイズ中は縮尺したスナップショットを表示し、
+            リサイズが落ち着いてからレイアウトと再描画を1回だけ行う
+    """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, coalesce_resize=True):
         super().__init__(parent)
         self.figure = Figure(facecolor='white')
-        self.canvas = FigureCanvas(self.figure)
+        self.coalesce_resize = coalesce_resize
+        if coalesce_resize:
+            self.canvas = CoalescingCanvas(self.figure, on_resize_started=self._schedule_resize)
+        else:
+            self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111, projection='polar')
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.canvas)
         
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._finish_resize)
+        self._layout_cache = OrderedDict()  # (レイアウト構成, 幅バケット, 高さバケット) → subplotpars
+        
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.data = {}
         self.target_data = {}
         self.gap_enabled = True
+        # 再利用するアーティスト（カテゴリー構成が変わったときのみ作り直す）
+        self._layout_key = None
+        self._angles = None
+        self._current_line = None
+        self._current_fill = None
+        self._target_line = None
+        self._gap_fill = None
+        self._legend = None
         self.setup_style()
 
     def setup_style(self):
@@ -49,59 +127,118 @@ class RadarChart(QWidget):
         self._draw_chart()
 
     def _draw_chart(self):
-        """チャートの描画"""
+        """チャートの描画
+
+        カテゴリー構成（と凡例の有無）が変わった場合のみ軸を作り直し、
+        それ以外は既存の線・多角形のデータだけを差し替えて draw_idle する。
+        """
+        categories = tuple(self.data.keys())
+        show_target = bool(self.target_data) and self.gap_enabled
+        layout_key = (categories, show_target)
+        if layout_key != self._layout_key:
+            self._build_layout(categories, show_target)
+            self._layout_key = layout_key
+
+        if not categories:
+            self.canvas.draw_idle()
+            return
+
+        angles = self._angles
+        values = self._closed([self.data[cat] for cat in categories])
+        self._current_line.set_data(angles, values)
+        self._current_fill.set_xy(np.column_stack([angles, values]))
+
+        if self._gap_fill is not None:
+            self._gap_fill.remove()
+            self._gap_fill = None
+        if show_target:
+            target_values = self._closed([self.target_data.get(cat, 0) for cat in categories])
+            self._target_line.set_data(angles, target_values)
+            # ギャップ領域は形状が変わるため、この1要素のみ作り直す
+            self._gap_fill = self.ax.fill_between(
+                angles, values, target_values,
+                where=target_values > values,
+                color='#ff9999', alpha=0.3
+            )
+
+        self.canvas.draw_idle()
+
+    def _build_layout(self, categories, show_target):
+        """軸・目盛り・アーティスト・凡例の作成とレイアウト計算"""
         self.ax.clear()
         self.setup_style()
-        
-        if not self.data:
+        self._gap_fill = None
+        self._legend = None
+        if not categories:
+            self._angles = None
+            self.canvas.draw_idle()
             return
 
-        categories = list(self.data.keys())
-        values = list(self.data.values())
         angles = np.linspace(0, 2*np.pi, len(categories), endpoint=False)
-        
-        # データを円形に
-        values = np.concatenate((values, [values[0]]))
-        angles = np.concatenate((angles, [angles[0]]))
-        
+        self._angles = np.concatenate((angles, [angles[0]]))
+        empty = np.zeros_like(self._angles)
+
         # 現在のスキルレベル
-        self.ax.plot(angles, values, 'o-', linewidth=2,
-                    label='現在のレベル', color='#1f77b4')
-        self.ax.fill(angles, values, alpha=0.25, color='#1f77b4')
-        
-        # 目標スキルレベルとギャップの表示
-        if self.target_data and self.gap_enabled:
-            target_values = [self.target_data.get(cat, 0) for cat in categories]
-            target_values = np.concatenate((target_values, [target_values[0]]))
-            
-            # 目標レベル
-            self.ax.plot(angles, target_values, 'o--', linewidth=2,
-                        label='目標レベル', color='#ff7f0e')
-            
-            # ギャップの表示
-            gap_values = np.maximum(target_values - values, 0)
-            self.ax.fill_between(angles, values, target_values,
-                               where=target_values > values,
-                               color='#ff9999', alpha=0.3,
-                               label='スキルギャップ')
-        
+        self._current_line, = self.ax.plot(self._angles, empty, 'o-', linewidth=2,
+                                           label='現在のレベル', color='#1f77b4')
+        self._current_fill, = self.ax.fill(self._angles, empty, alpha=0.25, color='#1f77b4')
+
+        # 目標スキルレベル
+        self._target_line = None
+        if show_target:
+            self._target_line, = self.ax.plot(self._angles, empty, 'o--', linewidth=2,
+                                              label='目標レベル', color='#ff7f0e')
+
         # グリッドの設定
-        self.ax.set_xticks(angles[:-1])
+        self.ax.set_xticks(angles)
         self.ax.set_xticklabels(categories, fontsize=8)
         self.ax.set_ylim(0, 5)
         self.ax.set_rticks([1, 2, 3, 4, 5])
-        
+
         # 凡例の表示
-        if self.target_data and self.gap_enabled:
-            self.ax.legend(loc='upper right',
-                         bbox_to_anchor=(1.3, 1.1),
-                         fontsize=8)
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        if show_target:
+            handles = [self._current_line, self._target_line,
+                       Patch(color='#ff9999', alpha=0.3, label='スキルギャップ')]
+            self._legend = self.ax.legend(handles=handles, loc='upper right',
+                                          bbox_to_anchor=(1.3, 1.1), fontsize=8)
+
+        self._apply_layout((categories, show_target))
+
+    @staticmethod
+    def _closed(values):
+        """始点を末尾に加えて多角形を閉じる"""
+        return np.concatenate((values, values[:1])).astype(float)
+
+    def _apply_layout(self, layout_key=None):
+        """余白の計算（サイズバケットごとに tight_layout の結果を LAYOUT_CACHE_SIZE 件までキャッシュ）"""
+        layout_key = self._layout_key if layout_key is None else layout_key
+        width, height = self.canvas.width(), self.canvas.height()
+        cache_key = (layout_key, width // LAYOUT_BUCKET_PX, height // LAYOUT_BUCKET_PX)
+        params = self._layout_cache.get(cache_key)
+        if params is None:
+            self.figure.tight_layout()
+            pars = self.figure.subplotpars
+            params = dict(left=pars.left, right=pars.right, top=pars.top, bottom=pars.bottom)
+            self._layout_cache[cache_key] = params
+            if len(self._layout_cache) > LAYOUT_CACHE_SIZE:
+                self._layout_cache.popitem(last=False)
+        else:
+            self._layout_cache.move_to_end(cache_key)
+            self.figure.subplots_adjust(**params)
 
     def resizeEvent(self, event):
         """リサイズイベントの処理"""
         super().resizeEvent(event)
-        self.figure.tight_layout()
-        self.canvas.draw()
+        if not self.coalesce_resize:
+            self._apply_layout()
+            self.canvas.draw()
+
+    def _schedule_resize(self):
+        """リサイズ中はタイマーを延長し、落ち着いてから1回だけレイアウトする"""
+        self._resize_timer.start()
+
+    def _finish_resize(self):
+        """リサイズ完了後のレイアウトと再描画"""
+        self.canvas.apply_size()
+        self._apply_layout()
+        self.canvas.draw_idle()
@@ -6,11 +6,13 @@ Author: GingaDza
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
     QLabel, QPushButton, QTableWidget, QTableWidgetItem,
-    QMessageBox, QGroupBox, QSplitter
+    QMessageBox, QGroupBox, QSplitter, QFileDialog
 )
 from PyQt5.QtCore import Qt
-from ..custom_widgets.radar_chart import RadarChart
-import numpy as np
+from data_io import export_matrix_radar_pdf
+from views.data_service import get_data_service
+from config import settings
+from ..custom_widgets import create_radar_chart
 
 class EvaluationTab(QWidget):
     """評価タブ"""
@@ -18,6 +20,8 @@ class EvaluationTab(QWidget):
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
+        self.data_service = get_data_service()
+        self._request_key = f"group_statistics:{id(self)}"  # ウィジェットごとの要求キー
         self.init_ui()
 
     def init_ui(self):
@@ -55,7 +59,7 @@ class EvaluationTab(QWidget):
         # レーダーチャート
         chart_group = QGroupBox("スキルレベル分布")
         chart_layout = QVBoxLayout(chart_group)
-        self.radar_chart = RadarChart()
+        self.radar_chart = create_radar_chart(settings.RADAR_CHART["backend"])
         chart_layout.addWidget(self.radar_chart)
         charts_layout.addWidget(chart_group)
         
@@ -65,9 +69,9 @@ class EvaluationTab(QWidget):
         # レポート出力ボタン
         button_section = QHBoxLayout()
         button_section.addStretch()
-        export_btn = QPushButton("レポート出力")
-        export_btn.clicked.connect(self.export_report)
-        button_section.addWidget(export_btn)
+        self.export_btn = QPushButton("レポート出力")
+        self.export_btn.clicked.connect(self.export_report)
+        button_section.addWidget(self.export_btn)
         layout.addLayout(button_section)
 
         # 初期データの読み込み
@@ -88,24 +92,40 @@ class EvaluationTab(QWidget):
         """データの更新"""
         group_id = self.group_combo.currentData()
         if not group_id:
+            self.data_service.cancel(self._request_key)
             return
 
-        try:
-            self.update_statistics(group_id)
-            self.update_chart(group_id)
-        except Exception as e:
-            QMessageBox.warning(self, "エラー",
-                              f"データの更新に失敗しました: {str(e)}")
-
-    def update_statistics(self, group_id):
+        # 集計はワーカースレッドで実行し、統計とチャートで同じ結果を使う
+        self.data_service.submit(
+            self._request_key, self.db.get_group_statistics, group_id,
+            on_result=self._apply_statistics,
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"データの更新に失敗しました: {str(e)}"
+            )
+        )
+
+    def _apply_statistics(self, statistics):
+        """集計結果の反映"""
+        self.update_statistics(statistics)
+        self.update_chart(statistics)
+
+    def update_statistics(self, statistics):
         """統計情報の更新"""
-        users = self.db.get_users_in_group(group_id)
+        def fmt(value):
+            return "-" if value is None else f"{value:.1f}"
+
         stats = [
-            ("メンバー数", len(users)),
-            ("平均スキルレベル", "3.5"),  # サンプル値
-            ("最高スキルレベル", "5.0"),  # サンプル値
-            ("最低スキルレベル", "2.0"),  # サンプル値
+            ("メンバー数", statistics.member_count),
+            ("評価件数", statistics.rated_count),
+            ("平均スキルレベル", fmt(statistics.mean)),
+            ("中央値", fmt(statistics.median)),
+            ("最高スキルレベル", fmt(statistics.maximum)),
+            ("最低スキルレベル", fmt(statistics.minimum)),
         ]
+        # スキル別の分布（レベル1〜5の人数）
+        for skill in statistics.skills:
+            counts = " / ".join(f"{level}:{skill.counts.get(level, 0)}" for level in range(1, 6))
+            stats.append((skill.name, f"平均 {fmt(skill.mean)} ({counts})"))
 
         self.stats_table.setRowCount(len(stats))
         for row, (item, value) in enumerate(stats):
@@ -114,22 +134,37 @@ class EvaluationTab(QWidget):
         
         self.stats_table.resizeColumnsToContents()
 
-    def update_chart(self, group_id):
-        """チャートの更新"""
-        # サンプルデータ
-        data = {
-            "Python": 4,
-            "JavaScript": 3,
-            "SQL": 4,
-            "UI設計": 3,
-            "テスト": 5
-        }
-        self.radar_chart.update_data(data)
+    def update_chart(self, statistics):
+        """チャートの更新（スキルごとのグループ平均）"""
+        self.radar_chart.update_data(statistics.skill_means())
 
     def export_report(self):
-        """レポートの出力"""
-        try:
-            QMessageBox.information(self, "成功", "レポートを出力しました")
-        except Exception as e:
-            QMessageBox.warning(self, "エラー",
-                              f"レポートの出力に失敗しました: {str(e)}")
+        """レポートの出力（グループメンバーのレーダーチャート一覧PDF）"""
+        group_id = self.group_combo.currentData()
+        if not group_id:
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "レポート出力", "", "PDF Files (*.pdf)"
+        )
+        if not file_path:
+            return
+        self.export_btn.setEnabled(False)
+        get_data_service("batch").submit(
+            f"group_report:{id(self)}", self._write_report, group_id, file_path,
+            on_result=self._on_report_written,
+            on_error=self._on_report_failed
+        )
+
+    def _write_report(self, group_id, file_path):
+        """ワーカースレッドでの出力（描画はプロセスプールで並列実行）"""
+        matrix = self.db.load_skill_matrix()
+        return export_matrix_radar_pdf(matrix, file_path, matrix.group_user_ids(group_id))
+
+    def _on_report_written(self, pages):
+        self.export_btn.setEnabled(True)
+        QMessageBox.information(self, "成功", "レポートを出力しました")
+
+    def _on_report_failed(self, error):
+        self.export_btn.setEnabled(True)
+        QMessageBox.warning(self, "エラー",
+                          f"レポートの出力に失敗しました: {str(error)}")
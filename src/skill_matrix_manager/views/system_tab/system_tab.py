@@ -4,43 +4,57 @@ Created: 2025-02-09 13:31:08
 Author: GingaDza
 """
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QListWidget,
     QMessageBox, QGroupBox, QComboBox, QSpacerItem,
     QSizePolicy, QTableWidget, QTableWidgetItem
 )
-from ..custom_widgets.radar_chart import RadarChart
+from PyQt5.QtCore import Qt
+import numpy as np
+from analytics import SkillGapReport
+from views.components.lazy_tab_widget import LazyTabWidget
+from views.data_service import get_data_service
+from config import settings
+from ..custom_widgets import create_radar_chart
+
+# インポート種別 → level 列を取り込むかどうか
+# （グループリストは group, user 列、スキルレベルデータは level 列まで必須）
+IMPORT_TYPES = {
+    "グループリスト": False,
+    "スキルレベルデータ": True,
+}
 
 class SystemTab(QWidget):
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
+        # スキルギャップ設定タブの表示データ（load_skill_gap_data で読み込む）
+        self._gap_categories = []
+        self._gap_matrix = None
+        self._gap_targets = {}
         self.init_ui()
 
     def init_ui(self):
         """UIの初期化"""
         layout = QVBoxLayout(self)
         
-        # タブウィジェットの作成
-        tab_widget = QTabWidget()
+        # タブウィジェットの作成（各タブは最初に表示されたときに生成）
+        self.tab_widget = LazyTabWidget()
         
         # 1-1: 初期設定タブ
-        settings_tab = self.create_settings_tab()
-        tab_widget.addTab(settings_tab, "初期設定")
+        self.tab_widget.addLazyTab(self.create_settings_tab, "初期設定", evictable=False)
         
         # 1-2: データ入出力タブ
-        io_tab = self.create_io_tab()
-        tab_widget.addTab(io_tab, "データ入出力")
+        self.tab_widget.addLazyTab(self.create_io_tab, "データ入出力", evictable=False)
         
-        # 1-3: スキルギャップ設定タブ
-        skill_gap_tab = self.create_skill_gap_tab()
-        tab_widget.addTab(skill_gap_tab, "スキルギャップ設定")
+        # 1-3: スキルギャップ設定タブ（レーダーチャートを含むため遅延生成の効果が大きい）
+        self.tab_widget.addLazyTab(self.create_skill_gap_tab, "スキルギャップ設定",
+                                   evictable=False)
         
-        # 1-4: システム情報タブ
-        info_tab = self.create_info_tab()
-        tab_widget.addTab(info_tab, "システム情報")
+        # 1-4: システム情報タブ（状態を持たないため破棄・再生成してよい）
+        self.tab_widget.addLazyTab(self.create_info_tab, "システム情報")
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
 
     def create_settings_tab(self):
         """初期設定タブの作成"""
@@ -125,14 +139,10 @@ class SystemTab(QWidget):
         import_group = QGroupBox("データインポート")
         import_layout = QVBoxLayout(import_group)
         
-        import_type = QComboBox()
-        import_type.addItems([
-            "グループリスト",
-            "親カテゴリーリスト",
-            "子カテゴリーリスト",
-            "スキルレベルデータ"
-        ])
-        import_layout.addWidget(import_type)
+        # カテゴリーは skills の列のため、カテゴリーリスト単体の取り込みはない
+        self.import_type = QComboBox()
+        self.import_type.addItems(list(IMPORT_TYPES))
+        import_layout.addWidget(self.import_type)
         
         import_btn = QPushButton("インポート")
         import_btn.clicked.connect(self.import_data)
@@ -144,13 +154,13 @@ class SystemTab(QWidget):
         export_group = QGroupBox("データエクスポート")
         export_layout = QVBoxLayout(export_group)
         
-        export_type = QComboBox()
-        export_type.addItems([
+        self.export_type = QComboBox()
+        self.export_type.addItems([
             "レーダーチャート一覧",
             "スキルレベルデータ",
             "全データ"
         ])
-        export_layout.addWidget(export_type)
+        export_layout.addWidget(self.export_type)
         
         export_btn = QPushButton("エクスポート")
         export_btn.clicked.connect(self.export_data)
@@ -171,7 +181,7 @@ class SystemTab(QWidget):
         category_layout = QVBoxLayout(category_group)
         
         self.category_combo = QComboBox()
-        self.category_combo.addItem("全カテゴリー")
+        self.category_combo.addItem("全カテゴリー", None)
         self.category_combo.currentIndexChanged.connect(self.on_category_changed)
         category_layout.addWidget(self.category_combo)
         
@@ -193,8 +203,10 @@ class SystemTab(QWidget):
         preview_group = QGroupBox("プレビュー")
         preview_layout = QVBoxLayout(preview_group)
         
-        self.preview_chart = RadarChart()
+        self.preview_chart = create_radar_chart(settings.RADAR_CHART["backend"])
         preview_layout.addWidget(self.preview_chart)
+        self.gap_summary = QLabel()
+        preview_layout.addWidget(self.gap_summary)
         layout.addWidget(preview_group)
         
         # ボタンセクション
@@ -210,7 +222,9 @@ class SystemTab(QWidget):
         
         layout.addLayout(button_layout)
         
-        # 初期データの読み込み
+        # 初期データの読み込み（タブの破棄後に結果が届いても表示を更新しない）
+        key = self._skill_gap_key()
+        tab.destroyed.connect(lambda: get_data_service().cancel(key))
         self.load_skill_gap_data()
         
         return tab
@@ -233,6 +247,20 @@ class SystemTab(QWidget):
         db_layout = QVBoxLayout(db_info)
         db_layout.addWidget(QLabel("データベース: SQLite"))
         db_layout.addWidget(QLabel("場所: skill_matrix.db"))
+        try:
+            status = self.db.get_pragma_status()
+            db_layout.addWidget(QLabel(f"PRAGMAプロファイル: {status['profile']}"))
+            db_layout.addWidget(QLabel(
+                f"journal_mode: {status['journal_mode']} / "
+                f"synchronous: {status['synchronous']}"
+            ))
+            db_layout.addWidget(QLabel(
+                f"cache_size: {status['cache_size']} / "
+                f"mmap_size: {status['mmap_size']} / "
+                f"temp_store: {status['temp_store']}"
+            ))
+        except Exception as e:
+            db_layout.addWidget(QLabel(f"PRAGMA情報の取得に失敗しました: {str(e)}"))
         info_layout.addWidget(db_info)
         
         layout.addWidget(info_group)
@@ -255,43 +283,123 @@ class SystemTab(QWidget):
             self.update_skill_gap_preview()
 
     def load_skill_gap_data(self):
-        """スキルギャップデータの読み込み"""
-        try:
-            # サンプルデータ（後でデータベースから取得）
-            self.update_skill_gap_preview()
-        except Exception as e:
-            QMessageBox.warning(self, "エラー",
-                              f"データの読み込みに失敗しました: {str(e)}")
+        """スキルギャップデータの読み込み（評価行列はワーカースレッドで1回だけ読む）"""
+        get_data_service().submit(
+            self._skill_gap_key(), self._read_skill_gap_data,
+            on_result=self._on_skill_gap_data_loaded,
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"データの読み込みに失敗しました: {str(e)}"
+            )
+        )
+
+    def _skill_gap_key(self):
+        return f"skill_gap:{id(self)}"
+
+    def _read_skill_gap_data(self):
+        return (self.db.get_skill_categories(), self.db.load_skill_matrix(),
+                self.db.get_skill_gap_settings())
+
+    def _on_skill_gap_data_loaded(self, data):
+        self._gap_categories, self._gap_matrix, self._gap_targets = data
+        selected = self.category_combo.currentData()
+        self.category_combo.blockSignals(True)
+        self.category_combo.clear()
+        self.category_combo.addItem("全カテゴリー", None)
+        for category_id, name in self._gap_categories:
+            self.category_combo.addItem(name, category_id)
+        index = self.category_combo.findData(selected)
+        self.category_combo.setCurrentIndex(max(index, 0))
+        self.category_combo.blockSignals(False)
+        self.update_skill_table()
+        self.update_skill_gap_preview()
+
+    def _selected_skill_ids(self):
+        """選択中のカテゴリーのスキルID（全カテゴリーの場合はすべて）"""
+        if self.category_combo.currentData() is None:
+            return list(self._gap_matrix.skill_ids)
+        return self._gap_matrix.category_skill_ids(self.category_combo.currentText())
+
+    def update_skill_table(self):
+        """選択中のカテゴリーのスキルと目標レベルを表に表示"""
+        if self._gap_matrix is None:
+            return
+        matrix = self._gap_matrix
+        skill_ids = self._selected_skill_ids()
+        self.skill_table.blockSignals(True)
+        self.skill_table.setRowCount(len(skill_ids))
+        for row, skill_id in enumerate(skill_ids):
+            target = self._gap_targets.get(skill_id)
+            name_item = QTableWidgetItem(matrix.skill_names[matrix.skill_index[skill_id]])
+            name_item.setData(Qt.UserRole, skill_id)
+            current_item = QTableWidgetItem("-" if target is None else str(target))
+            for item in (name_item, current_item):
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            self.skill_table.setItem(row, 0, name_item)
+            self.skill_table.setItem(row, 1, current_item)
+            self.skill_table.setItem(row, 2, QTableWidgetItem("" if target is None else str(target)))
+        self.skill_table.blockSignals(False)
+
+    def _table_targets(self):
+        """表の「新しい目標」列（1〜5以外の値は目標なしとして扱う）"""
+        targets = {}
+        for row in range(self.skill_table.rowCount()):
+            text = self.skill_table.item(row, 2).text().strip()
+            if text.isdigit() and 1 <= int(text) <= 5:
+                targets[self.skill_table.item(row, 0).data(Qt.UserRole)] = int(text)
+        return targets
 
     def update_skill_gap_preview(self):
-        """プレビューの更新"""
+        """プレビューの更新（組織全体の平均レベルと新しい目標の比較）"""
+        if self._gap_matrix is None:
+            return
         try:
-            # サンプルデータ
-            current_data = {
-                "Python": 3,
-                "JavaScript": 2,
-                "SQL": 4,
-                "UI設計": 3,
-                "テスト": 2
-            }
-            
-            target_data = {
-                "Python": 4,
-                "JavaScript": 4,
-                "SQL": 5,
-                "UI設計": 4,
-                "テスト": 4
-            }
-            
+            matrix = self._gap_matrix
+            report = SkillGapReport.from_matrix(matrix, self._table_targets())
+            names = [matrix.skill_names[matrix.skill_index[s]] for s in report.skill_ids]
+            # 評価者のいないスキル（NaN）は0として描画する
+            current_data = dict(zip(names, np.nan_to_num(report.averages).tolist()))
+            target_data = {name: int(target) for name, target in zip(names, report.targets)}
             self.preview_chart.update_data(current_data, target_data)
-            
+
+            if not report.skill_ids:
+                self.gap_summary.setText("目標レベルが設定されていません")
+                return
+            top_skills = "、".join(
+                f"{matrix.skill_names[matrix.skill_index[skill_id]]} ({gap:.2f})"
+                for skill_id, gap in report.top_skills(3)
+            )
+            self.gap_summary.setText(
+                f"目標未達: {report.users_below_target:,} / {len(report.user_ids):,} 人　"
+                f"平均不足: {report.org_mean:.2f}　"
+                f"不足の大きいスキル: {top_skills or 'なし'}"
+            )
         except Exception as e:
             QMessageBox.warning(self, "エラー",
                               f"プレビューの更新に失敗しました: {str(e)}")
 
     def save_skill_gap_settings(self):
-        """スキルギャップ設定の保存"""
+        """スキルギャップ設定の保存（表に表示中のスキルの新しい目標）
+
+        新しい目標を空欄（または1〜5以外）にしたスキルは設定を削除する。
+        """
+        if self._gap_matrix is None:
+            return
         try:
+            targets = self._table_targets()
+            shown = {
+                self.skill_table.item(row, 0).data(Qt.UserRole)
+                for row in range(self.skill_table.rowCount())
+            }
+            settings = {}
+            for category_id, name in self._gap_categories:
+                for skill_id in self._gap_matrix.category_skill_ids(name):
+                    if skill_id in shown:
+                        settings.setdefault(category_id, {})[skill_id] = targets.get(skill_id)
+            self.db.save_skill_gap_settings(settings)
+            for skill_id in shown - set(targets):
+                self._gap_targets.pop(skill_id, None)
+            self._gap_targets.update(targets)
+            self.update_skill_table()
             QMessageBox.information(self, "成功", "設定を保存しました")
         except Exception as e:
             QMessageBox.warning(self, "エラー",
@@ -317,40 +425,103 @@ class SystemTab(QWidget):
                               f"設定のリセットに失敗しました: {str(e)}")
 
     def import_data(self):
-        """データのインポート"""
-        try:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "データインポート",
-                "",
-                "Excel Files (*.xlsx);;CSV Files (*.csv)"
-            )
-            if file_path:
-                QMessageBox.information(self, "成功", "データをインポートしました")
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "エラー",
-                f"データのインポートに失敗しました: {str(e)}"
+        """データのインポート（import_type で選択した種別）"""
+        import_type = self.import_type.currentText()
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            f"{import_type}のインポート",
+            "",
+            "CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
+        get_data_service("batch").submit(
+            f"csv_import:{id(self)}", self.db.import_csv, file_path, None,
+            IMPORT_TYPES[import_type],
+            on_result=self._on_imported,
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"データのインポートに失敗しました: {str(e)}"
             )
+        )
+
+    def _on_imported(self, result):
+        """取り込み結果の表示"""
+        QMessageBox.information(
+            self, "成功",
+            f"データをインポートしました（{result.rows:,} 行、"
+            f"{result.rows_per_second:,.0f} 行/秒）"
+        )
 
     def export_data(self):
-        """データのエクスポート"""
-        try:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "データエクスポート",
-                "",
-                "PDF Files (*.pdf);;Excel Files (*.xlsx);;CSV Files (*.csv)"
+        """データのエクスポート（export_type で選択した形式）"""
+        export_type = self.export_type.currentText()
+        if export_type == "レーダーチャート一覧":
+            self.export_radar_charts()
+        elif export_type == "スキルレベルデータ":
+            self.export_skill_levels()
+        else:
+            self.export_all_data()
+
+    def export_skill_levels(self):
+        """評価済みのスキルレベルの出力（インポートと同じ縦持ちCSV）"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "スキルレベルデータのエクスポート",
+            "",
+            "CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
+        get_data_service("batch").submit(
+            f"levels_export:{id(self)}", self.db.export_levels_csv, file_path,
+            on_result=lambda count: QMessageBox.information(
+                self, "成功", f"スキルレベルデータをエクスポートしました（{count:,} 件）"
+            ),
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"データのエクスポートに失敗しました: {str(e)}"
             )
-            if file_path:
-                QMessageBox.information(self, "成功", "データをエクスポートしました")
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "エラー",
-                f"データのエクスポートに失敗しました: {str(e)}"
+        )
+
+    def export_all_data(self):
+        """全データの出力（全ユーザー × 全スキルのマトリックス）"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "全データのエクスポート",
+            "",
+            "Excel Files (*.xlsx);;CSV Files (*.csv)"
+        )
+        if not file_path:
+            return
+        export = self.db.export_xlsx if file_path.lower().endswith(".xlsx") else self.db.export_csv
+        get_data_service("batch").submit(
+            f"matrix_export:{id(self)}", export, file_path,
+            on_result=lambda count: QMessageBox.information(
+                self, "成功", f"データをエクスポートしました（{count:,} 人）"
+            ),
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"データのエクスポートに失敗しました: {str(e)}"
+            )
+        )
+
+    def export_radar_charts(self):
+        """全ユーザーのレーダーチャート一覧のPDF出力"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "レーダーチャート一覧のPDF出力",
+            "",
+            "PDF Files (*.pdf)"
+        )
+        if not file_path:
+            return
+        get_data_service("batch").submit(
+            f"radar_pdf:{id(self)}", self.db.export_radar_pdf, file_path,
+            on_result=lambda pages: QMessageBox.information(
+                self, "成功", f"レーダーチャート一覧を出力しました（{pages}ページ）"
+            ),
+            on_error=lambda e: QMessageBox.warning(
+                self, "エラー", f"レーダーチャート一覧の出力に失敗しました: {str(e)}"
             )
+        )
 
     def add_new_tab(self):
         """新規タブの追加"""
@@ -0,0 +1,118 @@
+"""遅延生成タブウィジェット
+Created: 2026-10-17 17:02:36
+Author: GingaDza
+
+タブの中身を最初に表示されたときに生成し、長時間表示されていない
+タブの中身は破棄できるQTabWidget。PyQt5のみに依存する。
+"""
+import time
+from typing import Callable, List, Optional
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtWidgets import QTabWidget, QVBoxLayout, QWidget
+
+
+class LazyPage(QWidget):
+    """タブページのプレースホルダー（中身は factory で生成）"""
+
+    def __init__(self, factory: Callable[[], QWidget], evictable: bool = True, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.evictable = evictable
+        self.content: Optional[QWidget] = None
+        self.hidden_since: Optional[float] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def is_materialized(self) -> bool:
+        return self.content is not None
+
+
+class LazyTabWidget(QTabWidget):
+    """表示時に中身を生成するタブウィジェット
+
+    Args:
+        evict_after_ms (int, optional): この時間以上表示されていないタブの中身を破棄する
+            （None の場合は破棄しない）
+    """
+
+    materialized = pyqtSignal(object)  # LazyPage
+    evicted = pyqtSignal(object)       # LazyPage
+
+    def __init__(self, parent=None, evict_after_ms: Optional[int] = None):
+        super().__init__(parent)
+        self.evict_after_ms = evict_after_ms
+        self._current_page: Optional[LazyPage] = None
+        self.currentChanged.connect(self._on_current_changed)
+        self._evict_timer = QTimer(self)
+        self._evict_timer.timeout.connect(self.evict_hidden)
+        if evict_after_ms is not None:
+            self._evict_timer.start(max(1000, evict_after_ms // 4))
+
+    def addLazyTab(self, factory: Callable[[], QWidget], label: str,
+                   evictable: bool = True) -> LazyPage:
+        """遅延生成タブの追加"""
+        return self.insertLazyTab(self.count(), factory, label, evictable)
+
+    def insertLazyTab(self, index: int, factory: Callable[[], QWidget], label: str,
+                      evictable: bool = True) -> LazyPage:
+        """遅延生成タブの挿入"""
+        page = LazyPage(factory, evictable)
+        page.hidden_since = time.monotonic()
+        self.insertTab(index, page, label)
+        # 最初のタブは currentChanged より前に表示対象になるため明示的に生成
+        if self.currentWidget() is page:
+            self._on_current_changed(self.currentIndex())
+        return page
+
+    def materialize(self, page: LazyPage) -> QWidget:
+        """タブの中身を生成（生成済みならそのまま返す）"""
+        if page.content is None:
+            page.content = page.factory()
+            page.layout().addWidget(page.content)
+            self.materialized.emit(page)
+        return page.content
+
+    def evict(self, page: LazyPage) -> None:
+        """タブの中身を破棄（次に表示されたときに再生成）"""
+        if page.content is None:
+            return
+        content, page.content = page.content, None
+        page.layout().removeWidget(content)
+        content.deleteLater()
+        self.evicted.emit(page)
+
+    def evict_hidden(self) -> List[LazyPage]:
+        """一定時間表示されていないタブの中身を破棄"""
+        if self.evict_after_ms is None:
+            return []
+        limit = time.monotonic() - self.evict_after_ms / 1000
+        targets = [
+            page for page in self.lazy_pages()
+            if page.is_materialized and page.evictable and page is not self.currentWidget()
+            and page.hidden_since is not None and page.hidden_since <= limit
+        ]
+        for page in targets:
+            self.evict(page)
+        return targets
+
+    def lazy_pages(self) -> List[LazyPage]:
+        """遅延生成タブの一覧"""
+        pages = (self.widget(i) for i in range(self.count()))
+        return [page for page in pages if isinstance(page, LazyPage)]
+
+    def materialized_count(self) -> int:
+        """生成済みのタブ数"""
+        return sum(1 for page in self.lazy_pages() if page.is_materialized)
+
+    def _on_current_changed(self, index: int) -> None:
+        previous = self._current_page
+        if previous is not None and previous is not self.widget(index):
+            previous.hidden_since = time.monotonic()
+        page = self.widget(index)
+        if isinstance(page, LazyPage):
+            page.hidden_since = None
+            self._current_page = page
+            self.materialize(page)
+        else:
+            self._current_page = None
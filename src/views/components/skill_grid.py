@@ -0,0 +1,48 @@
+"""スキルレベル入力グリッド
+Created: 2026-10-18 10:05:41
+Author: GingaDza
+
+スキル名とレベル（0〜5、0 は未評価）の入力欄を並べるウィジェット。
+PyQt5のみに依存する。
+"""
+from typing import Dict, Mapping, Sequence
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QGridLayout, QLabel, QSpinBox, QWidget
+
+MAX_LEVEL = 5
+
+
+class SkillGridWidget(QWidget):
+    """スキルレベルの入力グリッド
+
+    利用者が変更したレベルのみ skillLevelsChanged（スキル名 → レベル）で通知する。
+    0 への変更は評価の取り消しを表す。
+    set_levels による設定では通知しない。
+    """
+
+    skillLevelsChanged = pyqtSignal(dict)
+
+    def __init__(self, skill_names: Sequence[str], parent=None):
+        super().__init__(parent)
+        self.spin_boxes: Dict[str, QSpinBox] = {}
+        layout = QGridLayout(self)
+        for row, name in enumerate(skill_names):
+            spin_box = QSpinBox()
+            spin_box.setRange(0, MAX_LEVEL)
+            spin_box.valueChanged.connect(
+                lambda level, skill=name: self.skillLevelsChanged.emit({skill: level})
+            )
+            layout.addWidget(QLabel(name), row, 0)
+            layout.addWidget(spin_box, row, 1)
+            self.spin_boxes[name] = spin_box
+
+    def levels(self) -> Dict[str, int]:
+        """現在のレベル（スキル名 → レベル）"""
+        return {name: spin_box.value() for name, spin_box in self.spin_boxes.items()}
+
+    def set_levels(self, levels: Mapping[str, int]):
+        """レベルの設定（含まれないスキルは 0）"""
+        for name, spin_box in self.spin_boxes.items():
+            spin_box.blockSignals(True)
+            spin_box.setValue(levels.get(name, 0))
+            spin_box.blockSignals(False)
@@ -0,0 +1,81 @@
+"""書き込みの遅延バッファ
+Created: 2026-10-18 00:32:10
+Author: GingaDza
+
+短時間に続く編集をキーごとに最後の値だけ残してまとめ、一定時間入力が
+途切れたとき（または flush の呼び出し時）に1回の書き込みで反映する。
+PyQt5のみに依存する。
+"""
+from typing import Callable, Dict, Hashable, Mapping
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class WriteBehindBuffer(QObject):
+    """キーごとに最新の値をためて遅延書き込みするバッファ
+
+    writer はためた {キー: 値} を受け取り、すべて反映できた場合に True を返すこと
+    （False または例外の場合、まとめた編集はバッファに戻す）。
+
+    Args:
+        writer (Callable[[Dict], bool]): 書き込み関数
+        delay_ms (int): 最後の編集からこの時間が経過したら書き込む
+    """
+
+    flushed = pyqtSignal(object)        # 書き込んだ {キー: 値}
+    failed = pyqtSignal(object, object)  # 書き込めなかった {キー: 値}, 例外（False の場合は None）
+
+    def __init__(self, writer: Callable[[Dict[Hashable, object]], bool],
+                 delay_ms: int = 400, parent=None):
+        super().__init__(parent)
+        self.writer = writer
+        self._pending: Dict[Hashable, object] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, key: Hashable, value) -> None:
+        """編集の追加（同じキーの未書き込みの値は置き換える）"""
+        self._pending[key] = value
+        self._timer.start()
+
+    def update(self, values: Mapping[Hashable, object]) -> None:
+        """複数の編集の追加"""
+        if values:
+            self._pending.update(values)
+            self._timer.start()
+
+    def pending(self) -> Dict[Hashable, object]:
+        """未書き込みの編集"""
+        return dict(self._pending)
+
+    def discard(self) -> None:
+        """未書き込みの編集を破棄"""
+        self._timer.stop()
+        self._pending = {}
+
+    def flush(self) -> bool:
+        """未書き込みの編集をまとめて書き込む
+
+        Returns:
+            bool: 書き込みに成功したか、書き込む編集がなかったかどうか
+        """
+        self._timer.stop()
+        if not self._pending:
+            return True
+        batch, self._pending = self._pending, {}
+        error = None
+        try:
+            saved = self.writer(batch)
+        except Exception as e:
+            saved, error = False, e
+        if not saved:
+            # 書き込み中に追加された新しい値を優先して戻す
+            self._pending = {**batch, **self._pending}
+            self.failed.emit(batch, error)
+            return False
+        self.flushed.emit(batch)
+        return True
@@ -0,0 +1,179 @@
+"""バックグラウンドデータサービス
+Created: 2026-10-17 16:05:44
+Author: GingaDza
+
+データベース呼び出しをワーカースレッドで実行し、結果をシグナルで
+GUIスレッドに返す。同じキーで新しい要求が来た場合、古い要求は
+未実行なら破棄し、実行中なら結果を捨てる。
+
+PyQt5 と標準ライブラリのみに依存するため、src パッケージ・
+skill_matrix_manager のどちらからでも利用できる。
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from PyQt5.QtCore import QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+
+
+@dataclass
+class _Request:
+    request_id: int
+    key: str
+    func: Callable
+    args: Tuple
+    on_result: Optional[Callable[[Any], None]]
+    on_error: Optional[Callable[[Exception], None]]
+    submitted_at: float
+
+
+class _Worker(QThread):
+    """キューから要求を取り出して順に実行するスレッド"""
+
+    finished_request = pyqtSignal(object, object, object)  # 要求, 結果, 例外
+
+    def __init__(self, service: "DataService"):
+        super().__init__()
+        self.service = service
+        self.requests: "queue.Queue[Optional[_Request]]" = queue.Queue()
+
+    def run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            if not self.service._is_current(request):
+                self.service._record_cancel()
+                continue
+            try:
+                result, error = request.func(*request.args), None
+            except Exception as e:  # 例外はGUIスレッドに引き渡す
+                result, error = None, e
+            self.finished_request.emit(request, result, error)
+
+
+class DataService(QObject):
+    """データベース呼び出しのバックグラウンド実行サービス"""
+
+    resultReady = pyqtSignal(str, object)  # キー, 結果
+    failed = pyqtSignal(str, object)       # キー, 例外
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._latest: Dict[str, int] = {}  # キー → 最新の要求ID
+        self._pending = 0
+        self._metrics = {
+            "submitted": 0, "completed": 0, "cancelled": 0, "failed": 0,
+            "total_latency": 0.0, "max_latency": 0.0, "last_latency": 0.0,
+        }
+        self._worker = _Worker(self)
+        self._worker.finished_request.connect(self._on_finished)
+        self._worker.start()
+
+    def submit(self, key: str, func: Callable, *args,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None) -> int:
+        """要求を登録（同じキーの古い要求は破棄される）
+
+        Args:
+            key (str): 要求の種類（"users" など）。選択変更ごとに同じキーで登録する
+            func (Callable): ワーカースレッドで実行する関数
+            on_result (Callable, optional): GUIスレッドで結果を受け取るコールバック
+            on_error (Callable, optional): GUIスレッドで例外を受け取るコールバック
+
+        Returns:
+            int: 要求ID
+        """
+        with self._lock:
+            self._next_id += 1
+            request = _Request(self._next_id, key, func, args, on_result, on_error,
+                               time.monotonic())
+            self._latest[key] = request.request_id
+            self._pending += 1
+            self._metrics["submitted"] += 1
+        self._worker.requests.put(request)
+        return request.request_id
+
+    def cancel(self, key: str) -> None:
+        """キーの未完了の要求を取り消す"""
+        with self._lock:
+            self._latest.pop(key, None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """キュー長と待ち時間の統計（時間はミリ秒）"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["queue_depth"] = self._pending
+            completed = metrics["completed"] + metrics["failed"]
+            metrics["avg_latency"] = metrics["total_latency"] / completed if completed else 0.0
+            return metrics
+
+    def shutdown(self, timeout_ms: int = 5000) -> None:
+        """ワーカースレッドの停止（未実行の要求は破棄）"""
+        with self._lock:
+            self._latest.clear()
+        self._worker.requests.put(None)
+        self._worker.wait(timeout_ms)
+
+    def _is_current(self, request: _Request) -> bool:
+        with self._lock:
+            return self._latest.get(request.key) == request.request_id
+
+    def _record_cancel(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._metrics["cancelled"] += 1
+
+    @pyqtSlot(object, object, object)
+    def _on_finished(self, request: _Request, result: Any, error: Optional[Exception]):
+        """GUIスレッドでの完了処理"""
+        latency = (time.monotonic() - request.submitted_at) * 1000
+        with self._lock:
+            self._pending -= 1
+            current = self._latest.get(request.key) == request.request_id
+            if not current:
+                self._metrics["cancelled"] += 1
+            else:
+                del self._latest[request.key]
+                self._metrics["failed" if error else "completed"] += 1
+                self._metrics["total_latency"] += latency
+                self._metrics["last_latency"] = latency
+                self._metrics["max_latency"] = max(self._metrics["max_latency"], latency)
+        if not current:
+            return
+        if error is not None:
+            if request.on_error:
+                request.on_error(error)
+            self.failed.emit(request.key, error)
+        else:
+            if request.on_result:
+                request.on_result(result)
+            self.resultReady.emit(request.key, result)
+
+
+_services: Dict[str, DataService] = {}
+
+
+def get_data_service(channel: str = "default") -> DataService:
+    """アプリケーション共通のデータサービスを取得（終了時に自動停止）
+
+    Args:
+        channel (str): 長時間かかる処理（"batch" など）は別のチャンネルを使い、
+            画面更新用の要求を待たせないようにする
+    """
+    service = _services.get(channel)
+    if service is None:
+        service = _services[channel] = DataService()
+        app = QCoreApplication.instance()
+        if app is not None and len(_services) == 1:
+            app.aboutToQuit.connect(_shutdown_services)
+    return service
+
+
+def _shutdown_services():
+    for service in _services.values():
+        service.shutdown()
+    _services.clear()
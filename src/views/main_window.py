@@ -7,11 +7,15 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QComboBox, QListWidget, QPushButton,
     QDialog, QLineEdit, QMessageBox, QTabWidget,
-    QSpinBox, QFrame, QGridLayout, QListWidgetItem
+    QSpinBox, QFrame, QGridLayout, QListWidgetItem, QApplication
 )
 from PyQt5.QtCore import Qt
-from .custom_widgets.radar_chart import RadarChartWidget
-from .custom_widgets.skill_grid import SkillGridWidget
+from ..skill_matrix_manager.views.custom_widgets import create_radar_chart
+from .data_service import get_data_service
+from .components.lazy_tab_widget import LazyTabWidget
+from .components.skill_grid import SkillGridWidget
+from .components.write_behind import WriteBehindBuffer
+from ..config import settings
 
 class MainWindow(QMainWindow):
     def __init__(self, db=None, parent=None):
@@ -19,8 +23,22 @@ class MainWindow(QMainWindow):
         self.db = db
         self.current_user_id = None
         self.categories = []
+        self.category_ids = []
         self.skill_grids = {}
+        self.skill_tab_pages = {}   # カテゴリーID → タブページ
+        self.skill_tab_state = {}   # カテゴリーID → (カテゴリー名, スキル名のタプル)
+        self._user_levels = {}      # 選択中ユーザーのカテゴリーID → {スキル名: レベル}
+        self.data_service = get_data_service()
+        self._users_request_key = f"users:{id(self)}"  # ウィンドウごとの要求キー
+        self._focus_flush_blocked = 0  # 0 より大きい間はフォーカス移動で書き込まない
+        # スキルレベルの編集は (ユーザー, カテゴリー, スキル) ごとにまとめて書き込む
+        self.skill_edits = WriteBehindBuffer(
+            self._write_skill_levels, settings.SKILL_EDITS["flush_delay_ms"], self
+        )
+        self.skill_edits.flushed.connect(self._on_skill_levels_flushed)
+        self.skill_edits.failed.connect(self._on_skill_levels_failed)
         self.init_ui()
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
         if self.db:
             self.refresh_groups()
             self.refresh_categories()
@@ -56,12 +74,15 @@ class MainWindow(QMainWindow):
         # カテゴリー管理セクション
         right_layout.addWidget(self._create_category_section())
         
-        # スキル管理タブ
-        self.skill_tabs = QTabWidget()
+        # スキル管理タブ（グリッドは表示されたカテゴリーのみ生成）
+        self.skill_tabs = LazyTabWidget(
+            evict_after_ms=settings.LAZY_TABS["evict_after_ms"]
+        )
+        self.skill_tabs.evicted.connect(self._on_skill_tab_evicted)
         right_layout.addWidget(self.skill_tabs)
         
         # レーダーチャート
-        self.radar_chart = RadarChartWidget(["未設定"])
+        self.radar_chart = create_radar_chart(backend=settings.RADAR_CHART["backend"])
         right_layout.addWidget(self.radar_chart)
         
         layout.addWidget(right_panel, stretch=2)
@@ -135,15 +156,13 @@ class MainWindow(QMainWindow):
         
         return section
 
-    def _create_skill_tab(self, category_id, category_name):
+    def _create_skill_tab(self, category_id, skill_names):
         """スキルタブの作成"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # スキルグリッド
-        skills = self.db.get_skills_in_category(category_id)
-        skill_names = [skill[1] for skill in skills]
-        grid = SkillGridWidget(skill_names)
+        grid = SkillGridWidget(list(skill_names))
         grid.skillLevelsChanged.connect(
             lambda levels: self._update_skill_levels(category_id, levels)
         )
@@ -159,6 +178,17 @@ class MainWindow(QMainWindow):
         
         return tab, grid
 
+    def _materialize_skill_tab(self, category_id, skill_names):
+        """タブ表示時のスキルグリッド生成"""
+        tab, grid = self._create_skill_tab(category_id, skill_names)
+        self.skill_grids[category_id] = grid
+        grid.set_levels(self._user_levels.get(category_id, {}))
+        return tab
+
+    def _on_skill_tab_evicted(self, page):
+        """破棄されたタブのグリッドの登録解除"""
+        self.skill_grids.pop(page.category_id, None)
+
     def refresh_groups(self):
         """グループリストの更新"""
         if not self.db:
@@ -176,11 +206,24 @@ class MainWindow(QMainWindow):
         
         self.user_list.clear()
         group_id = self.group_combo.currentData()
-        if group_id is not None:
-            users = self.db.get_users_in_group(group_id)
-            for user_id, user_name in users:
-                item = QListWidgetItem(user_name, self.user_list)
-                item.setData(Qt.UserRole, user_id)
+        if group_id is None:
+            self.data_service.cancel(self._users_request_key)
+            return
+        # グループを素早く切り替えた場合は最後の要求の結果だけが反映される
+        self.data_service.submit(
+            self._users_request_key, self.db.get_users_in_group, group_id,
+            on_result=self._populate_users,
+            on_error=lambda e: QMessageBox.warning(
+                self, 'エラー', f'ユーザーリストの更新に失敗しました: {e}'
+            )
+        )
+
+    def _populate_users(self, users):
+        """ユーザーリストへの反映"""
+        self.user_list.clear()
+        for user_id, user_name in users:
+            item = QListWidgetItem(user_name, self.user_list)
+            item.setData(Qt.UserRole, user_id)
 
     def refresh_categories(self):
         """カテゴリーの更新"""
@@ -191,13 +234,13 @@ class MainWindow(QMainWindow):
             self.category_list.clear()
             categories = self.db.get_categories()
             self.categories = [cat[1] for cat in categories]
+            self.category_ids = [cat[0] for cat in categories]
             for cat_id, cat_name in categories:
                 item = QListWidgetItem(cat_name)
                 item.setData(Qt.UserRole, cat_id)
                 self.category_list.addItem(item)
             
-            self.radar_chart.set_categories(self.categories)
-            self.update_skill_view()
+            self.update_skill_view(categories)
         except Exception as e:
             QMessageBox.warning(self, 'エラー', f'カテゴリーの更新に失敗しました: {e}')
 
@@ -361,102 +404,208 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(dialog, 'エラー', f'スキルの追加に失敗しました: {e}')
 
     def _update_skill_levels(self, category_id, levels):
-        """スキルレベルの更新"""
+        """スキルレベルの更新（書き込みとチャートの再計算は遅延してまとめる）"""
         if not self.current_user_id:
             return
         
-        try:
-            for skill_name, level in levels.items():
-                skill_id = self.db.get_skill_id(category_id, skill_name)
-                if skill_id:
-                    self.db.update_skill_level(
-                        self.current_user_id, skill_id, level
-                    )
-            
-            # レーダーチャートの更新
+        # レベル 0（未評価）は評価の削除として書き込む
+        cached = self._user_levels.setdefault(category_id, {})
+        for skill, level in levels.items():
+            if level:
+                cached[skill] = level
+            else:
+                cached.pop(skill, None)
+        self.skill_edits.update({
+            (self.current_user_id, category_id, skill): level
+            for skill, level in levels.items()
+        })
+
+    def _write_skill_levels(self, edits):
+        """まとめた編集の書き込み（スキル名の解決を含めて1トランザクション）
+
+        無効なレベルはデータベース側でスキルごとに読み飛ばすため、False になるのは
+        書き込み自体が失敗した場合のみ（その場合は編集をバッファに残して再試行する）。
+        """
+        evaluations = {}
+        for (user_id, category_id, skill), level in edits.items():
+            evaluations.setdefault((user_id, category_id), {})[skill] = level
+        return self.db.set_evaluations_by_category(evaluations)
+
+    def _on_skill_levels_flushed(self, edits):
+        """書き込み後のレーダーチャートの更新（まとめた編集につき1回）"""
+        if any(user_id == self.current_user_id for user_id, _, _ in edits):
             self.update_radar_chart()
-        except Exception as e:
-            QMessageBox.warning(
-                self, 'エラー', f'スキルレベルの更新に失敗しました: {e}'
-            )
+
+    def _on_skill_levels_failed(self, edits, error):
+        """書き込み失敗時の通知（編集はバッファに残り、次の書き込みで再試行する）
+
+        ダイアログがフォーカスを奪っても再度書き込んで通知を重ねないよう、
+        表示中はフォーカス移動による書き込みを止める。
+        """
+        detail = f': {error}' if error else ''
+        self._focus_flush_blocked += 1
+        try:
+            QMessageBox.warning(self, 'エラー', f'スキルレベルの保存に失敗しました{detail}')
+        finally:
+            self._focus_flush_blocked -= 1
+
+    def _on_focus_changed(self, old, new):
+        """スキルタブからフォーカスが外れたら編集を書き込む"""
+        if self._focus_flush_blocked:
+            return
+        if old is not None and self.skill_tabs.isAncestorOf(old) and not (
+                new is not None and self.skill_tabs.isAncestorOf(new)):
+            self.skill_edits.flush()
+
+    def closeEvent(self, event):
+        """終了前に未書き込みの編集を書き込む（確認ダイアログ表示中は書き込まない）"""
+        self._focus_flush_blocked += 1
+        try:
+            if not self.skill_edits.flush():
+                answer = QMessageBox.question(
+                    self, '確認', '保存されていないスキルレベルがあります。破棄して終了しますか？',
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+                )
+                if answer != QMessageBox.Yes:
+                    event.ignore()
+                    return
+                self.skill_edits.discard()
+        finally:
+            self._focus_flush_blocked -= 1
+        super().closeEvent(event)
 
     def on_group_selected(self, index):
         """グループ選択時の処理"""
         self.refresh_users()
         self.current_user_id = None
-        self.update_skill_view()
+        # カテゴリー・スキル構成は変わらないためレベルのみクリア
+        self.load_user_skills()
 
     def on_user_selected(self):
         """ユーザー選択時の処理"""
         current_item = self.user_list.currentItem()
         if current_item:
             self.current_user_id = current_item.data(Qt.UserRole)
-            self.update_skill_view()
+            self.load_user_skills()
+
+    def update_skill_view(self, categories=None):
+        """スキルビューの更新
 
-    def update_skill_view(self):
-        """スキルビューの更新"""
+        現在のカテゴリー・スキル構成と既存のタブを比較し、
+        追加・削除・変更されたカテゴリーのタブだけを作り直す。
+
+        Args:
+            categories (list, optional): (カテゴリーID, カテゴリー名) のリスト（省略時は取得）
+        """
         try:
-            # タブをクリア
-            self.skill_tabs.clear()
+            if categories is None:
+                categories = self.db.get_categories()
+            # カテゴリーごとのスキルを1クエリで取得
+            skills_by_category = self.db.get_skills_by_category()
             
-            # カテゴリごとにタブを作成
-            self.skill_grids = {}  # カテゴリIDごとのグリッドを保持
-            categories = self.db.get_categories()
+            wanted = {
+                category_id: (
+                    category_name,
+                    tuple(name for _, name in skills_by_category.get(category_id, []))
+                )
+                for category_id, category_name in categories
+            }
             
-            for category_id, category_name in categories:
-                tab, grid = self._create_skill_tab(category_id, category_name)
-                self.skill_tabs.addTab(tab, category_name)
-                self.skill_grids[category_id] = grid
+            # 削除されたカテゴリーのタブを破棄
+            for category_id in [cid for cid in self.skill_tab_pages if cid not in wanted]:
+                self._remove_skill_tab(category_id)
+            
+            for position, (category_id, category_name) in enumerate(categories):
+                name, skill_names = wanted[category_id]
+                state = self.skill_tab_state.get(category_id)
+                if state is not None and state[1] != skill_names:
+                    # スキル構成が変わったタブのみ作り直す
+                    self._remove_skill_tab(category_id)
+                    state = None
+                
+                if state is None:
+                    page = self.skill_tabs.insertLazyTab(
+                        position,
+                        lambda cid=category_id, names=skill_names:
+                            self._materialize_skill_tab(cid, names),
+                        name
+                    )
+                    page.category_id = category_id
+                    self.skill_tab_pages[category_id] = page
+                else:
+                    tab = self.skill_tab_pages[category_id]
+                    if self.skill_tabs.indexOf(tab) != position:
+                        self.skill_tabs.removeTab(self.skill_tabs.indexOf(tab))
+                        self.skill_tabs.insertTab(position, tab, name)
+                    elif state[0] != name:
+                        self.skill_tabs.setTabText(position, name)
+                self.skill_tab_state[category_id] = (name, skill_names)
             
             # 現在のユーザーのスキルレベルを設定
-            if self.current_user_id:
-                self.load_user_skills()
+            self.load_user_skills()
         
         except Exception as e:
             QMessageBox.warning(
                 self, 'エラー', f'スキルビューの更新に失敗しました: {e}'
             )
+
+    def _remove_skill_tab(self, category_id):
+        """カテゴリーのタブを破棄"""
+        tab = self.skill_tab_pages.pop(category_id)
+        self.skill_grids.pop(category_id, None)
+        self.skill_tab_state.pop(category_id, None)
+        index = self.skill_tabs.indexOf(tab)
+        if index >= 0:
+            self.skill_tabs.removeTab(index)
+        tab.deleteLater()
     
     def load_user_skills(self):
         """ユーザーのスキルレベルを読み込み"""
+        # 未書き込みの編集を反映してから読み込む
+        self.skill_edits.flush()
         try:
+            if not self.current_user_id:
+                self._user_levels = {}
+                for grid in self.skill_grids.values():
+                    grid.set_levels({})
+                self.update_radar_chart()
+                return
+            
+            # グリッドとレーダーチャートで同じ取得結果を使う
+            # （未生成のタブは生成時に self._user_levels から設定する）
+            summary = self.db.get_user_skill_summary(self.current_user_id)
+            self._user_levels = summary.levels
             for category_id, grid in self.skill_grids.items():
-                skills = self.db.get_user_skills(
-                    self.current_user_id, category_id
-                )
-                levels = {skill[0]: skill[1] for skill in skills}
-                grid.set_levels(levels)
+                grid.set_levels(summary.levels.get(category_id, {}))
             
             # レーダーチャートの更新
-            self.update_radar_chart()
+            self.update_radar_chart(summary.averages)
         
         except Exception as e:
             QMessageBox.warning(
                 self, 'エラー', f'スキルレベルの読み込みに失敗しました: {e}'
             )
     
-    def update_radar_chart(self):
-        """レーダーチャートの更新"""
+    def update_radar_chart(self, averages=None):
+        """レーダーチャートの更新
+
+        Args:
+            averages (dict, optional): カテゴリーID → 平均レベル（省略時は集計クエリで取得）
+        """
         try:
             if not self.current_user_id:
-                self.radar_chart.update_data([0] * len(self.categories))
+                self.radar_chart.update_data(dict.fromkeys(self.categories, 0))
                 return
             
-            # カテゴリごとの平均スキルレベルを計算
-            levels = []
-            for category_id, _ in self.db.get_categories():
-                skills = self.db.get_user_skills(
-                    self.current_user_id, category_id
-                )
-                if skills:
-                    avg_level = sum(skill[1] for skill in skills) / len(skills)
-                    levels.append(avg_level)
-                else:
-                    levels.append(0)
-            
-            self.radar_chart.update_data(levels)
+            # カテゴリごとの平均スキルレベル（GROUP BY 1回）
+            if averages is None:
+                averages = self.db.get_category_averages(self.current_user_id)
+            self.radar_chart.update_data({
+                name: averages.get(category_id, 0)
+                for category_id, name in zip(self.category_ids, self.categories)
+            })
         
         except Exception as e:
             QMessageBox.warning(
                 self, 'エラー', f'レーダーチャートの更新に失敗しました: {e}'
-            )
\ No newline at end of file
+            )
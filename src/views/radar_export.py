@@ -0,0 +1,110 @@
+"""レーダーチャート一覧のPDF出力
+Created: 2026-10-18 10:48:03
+Author: GingaDza
+
+export_user_radar_pdf は "batch" チャネルのワーカーで呼ばれる。
+RadarExportController は出力ボタンを持つ画面（データ入出力タブ・レーダーチャートタブ・
+システム管理タブ）で共通の、出力の開始と進捗・完了の表示を受け持つ。
+"""
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QFileDialog, QMessageBox
+from ..analytics import EVALUATIONS_SOURCE, USER_SKILLS_SOURCE, SkillMatrix
+from ..config.schema import EVALUATIONS, USER_SKILLS, detect_schema
+from ..data_io import export_matrix_radar_pdf
+from ..database import get_pool
+from ..utils.logger import setup_logger
+from .data_service import get_data_service
+
+# スキーマ名 → (行列の読み込み元, カテゴリーID → 名称のSQL)
+# skill_matrix_manager のスキーマはカテゴリーを名称で保持するため対応表は不要
+RADAR_SOURCES = {
+    EVALUATIONS.name: (EVALUATIONS_SOURCE, "SELECT id, name FROM categories"),
+    USER_SKILLS.name: (USER_SKILLS_SOURCE, None),
+}
+
+
+def export_user_radar_pdf(db_path, file_path, group_id=None, progress=None):
+    """全ユーザー（または指定グループ）のレーダーチャート一覧をPDFに出力
+
+    評価は共有プールの接続から1回のSELECTで行列に読み込み、描画はプロセスプールで行う。
+    読み込むテーブルはデータベースの user_version から判定したスキーマに従う。
+
+    Raises:
+        ValueError: スキーマが未作成または不明な場合
+    """
+    with get_pool(db_path).connection() as conn:
+        schema = detect_schema(conn)
+        if schema not in RADAR_SOURCES:
+            raise ValueError(f"スキーマを判定できません: {db_path}")
+        source, labels_sql = RADAR_SOURCES[schema]
+        matrix = SkillMatrix.from_connection(conn, source)
+        labels = dict(conn.execute(labels_sql)) if labels_sql else None
+    user_ids = None if group_id is None else matrix.group_user_ids(group_id)
+    return export_matrix_radar_pdf(matrix, file_path, user_ids, labels, progress)
+
+
+class RadarExportController(QObject):
+    """レーダーチャート一覧の出力の開始と、ボタン・進捗バー・完了通知の更新
+
+    Args:
+        widget (QWidget): ダイアログの親となる画面
+        button (QPushButton): 出力中は無効にするボタン
+        progress_bar (QProgressBar): 出力中に表示する進捗バー
+    """
+
+    progress_changed = pyqtSignal(int, int)  # 出力済み件数, 総数
+
+    def __init__(self, widget, button, progress_bar):
+        super().__init__(widget)
+        self.widget = widget
+        self.button = button
+        self.progress_bar = progress_bar
+        self.service = get_data_service("batch")
+        self.logger = setup_logger(__name__)
+        # ワーカースレッドからの進捗はシグナル経由でGUIスレッドに渡す
+        self.progress_changed.connect(self._on_progress)
+
+    def choose_file(self, db_path, group_id=None):
+        """保存先を選択して出力を開始"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self.widget,
+            "レーダーチャート一覧のPDF出力",
+            "",
+            "PDF Files (*.pdf)"
+        )
+        if file_path:
+            self.start(db_path, file_path, group_id)
+
+    def start(self, db_path, file_path, group_id=None):
+        """出力をバックグラウンドで開始"""
+        self.logger.info(f"レーダーチャート一覧の出力を開始します: {file_path}")
+        self.button.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.service.submit(
+            f"radar_pdf:{id(self)}", export_user_radar_pdf,
+            db_path, file_path, group_id, self.report_progress,
+            on_result=self._on_exported, on_error=self._on_failed
+        )
+
+    def report_progress(self, done, total):
+        """ワーカースレッドから呼ばれる進捗通知（同じ進捗バーを使う他の出力からも使える）"""
+        self.progress_changed.emit(done, total or 0)
+
+    def _on_progress(self, done, total):
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(done)
+
+    def _on_exported(self, pages):
+        self.button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self.logger.info(f"レーダーチャート一覧を出力しました（{pages}ページ）")
+        QMessageBox.information(self.widget, "成功",
+                                f"レーダーチャート一覧を出力しました（{pages}ページ）")
+
+    def _on_failed(self, error):
+        self.button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self.logger.error(f"レーダーチャート一覧の出力に失敗しました: {error}")
+        QMessageBox.warning(self.widget, "エラー",
+                            f"レーダーチャート一覧の出力に失敗しました: {error}")
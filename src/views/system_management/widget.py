@@ -6,15 +6,21 @@ Author: GingaDza
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QLabel, 
     QPushButton, QGridLayout, QListWidget,
-    QHBoxLayout, QFrame
+    QHBoxLayout, QFrame, QProgressBar
 )
 from datetime import datetime
+import os
 import platform
 import psutil
+from ...config import settings
+from ...utils.logger import setup_logger
+from ..radar_export import RadarExportController
 
 class SystemManagementWidget(QWidget):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, parent=None, db_path=None):
+        super().__init__(parent)
+        self.logger = setup_logger(__name__)
+        self.db_path = db_path or os.path.join("data", settings.DATABASE["name"])
         self._init_ui()
         
     def _init_ui(self):
@@ -104,10 +110,18 @@ class SystemManagementWidget(QWidget):
         export_group.setFrameStyle(QFrame.Panel | QFrame.Raised)
         export_layout = QVBoxLayout(export_group)
         export_layout.addWidget(QLabel("データのエクスポート"))
-        export_layout.addWidget(QPushButton("レーダーチャート一覧のPDF出力"))
+        self.export_radar_btn = QPushButton("レーダーチャート一覧のPDF出力")
+        self.export_radar_btn.clicked.connect(self._export_radar_charts)
+        export_layout.addWidget(self.export_radar_btn)
         export_layout.addWidget(QPushButton("全データのCSVエクスポート"))
         layout.addWidget(export_group)
         
+        # プログレスバー
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.radar_export = RadarExportController(self, self.export_radar_btn, self.progress_bar)
+        
         return widget
         
     def _create_system_info_tab(self):
@@ -128,7 +142,7 @@ class SystemManagementWidget(QWidget):
             f"メモリ使用率: {psutil.virtual_memory().percent}%",
             f"CPU使用率: {psutil.cpu_percent()}%",
             f"ログインユーザー: GingaDza",
-            f"データベースパス: data/skill_matrix.db"
+            f"データベースパス: {self.db_path}"
         ]
         
         for info in system_info:
@@ -140,4 +154,12 @@ class SystemManagementWidget(QWidget):
     def _on_add_tab_clicked(self):
         """新規タブ追加ボタンのクリックハンドラ"""
         # TODO: 新規タブの追加処理を実装
-        pass
\ No newline at end of file
+        pass
+
+    def _export_radar_charts(self):
+        """レーダーチャート一覧のPDF出力"""
+        self.radar_export.choose_file(self.db_path)
+
+    def export_radar_charts(self, file_path, group_id=None):
+        """レーダーチャート一覧の出力をバックグラウンドで開始"""
+        self.radar_export.start(self.db_path, file_path, group_id)
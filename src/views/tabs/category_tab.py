@@ -11,6 +11,7 @@ from ...database.category_manager import CategoryManager
 from ..dialogs.category_dialog import CategoryDialog
 from ...utils.logger import setup_logger
 from ...models.category import Category
+from ..data_service import get_data_service
 
 class CategoryTab(QWidget):
     """カテゴリー管理タブ"""
@@ -19,6 +20,8 @@ class CategoryTab(QWidget):
         super().__init__(parent)
         self.logger = setup_logger(__name__)
         self.category_manager = CategoryManager()
+        self.data_service = get_data_service()
+        self._request_key = f"categories:{id(self)}"  # ウィジェットごとの要求キー
         self._init_ui()
         self._load_categories()
 
@@ -47,17 +50,34 @@ class CategoryTab(QWidget):
         layout.addWidget(self.tree)
 
     def _load_categories(self):
-        """カテゴリー一覧の読み込み"""
+        """カテゴリー一覧の読み込み（ワーカースレッドで取得）"""
+        self.data_service.submit(
+            self._request_key, self._fetch_categories,
+            on_result=self._populate_tree,
+            on_error=lambda e: self.logger.error(f"カテゴリー一覧の取得に失敗しました: {e}")
+        )
+
+    def _fetch_categories(self):
+        """全カテゴリーを親から順に取得（ツリーの親項目が先に作られるように）"""
+        categories = self.category_manager.get_categories()
+        index = 0
+        while index < len(categories):
+            categories.extend(self.category_manager.get_categories(categories[index].id))
+            index += 1
+        return categories
+
+    def _populate_tree(self, categories):
+        """カテゴリーツリーへの反映"""
         self.tree.clear()
-        categories = self.category_manager.get_all_categories()
         
         # 親カテゴリーのマップを作成
-        category_map = {None: self.tree}
+        root = self.tree.invisibleRootItem()
+        category_map = {None: root}
         for category in categories:
             item = QTreeWidgetItem([category.name, category.description or ""])
             item.setData(0, 256, category)  # カスタムデータとしてカテゴリーオブジェクトを保存
             
-            parent = category_map.get(category.parent_id, self.tree)
+            parent = category_map.get(category.parent_id, root)
             parent.addChild(item)
             category_map[category.id] = item
 
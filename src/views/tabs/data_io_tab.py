@@ -2,20 +2,33 @@
 Created: 2025-02-08 14:32:34
 Author: GingaDza
 """
+import os
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QGroupBox, QFileDialog,
-    QProgressBar, QLabel
+    QProgressBar, QLabel, QMessageBox
 )
+from ...config import settings
+from ...database import EvaluationManager
 from ...utils.logger import setup_logger
+from ..data_service import get_data_service
+from ..radar_export import RadarExportController
+
 
 class DataIOTab(QWidget):
     """データ入出力タブ"""
 
-    def __init__(self, parent=None):
+    import_progress = pyqtSignal(object)     # ImportProgress
+
+    def __init__(self, parent=None, db_path=None):
         super().__init__(parent)
         self.logger = setup_logger(__name__)
+        self.db_path = db_path or os.path.join("data", settings.DATABASE["name"])
+        self.batch_service = get_data_service("batch")
         self._init_ui()
+        # 取り込みの進捗はワーカースレッドからシグナル経由で受け取る
+        self.import_progress.connect(self._on_import_progress)
 
     def _init_ui(self):
         """UIの初期化"""
@@ -47,12 +60,19 @@ class DataIOTab(QWidget):
         export_report_btn.clicked.connect(self._export_report)
         export_layout.addWidget(export_report_btn)
         
+        self.export_radar_btn = QPushButton("レーダーチャート一覧のPDF出力")
+        self.export_radar_btn.clicked.connect(self._export_radar_charts)
+        export_layout.addWidget(self.export_radar_btn)
+        
         layout.addWidget(export_group)
 
         # プログレスバー
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.radar_export = RadarExportController(self, self.export_radar_btn, self.progress_bar)
         
         layout.addStretch()
 
@@ -62,23 +82,61 @@ class DataIOTab(QWidget):
             self,
             "スキルデータのインポート",
             "",
-            "Excel Files (*.xlsx);;CSV Files (*.csv)"
+            "CSV Files (*.csv)"
         )
         if file_path:
             self.logger.info(f"スキルデータのインポートを開始します: {file_path}")
-            # TODO: インポート処理の実装
+            self.import_csv(file_path, levels=True)
 
     def _import_groups(self):
-        """グループデータのインポート"""
+        """グループデータのインポート（group, user 列のCSV）"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "グループデータのインポート",
             "",
-            "Excel Files (*.xlsx);;CSV Files (*.csv)"
+            "CSV Files (*.csv)"
         )
         if file_path:
             self.logger.info(f"グループデータのインポートを開始します: {file_path}")
-            # TODO: インポート処理の実装
+            self.import_csv(file_path, levels=False)
+
+    def import_csv(self, file_path, levels=None):
+        """CSVの取り込みをバックグラウンドで開始
+
+        levels は EvaluationManager.import_csv と同じ（False はグループとユーザーのみ）
+        """
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.batch_service.submit(
+            f"csv_import:{id(self)}", self._run_import, file_path, levels,
+            on_result=self._on_imported, on_error=self._on_import_failed
+        )
+
+    def _run_import(self, file_path, levels):
+        """ワーカースレッドでの取り込み"""
+        return EvaluationManager(self.db_path).import_csv(
+            file_path, self.import_progress.emit, levels
+        )
+
+    def _on_import_progress(self, progress):
+        self.progress_bar.setValue(progress.percent)
+        self.status_label.setText(
+            f"{progress.rows:,} 行 ({progress.rows_per_second:,.0f} 行/秒)"
+        )
+
+    def _on_imported(self, result):
+        self.progress_bar.setVisible(False)
+        self.status_label.setText(
+            f"{result.rows:,} 行を取り込みました（評価 {result.imported:,} 件、"
+            f"スキップ {result.skipped:,} 行、{result.rows_per_second:,.0f} 行/秒）"
+        )
+
+    def _on_import_failed(self, error):
+        self.progress_bar.setVisible(False)
+        self.status_label.clear()
+        self.logger.error(f"インポートに失敗しました: {error}")
+        QMessageBox.warning(self, "エラー", f"インポートに失敗しました: {error}")
 
     def _export_skills(self):
         """スキルデータのエクスポート"""
@@ -90,7 +148,32 @@ class DataIOTab(QWidget):
         )
         if file_path:
             self.logger.info(f"スキルデータのエクスポートを開始します: {file_path}")
-            # TODO: エクスポート処理の実装
+            self.export_skills(file_path)
+
+    def export_skills(self, file_path):
+        """スキルマトリックスの出力をバックグラウンドで開始"""
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.batch_service.submit(
+            f"matrix_export:{id(self)}", self._run_skill_export, file_path,
+            on_result=self._on_skills_exported, on_error=self._on_skill_export_failed
+        )
+
+    def _run_skill_export(self, file_path):
+        """ワーカースレッドでの出力（拡張子が .xlsx ならXLSX、それ以外はCSV）"""
+        manager = EvaluationManager(self.db_path)
+        if file_path.lower().endswith(".xlsx"):
+            return manager.export_xlsx(file_path, self.radar_export.report_progress)
+        return manager.export_csv(file_path, self.radar_export.report_progress)
+
+    def _on_skills_exported(self, count):
+        self.progress_bar.setVisible(False)
+        self.status_label.setText(f"{count:,} 人分のスキルデータを出力しました")
+
+    def _on_skill_export_failed(self, error):
+        self.progress_bar.setVisible(False)
+        self.logger.error(f"スキルデータのエクスポートに失敗しました: {error}")
+        QMessageBox.warning(self, "エラー", f"スキルデータのエクスポートに失敗しました: {error}")
 
     def _export_report(self):
         """レポートの出力"""
@@ -103,3 +186,11 @@ class DataIOTab(QWidget):
         if file_path:
             self.logger.info(f"レポートの出力を開始します: {file_path}")
             # TODO: レポート出力処理の実装
+
+    def _export_radar_charts(self):
+        """レーダーチャート一覧のPDF出力"""
+        self.radar_export.choose_file(self.db_path)
+
+    def export_radar_charts(self, file_path, group_id=None):
+        """レーダーチャート一覧の出力をバックグラウンドで開始"""
+        self.radar_export.start(self.db_path, file_path, group_id)
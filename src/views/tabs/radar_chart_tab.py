@@ -2,18 +2,22 @@
 Created: 2025-02-08 14:32:34
 Author: GingaDza
 """
+import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QComboBox, QLabel
+    QPushButton, QComboBox, QLabel, QProgressBar
 )
+from ...config import settings
 from ...utils.logger import setup_logger
+from ..radar_export import RadarExportController
 
 class RadarChartTab(QWidget):
     """レーダーチャートタブ"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, db_path=None):
         super().__init__(parent)
         self.logger = setup_logger(__name__)
+        self.db_path = db_path or os.path.join("data", settings.DATABASE["name"])
         self._init_ui()
 
     def _init_ui(self):
@@ -35,18 +39,22 @@ class RadarChartTab(QWidget):
 
         # 操作ボタン
         button_layout = QHBoxLayout()
-        export_btn = QPushButton("PDFエクスポート")
-        export_btn.clicked.connect(self._export_pdf)
-        button_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("PDFエクスポート")
+        self.export_btn.clicked.connect(self._export_pdf)
+        button_layout.addWidget(self.export_btn)
         
         layout.addLayout(button_layout)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.radar_export = RadarExportController(self, self.export_btn, self.progress_bar)
+
     def _update_chart(self):
         """チャートの更新"""
         self.logger.info("レーダーチャートを更新します")
         # TODO: チャート更新処理の実装
 
     def _export_pdf(self):
-        """PDFエクスポート"""
-        self.logger.info("レーダーチャートをPDFにエクスポートします")
-        # TODO: PDFエクスポート処理の実装
+        """PDFエクスポート（表示中のグループ、未選択なら全ユーザー）"""
+        self.radar_export.choose_file(self.db_path, self.group_combo.currentData())
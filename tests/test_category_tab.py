@@ -0,0 +1,75 @@
+"""カテゴリー管理タブのテスト
+Created: 2026-10-18 14:20:00
+Author: GingaDza
+"""
+import importlib
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+from unittest.mock import patch
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtWidgets import QApplication
+import src.views
+from src.database import close_all_pools
+from src.database.category_manager import CategoryManager
+
+
+def _import_category_tab():
+    """src.views.tabs の __init__ を経由せずに category_tab を読み込む
+
+    パッケージの __init__ は存在しないタブをインポートしているため、
+    同じディレクトリを指す空のパッケージとして登録してから読み込む。
+    """
+    package = types.ModuleType("src.views.tabs")
+    package.__path__ = [os.path.join(os.path.dirname(src.views.__file__), "tabs")]
+    with patch.dict(sys.modules, {"src.views.tabs": package}):
+        return importlib.import_module("src.views.tabs.category_tab")
+
+
+category_tab = _import_category_tab()
+
+class TestCategoryTab(unittest.TestCase):
+    """カテゴリー管理タブのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = CategoryManager(os.path.join(self.temp_dir.name, "test.db"))
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        self.temp_dir.cleanup()
+
+    def _wait_for(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+
+    def test_load_categories(self):
+        """実際のカテゴリー管理クラスから親子のツリーを読み込むことのテスト"""
+        parent_id = self.manager.create_category("プログラミング")
+        self.manager.create_category("Web", parent_id)
+        self.manager.create_category("デザイン")
+
+        with patch.object(category_tab, "CategoryManager", return_value=self.manager):
+            tab = category_tab.CategoryTab()
+        try:
+            self._wait_for(lambda: tab.tree.topLevelItemCount() == 2)
+            roots = [tab.tree.topLevelItem(i) for i in range(tab.tree.topLevelItemCount())]
+            self.assertEqual(sorted(item.text(0) for item in roots), ["デザイン", "プログラミング"])
+            parent = next(item for item in roots if item.text(0) == "プログラミング")
+            self.assertEqual([parent.child(i).text(0) for i in range(parent.childCount())], ["Web"])
+        finally:
+            tab.deleteLater()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""評価テーブルの WITHOUT ROWID 化のテスト
+Created: 2026-10-17 23:58:36
+Author: GingaDza
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from src.database.migrations import V20261017234500__compact_evaluation_storage as compact
+from src.models.evaluation import Evaluation
+from src.models.timestamps import parse_timestamp, to_epoch
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.database.manager import DatabaseManager
+
+class TestCompactStorage(unittest.TestCase):
+    """評価テーブルの WITHOUT ROWID 化のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE evaluations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                skill_id INTEGER NOT NULL,
+                level INTEGER NOT NULL CHECK (level >= 1 AND level <= 5),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(user_id, skill_id)
+            );
+            CREATE TABLE user_skills (
+                user_id INTEGER,
+                skill_id INTEGER,
+                level INTEGER DEFAULT 0,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, skill_id)
+            );
+            INSERT INTO evaluations (user_id, skill_id, level, created_at, updated_at) VALUES
+                (1, 10, 3, '2025-02-08 14:04:05', '2026-10-17 09:00:00'),
+                (1, 11, 5, '2025-02-08 14:04:05', 1760691600),
+                (2, 10, 1, NULL, 'invalid');
+            INSERT INTO user_skills (user_id, skill_id, level, updated_at) VALUES
+                (1, 10, 4, '2026-10-17 09:00:00');
+        """)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+
+    def _sql(self, table):
+        return self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = ?", (table,)
+        ).fetchone()[0]
+
+    def test_upgrade(self):
+        """rowid テーブルから WITHOUT ROWID テーブルへの変換のテスト"""
+        compact.upgrade(self.conn.cursor())
+        for table in ("evaluations", "user_skills"):
+            self.assertIn("WITHOUT ROWID", self._sql(table))
+        self.assertIsNotNone(self._sql("idx_evaluations_skill_id"))
+
+        rows = self.conn.execute(
+            "SELECT user_id, skill_id, level, created_at, updated_at FROM evaluations"
+        ).fetchall()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][:3], (1, 10, 3))
+        self.assertEqual(rows[0][3], to_epoch(datetime(2025, 2, 8, 14, 4, 5)))
+        self.assertEqual(rows[0][4], to_epoch(datetime(2026, 10, 17, 9, 0, 0)))
+        self.assertEqual(rows[1][4], 1760691600)
+        # 不正な日時は現在時刻で補う
+        self.assertTrue(all(isinstance(value, int) for row in rows for value in row))
+
+        self.assertEqual(
+            self.conn.execute("SELECT created_at, updated_at FROM user_skills").fetchone(),
+            (to_epoch(datetime(2026, 10, 17, 9, 0, 0)),) * 2
+        )
+
+    def test_upgrade_is_idempotent(self):
+        """変換済みのテーブルはそのままにすることのテスト"""
+        compact.upgrade(self.conn.cursor())
+        before = self.conn.execute("SELECT * FROM evaluations").fetchall()
+        compact.upgrade(self.conn.cursor())
+        self.assertEqual(self.conn.execute("SELECT * FROM evaluations").fetchall(), before)
+
+    def test_downgrade(self):
+        """rowid テーブルへ戻せることのテスト"""
+        compact.upgrade(self.conn.cursor())
+        compact.downgrade(self.conn.cursor())
+        self.assertNotIn("WITHOUT ROWID", self._sql("evaluations"))
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0], 3)
+
+    def test_skill_matrix_manager_database(self):
+        """マイグレーションを実行しない skill_matrix_manager の既存データベースの変換のテスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "skill_matrix.db")
+            conn = sqlite3.connect(db_path)
+            conn.executescript("""
+                CREATE TABLE user_skills (
+                    user_id INTEGER,
+                    skill_id INTEGER,
+                    level INTEGER DEFAULT 0,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, skill_id)
+                );
+                INSERT INTO user_skills (user_id, skill_id, level, updated_at)
+                    VALUES (1, 1, 4, '2026-10-17 09:00:00');
+                PRAGMA user_version = 202;
+            """)
+            conn.close()
+
+            DatabaseManager(db_path)
+            conn = sqlite3.connect(db_path)
+            try:
+                sql = conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = 'user_skills'"
+                ).fetchone()[0]
+                self.assertIn("WITHOUT ROWID", sql)
+                self.assertEqual(
+                    conn.execute("SELECT level, updated_at FROM user_skills").fetchall(),
+                    [(4, to_epoch(datetime(2026, 10, 17, 9, 0, 0)))]
+                )
+                self.assertIsNotNone(conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'idx_user_skills_skill_id'"
+                ).fetchone())
+            finally:
+                conn.close()
+
+    def test_evaluation_from_dict(self):
+        """エポック秒・文字列どちらの日時も読めることのテスト"""
+        epoch = to_epoch(datetime(2026, 10, 17, 9, 0, 0))
+        evaluation = Evaluation.from_dict({
+            "user_id": 1, "skill_id": 10, "level": 3,
+            "created_at": epoch, "updated_at": "2026-10-17 09:00:00", "skill_name": "Python",
+        })
+        self.assertEqual(evaluation.created_at, datetime(2026, 10, 17, 9, 0, 0))
+        self.assertEqual(evaluation.updated_at, evaluation.created_at)
+        self.assertEqual(evaluation.skill_name, "Python")
+        self.assertEqual(parse_timestamp(evaluation.created_at), evaluation.created_at)
+
+    def test_missing_timestamp_is_utc(self):
+        """日時がない場合は UTC の現在時刻になることのテスト"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for value in (None, ""):
+            parsed = parse_timestamp(value)
+            self.assertIsNone(parsed.tzinfo)
+            self.assertLess(abs(parsed - now), timedelta(minutes=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
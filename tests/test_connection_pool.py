@@ -0,0 +1,149 @@
+"""コネクションプールのテスト
+Created: 2026-10-17 09:31:02
+Author: GingaDza
+"""
+import os
+import threading
+import unittest
+from src.database.connection_pool import MEMORY_DB, ConnectionPool, get_pool, close_all_pools
+from src.database.exceptions import DatabaseError
+from src.database.group_manager import GroupManager
+from src.config import settings
+from src.config.pragmas import read_pragma_status
+
+TEST_DB = "test_connection_pool.db"
+
+class TestConnectionPool(unittest.TestCase):
+    """コネクションプールのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.pool = ConnectionPool(TEST_DB, size=2, timeout=0.2)
+
+    def test_reuses_idle_connection(self):
+        """アイドル接続の再利用のテスト"""
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            pass
+        self.assertIs(first, second)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats['opens'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_nested_checkout_shares_connection(self):
+        """同一スレッド内のネスト取得のテスト"""
+        with self.pool.connection() as outer:
+            with self.pool.connection() as inner:
+                self.assertIs(outer, inner)
+        self.assertEqual(self.pool.get_stats()['checkouts'], 1)
+
+    def test_commit_and_rollback(self):
+        """ブロック終了時のコミット・例外時のロールバックのテスト"""
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE t (v INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+        with self.assertRaises(RuntimeError):
+            with self.pool.connection() as conn:
+                conn.execute("INSERT INTO t VALUES (2)")
+                raise RuntimeError("boom")
+        with self.pool.connection() as conn:
+            rows = conn.execute("SELECT v FROM t").fetchall()
+        self.assertEqual([row[0] for row in rows], [1])
+
+    def test_wait_and_timeout(self):
+        """プール枯渇時の待機とタイムアウトのテスト"""
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with self.pool.connection():
+                held.set()
+                release.wait(2)
+
+        workers = [threading.Thread(target=hold) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+            held.wait(2)
+            held.clear()
+        try:
+            with self.assertRaises(DatabaseError):
+                with self.pool.connection():
+                    pass
+        finally:
+            release.set()
+            for worker in workers:
+                worker.join()
+        self.assertEqual(self.pool.get_stats()['waits'], 1)
+
+    def test_replaced_file_is_detected(self):
+        """データベースファイル置換時のヘルスチェックのテスト"""
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE t (v INTEGER)")
+        os.remove(TEST_DB)
+        with self.pool.connection() as conn:
+            tables = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            ).fetchall()
+        self.assertEqual(tables, [])
+        self.assertEqual(self.pool.get_stats()['health_failures'], 1)
+
+    def test_pragma_profile_applied(self):
+        """接続作成時のPRAGMAプロファイル適用のテスト"""
+        pool = ConnectionPool(TEST_DB, pragma_profile="bulk-load")
+        try:
+            with pool.connection() as conn:
+                status = read_pragma_status(conn)
+        finally:
+            pool.close()
+        profile = settings.PRAGMA_PROFILES["bulk-load"]
+        self.assertEqual(status['journal_mode'], "wal")
+        self.assertEqual(status['synchronous'], profile['synchronous'])
+        self.assertEqual(status['cache_size'], profile['cache_size'])
+        self.assertEqual(status['busy_timeout'], profile['busy_timeout'])
+
+    def test_unknown_pragma_profile(self):
+        """未定義プロファイル指定時のテスト"""
+        pool = ConnectionPool(TEST_DB, pragma_profile="no-such-profile")
+        with self.assertRaises(ValueError):
+            with pool.connection():
+                pass
+        self.assertEqual(pool.get_stats()['open'], 0)
+
+    def test_managers_share_pool(self):
+        """同一パスのマネージャー間でのプール共有のテスト"""
+        first = GroupManager(TEST_DB)
+        second = GroupManager(TEST_DB)
+        self.assertIs(first.pool, second.pool)
+        self.assertIs(first.pool, get_pool(TEST_DB))
+
+    def test_memory_database_uses_one_connection(self):
+        """:memory: のプールが1接続を共有してデータを保持することのテスト"""
+        pool = ConnectionPool(MEMORY_DB, size=5)
+        self.assertEqual(pool.size, 1)
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (id INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+        with pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM t").fetchone()[0], 1)
+        pool.resize(3)
+        self.assertEqual(pool.size, 1)
+        pool.close()
+
+    def test_shared_pool_size_not_changed(self):
+        """共有プール取得時のサイズ指定が既存のプールを変更しないことのテスト"""
+        pool = get_pool(TEST_DB, size=2)
+        with self.assertLogs(pool.logger.name, level="WARNING"):
+            self.assertIs(get_pool(TEST_DB, size=4), pool)
+        self.assertEqual(pool.size, 2)
+        self.assertIs(get_pool(TEST_DB, size=2), pool)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.pool.close()
+        close_all_pools()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""スキルマトリックスCSV出力のテスト
+Created: 2026-10-17 21:42:50
+Author: GingaDza
+"""
+import csv
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.data_io import (
+    USER_SKILLS_EXPORT, export_skill_levels_csv, export_skill_matrix_csv, import_skill_levels_csv,
+    iter_pivot_rows
+)
+
+class TestCsvExport(unittest.TestCase):
+    """スキルマトリックスCSV出力のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "matrix.csv")
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE categories (id INTEGER PRIMARY KEY, name TEXT, parent_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, category_id INTEGER, name TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE evaluations (
+                id INTEGER PRIMARY KEY, user_id INTEGER, skill_id INTEGER, level INTEGER,
+                updated_at TIMESTAMP, UNIQUE(user_id, skill_id)
+            );
+            INSERT INTO groups VALUES (1, '開発部');
+            INSERT INTO categories VALUES (1, 'プログラミング', NULL), (2, 'デザイン', NULL);
+            INSERT INTO skills VALUES (10, 1, 'Python'), (11, 1, 'SQL'), (20, 2, 'UI設計'),
+                                      (21, 2, 'SQL');
+            INSERT INTO users VALUES (1, '山田', 1), (2, '鈴木', NULL), (3, '佐藤', 1);
+            INSERT INTO evaluations (user_id, skill_id, level) VALUES
+                (1, 10, 4), (1, 20, 2), (3, 11, 5);
+        """)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def test_pivot_rows(self):
+        """ユーザーを行・スキルを列とする展開のテスト"""
+        rows = list(iter_pivot_rows(self.conn))
+        # カテゴリー名・スキル名順、重複するスキル名はカテゴリーを付ける
+        self.assertEqual(rows[0], ["group", "user", "デザイン/SQL", "UI設計", "Python", "プログラミング/SQL"])
+        self.assertEqual(rows[1:], [
+            ["開発部", "山田", "", 2, 4, ""],
+            ["", "鈴木", "", "", "", ""],
+            ["開発部", "佐藤", "", "", "", 5],
+        ])
+
+    def test_export_with_progress(self):
+        """ファイル出力と進捗通知のテスト"""
+        progress = []
+        written = export_skill_matrix_csv(self.conn, self.path,
+                                          progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(written, 3)
+        self.assertEqual(progress, [(3, 3)])
+        with open(self.path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[1], ["開発部", "山田", "", "2", "4", ""])
+
+    def test_user_skills_schema(self):
+        """カテゴリーを名称で保持するスキーマからの出力のテスト"""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, name TEXT, category TEXT);
+            CREATE TABLE user_skills (user_id INTEGER, skill_id INTEGER, level INTEGER,
+                                      PRIMARY KEY (user_id, skill_id));
+            INSERT INTO users VALUES (1, '山田', NULL);
+            INSERT INTO skills VALUES (1, 'Python', 'プログラミング'), (2, 'Figma', 'デザイン');
+            INSERT INTO user_skills VALUES (1, 1, 3), (1, 2, 0);
+        """)
+        self.assertEqual(list(iter_pivot_rows(conn, USER_SKILLS_EXPORT)),
+                         [["group", "user", "Figma", "Python"], ["", "山田", "", 3]])
+        conn.close()
+
+    def test_roundtrip_row_count(self):
+        """縦持ちCSVの取り込み結果を出力できることのテスト"""
+        source = os.path.join(self.temp_dir.name, "levels.csv")
+        with open(source, "w", encoding="utf-8", newline="") as f:
+            f.write("group,user,category,skill,level\n")
+            f.writelines(f"営業部,user{i},デザイン,UI設計,{i % 5 + 1}\n" for i in range(50))
+        import_skill_levels_csv(self.conn, source)
+        self.assertEqual(export_skill_matrix_csv(self.conn, self.path), 53)
+
+    def test_export_skill_levels(self):
+        """取り込みと同じ縦持ち形式の出力と再取り込みのテスト"""
+        progress = []
+        written = export_skill_levels_csv(self.conn, self.path,
+                                          progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(written, 3)
+        self.assertEqual(progress, [(3, 3)])
+        with open(self.path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows, [
+            ["group", "user", "category", "skill", "level"],
+            ["開発部", "山田", "デザイン", "UI設計", "2"],
+            ["開発部", "山田", "プログラミング", "Python", "4"],
+            ["開発部", "佐藤", "プログラミング", "SQL", "5"],
+        ])
+        result = import_skill_levels_csv(self.conn, self.path)
+        self.assertEqual((result.imported, sum(result.created.values())), (3, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
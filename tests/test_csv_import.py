@@ -0,0 +1,148 @@
+"""スキルレベルCSV取り込みのテスト
+Created: 2026-10-17 20:58:14
+Author: GingaDza
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.data_io import (
+    USER_SKILLS_SCHEMA, import_skill_levels_csv
+)
+
+class TestCsvImport(unittest.TestCase):
+    """スキルレベルCSV取り込みのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+            CREATE TABLE categories (id INTEGER PRIMARY KEY, name TEXT, parent_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, category_id INTEGER, name TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, employee_id TEXT, name TEXT, group_id INTEGER);
+            CREATE TABLE evaluations (
+                id INTEGER PRIMARY KEY, user_id INTEGER, skill_id INTEGER, level INTEGER,
+                updated_at TIMESTAMP, UNIQUE(user_id, skill_id)
+            );
+            INSERT INTO groups VALUES (1, '開発部');
+            INSERT INTO categories VALUES (1, 'プログラミング', NULL);
+            INSERT INTO skills VALUES (10, 1, 'Python');
+            INSERT INTO users VALUES (100, NULL, '山田', 1);
+        """)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def write_csv(self, text):
+        path = os.path.join(self.temp_dir.name, "levels.csv")
+        with open(path, "w", encoding="utf-8-sig", newline="") as f:
+            f.write(text)
+        return path
+
+    def test_import_resolves_and_creates_names(self):
+        """既存の名称の解決と未登録の名称の作成のテスト"""
+        path = self.write_csv(
+            "group,user,category,skill,level\n"
+            "開発部,山田,プログラミング,Python,4\n"
+            "開発部,山田,プログラミング,SQL,3\n"
+            "営業部,鈴木,プログラミング,Python,2\n"
+        )
+        result = import_skill_levels_csv(self.conn, path)
+        self.assertEqual((result.rows, result.imported, result.skipped), (3, 3, 0))
+        self.assertEqual(result.created, {"groups": 1, "categories": 0, "skills": 1, "users": 1})
+        levels = self.conn.execute("""
+            SELECT u.name, s.name, e.level FROM evaluations e
+            JOIN users u ON u.id = e.user_id JOIN skills s ON s.id = e.skill_id
+            ORDER BY e.id
+        """).fetchall()
+        self.assertEqual(levels, [("山田", "Python", 4), ("山田", "SQL", 3), ("鈴木", "Python", 2)])
+
+    def test_reimport_updates_levels(self):
+        """再取り込みで変更のある評価のみ更新されることのテスト"""
+        self.conn.execute("INSERT INTO evaluations VALUES (1, 100, 10, 4, 'old')")
+        path = self.write_csv("グループ,ユーザー,カテゴリー,スキル,レベル\n開発部,山田,プログラミング,Python,4\n")
+        import_skill_levels_csv(self.conn, path)
+        self.assertEqual(self.conn.execute("SELECT level, updated_at FROM evaluations").fetchall(),
+                         [(4, "old")])
+        path = self.write_csv("グループ,ユーザー,カテゴリー,スキル,レベル\n開発部,山田,プログラミング,Python,5\n")
+        import_skill_levels_csv(self.conn, path)
+        level, updated_at = self.conn.execute("SELECT level, updated_at FROM evaluations").fetchone()
+        self.assertEqual(level, 5)
+        self.assertNotEqual(updated_at, "old")
+
+    def test_invalid_rows_skipped(self):
+        """名前なし・範囲外レベル・列不足の行をスキップすることのテスト"""
+        path = self.write_csv(
+            "group,user,category,skill,level\n"
+            "開発部,,プログラミング,Python,3\n"
+            "開発部,山田,プログラミング,Python,9\n"
+            "開発部,山田,プログラミング,Python,x\n"
+            "開発部,山田\n"
+            "開発部,山田,プログラミング,Python,1\n"
+        )
+        result = import_skill_levels_csv(self.conn, path)
+        self.assertEqual((result.rows, result.imported, result.skipped), (5, 1, 4))
+
+    def test_progress_per_chunk(self):
+        """チャンクごとのコミットと進捗通知のテスト"""
+        rows = "".join(f"開発部,user{i},プログラミング,Python,{i % 5 + 1}\n" for i in range(25))
+        path = self.write_csv("group,user,category,skill,level\n" + rows)
+        progress = []
+        result = import_skill_levels_csv(self.conn, path, chunk_size=10, progress=progress.append)
+        self.assertEqual([p.rows for p in progress], [10, 20, 25])
+        self.assertEqual(progress[-1].percent, 100)
+        self.assertEqual(result.created["users"], 25)
+        self.assertFalse(self.conn.in_transaction)
+
+    def test_roster_without_level_column(self):
+        """level 列がない場合にグループとユーザーのみ登録することのテスト"""
+        path = self.write_csv("group,user\n営業部,鈴木\n営業部,佐藤\n")
+        result = import_skill_levels_csv(self.conn, path)
+        self.assertEqual(result.created["users"], 2)
+        self.assertEqual(result.imported, 0)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0], 0)
+
+    def test_levels_option(self):
+        """level 列の取り込みを指定した場合のテスト"""
+        path = self.write_csv("group,user,category,skill,level\n開発部,佐藤,技術,Go,3\n")
+        result = import_skill_levels_csv(self.conn, path, levels=False)
+        self.assertEqual(result.created["users"], 1)
+        self.assertEqual(result.created["skills"], 0)
+        self.assertEqual(result.imported, 0)
+        roster = self.write_csv("group,user\n営業部,鈴木\n")
+        with self.assertRaises(ValueError):
+            import_skill_levels_csv(self.conn, roster, levels=True)
+
+    def test_missing_columns(self):
+        """必須の列がない場合のテスト"""
+        path = self.write_csv("group,user,level\n開発部,山田,3\n")
+        with self.assertRaises(ValueError):
+            import_skill_levels_csv(self.conn, path)
+
+    def test_user_skills_schema(self):
+        """カテゴリーを名称で保持するスキーマへの取り込みのテスト"""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, name TEXT, category TEXT);
+            CREATE TABLE user_skills (
+                user_id INTEGER, skill_id INTEGER, level INTEGER, updated_at DATETIME,
+                PRIMARY KEY (user_id, skill_id)
+            );
+        """)
+        path = self.write_csv("group,user,category,skill,level\n開発部,山田,デザイン,UI設計,3\n")
+        result = import_skill_levels_csv(conn, path, USER_SKILLS_SCHEMA)
+        self.assertEqual(result.created["categories"], 0)
+        self.assertEqual(conn.execute("SELECT name, category FROM skills").fetchall(),
+                         [("UI設計", "デザイン")])
+        self.assertEqual(conn.execute("SELECT level FROM user_skills").fetchall(), [(3,)])
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
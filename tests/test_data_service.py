@@ -0,0 +1,87 @@
+"""バックグラウンドデータサービスのテスト
+Created: 2026-10-17 16:40:12
+Author: GingaDza
+"""
+import threading
+import time
+import unittest
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtWidgets import QApplication
+from src.views.data_service import DataService
+
+class TestDataService(unittest.TestCase):
+    """バックグラウンドデータサービスのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.service = DataService()
+
+    def _wait_idle(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.service.get_metrics()['queue_depth'] and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        QCoreApplication.processEvents()
+
+    def test_result_delivered_on_gui_thread(self):
+        """結果がGUIスレッドに返ることのテスト"""
+        results = []
+        worker_threads = []
+
+        def work(x):
+            worker_threads.append(threading.current_thread())
+            return x * 2
+
+        self.service.submit("k", work, 21,
+                            on_result=lambda r: results.append((r, threading.current_thread())))
+        self._wait_idle()
+        self.assertEqual(results, [(42, threading.main_thread())])
+        self.assertIsNot(worker_threads[0], threading.main_thread())
+        metrics = self.service.get_metrics()
+        self.assertEqual(metrics['completed'], 1)
+        self.assertGreater(metrics['avg_latency'], 0)
+
+    def test_stale_requests_cancelled(self):
+        """同じキーの古い要求が破棄されることのテスト"""
+        release = threading.Event()
+        results = []
+        self.service.submit("block", release.wait, 2)
+        for value in range(5):
+            self.service.submit("users", lambda v=value: v, on_result=results.append)
+        self.assertEqual(self.service.get_metrics()['queue_depth'], 6)
+        release.set()
+        self._wait_idle()
+        self.assertEqual(results, [4])
+        self.assertEqual(self.service.get_metrics()['cancelled'], 4)
+
+    def test_error_reported(self):
+        """例外の通知のテスト"""
+        errors = []
+        signals = []
+        self.service.failed.connect(lambda key, error: signals.append(key))
+        self.service.submit("k", lambda: 1 / 0, on_error=errors.append)
+        self._wait_idle()
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+        self.assertEqual(signals, ["k"])
+        self.assertEqual(self.service.get_metrics()['failed'], 1)
+
+    def test_cancel(self):
+        """要求の取り消しのテスト"""
+        release = threading.Event()
+        results = []
+        self.service.submit("k", release.wait, 2, on_result=results.append)
+        self.service.cancel("k")
+        release.set()
+        self._wait_idle()
+        self.assertEqual(results, [])
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.service.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
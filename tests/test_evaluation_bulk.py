@@ -0,0 +1,117 @@
+"""評価一括保存のテスト
+Created: 2026-10-17 11:48:20
+Author: GingaDza
+"""
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.database import close_all_pools, clear_reference_cache
+from src.database.evaluation_manager import EvaluationManager
+
+TEST_DB = "test_evaluation_bulk.db"
+
+class TestEvaluationBulk(unittest.TestCase):
+    """評価一括保存のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.manager = EvaluationManager(TEST_DB)
+        with self.manager.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO skills (id, category_id, name) VALUES (?, ?, ?)",
+                [(1, 1, "Python"), (2, 1, "SQL"), (3, 2, "Python"), (4, 2, "設計")]
+            )
+
+    def _levels(self, user_id):
+        with self.manager.get_connection() as conn:
+            return dict(conn.execute(
+                "SELECT skill_id, level FROM evaluations WHERE user_id = ?", (user_id,)
+            ).fetchall())
+
+    def test_set_evaluations_bulk_by_id(self):
+        """スキルIDによる一括保存のテスト"""
+        self.assertTrue(self.manager.set_evaluations_bulk(1, {1: 3, 2: 4}))
+        self.assertTrue(self.manager.set_evaluations_bulk(1, {2: 5}))
+        self.assertEqual(self._levels(1), {1: 3, 2: 5})
+
+    def test_set_evaluations_bulk_by_name(self):
+        """カテゴリー内のスキル名による一括保存のテスト"""
+        saved = self.manager.set_evaluations_bulk(
+            1, {"Python": 2, "設計": 4, "存在しない": 1}, category_id=2
+        )
+        self.assertTrue(saved)
+        self.assertEqual(self._levels(1), {3: 2, 4: 4})
+
+    def test_invalid_levels_are_skipped(self):
+        """無効なレベルのスキルのみ読み飛ばして残りを保存するテスト"""
+        self.assertTrue(self.manager.set_evaluations_bulk(1, {1: 3, 2: 6, 3: True, 4: "2"}))
+        self.assertEqual(self._levels(1), {1: 3})
+
+    def test_numpy_levels(self):
+        """numpy の整数型のレベルのテスト"""
+        self.assertTrue(self.manager.set_evaluations_bulk(1, {1: np.int64(4), 2: np.uint8(2)}))
+        self.assertEqual(self._levels(1), {1: 4, 2: 2})
+
+    def test_clear_levels(self):
+        """レベル 0 または None による評価の削除のテスト"""
+        self.manager.set_evaluations_bulk(1, {1: 3, 2: 4, 4: 5})
+        self.assertTrue(self.manager.set_evaluations_bulk(1, {1: 0, 2: None, 3: 0}))
+        self.assertEqual(self._levels(1), {4: 5})
+
+    def test_set_evaluations_for_users(self):
+        """複数ユーザーの一括保存のテスト"""
+        saved = self.manager.set_evaluations_for_users({
+            1: {"SQL": 3},
+            2: {"SQL": 4, 1: 5},
+        }, category_id=1)
+        self.assertTrue(saved)
+        self.assertEqual(self._levels(1), {2: 3})
+        self.assertEqual(self._levels(2), {1: 5, 2: 4})
+
+    def test_set_evaluations_by_category(self):
+        """カテゴリーごとにスキル名を解決した一括保存のテスト"""
+        saved = self.manager.set_evaluations_by_category({
+            (1, 1): {"Python": 2},
+            (1, 2): {"Python": 4, "設計": 3},
+            (2, 1): {"SQL": 5},
+        })
+        self.assertTrue(saved)
+        self.assertEqual(self._levels(1), {1: 2, 3: 4, 4: 3})
+        self.assertEqual(self._levels(2), {2: 5})
+
+    def test_category_averages(self):
+        """カテゴリー別平均の集計のテスト"""
+        self.manager.set_evaluations_bulk(1, {1: 3, 2: 4, 4: 5})
+        self.manager.set_evaluations_bulk(2, {1: 1})
+        self.assertEqual(self.manager.get_category_averages(1), {1: 3.5, 2: 5.0})
+        self.assertEqual(self.manager.get_category_averages(3), {})
+
+    def test_user_skill_summary(self):
+        """グリッドとチャートで共有する要約のテスト"""
+        self.manager.set_evaluations_bulk(1, {1: 3, 2: 4, 4: 5})
+        summary = self.manager.get_user_skill_summary(1)
+        self.assertEqual(summary.levels, {1: {"Python": 3, "SQL": 4}, 2: {"設計": 5}})
+        self.assertEqual(summary.averages, {1: 3.5, 2: 5.0})
+
+    def test_import_csv_levels_option(self):
+        """CSV取り込みで levels=False の場合はグループとユーザーのみ登録することのテスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "roster.csv")
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write("group,user,category,skill,level\n開発部,山田,1,Python,4\n")
+            result = self.manager.import_csv(path, levels=False)
+        self.assertEqual((result.rows, result.imported), (1, 0))
+        with self.manager.get_connection() as conn:
+            self.assertEqual(conn.execute("SELECT name FROM users").fetchall()[0][0], "山田")
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0], 0)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        clear_reference_cache()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""グループ統計のテスト
+Created: 2026-10-17 15:32:50
+Author: GingaDza
+"""
+import os
+import sys
+import unittest
+from src.models.statistics import GroupStatistics
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.database.manager import DatabaseManager
+
+TEST_DB = "test_group_statistics.db"
+
+class TestGroupStatistics(unittest.TestCase):
+    """グループ統計のテスト"""
+
+    def test_from_histogram(self):
+        """レベル別人数からの統計計算のテスト"""
+        stats = GroupStatistics.from_histogram(1, 4, [
+            (10, "Python", 2, 1), (10, "Python", 4, 2), (11, "SQL", 5, 1)
+        ])
+        self.assertEqual(stats.rated_count, 4)
+        self.assertEqual(stats.mean, 3.75)
+        self.assertEqual(stats.median, 4.0)
+        self.assertEqual((stats.minimum, stats.maximum), (2, 5))
+        self.assertEqual(stats.skills[0].counts, {2: 1, 4: 2})
+        self.assertAlmostEqual(stats.skill_means()["Python"], 10 / 3)
+
+    def test_even_count_median(self):
+        """評価件数が偶数の場合の中央値のテスト"""
+        stats = GroupStatistics.from_histogram(1, 2, [(10, "Python", 1, 1), (10, "Python", 4, 1)])
+        self.assertEqual(stats.median, 2.5)
+
+    def test_empty_group(self):
+        """評価のないグループのテスト"""
+        stats = GroupStatistics.from_histogram(1, 3, [])
+        self.assertEqual(stats.member_count, 3)
+        self.assertIsNone(stats.mean)
+        self.assertIsNone(stats.median)
+        self.assertEqual(stats.skill_means(), {})
+
+    def test_database_aggregation(self):
+        """データベースでの集計のテスト"""
+        db = DatabaseManager(TEST_DB)
+        with db._connect() as conn:
+            conn.executemany(
+                "INSERT INTO user_skills (user_id, skill_id, level) VALUES (?, ?, ?)",
+                [(1, 1, 3), (2, 1, 5), (2, 2, 0), (3, 3, 4)]
+            )
+        stats = db.get_group_statistics(1)
+        self.assertEqual(stats.member_count, 2)
+        self.assertEqual(stats.rated_count, 2)
+        self.assertEqual(stats.mean, 4.0)
+        self.assertEqual(stats.skill_means(), {"Python": 4.0})
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB + suffix):
+                os.remove(TEST_DB + suffix)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""インデックス監査のテスト
+Created: 2026-10-17 12:35:10
+Author: GingaDza
+"""
+import os
+import sqlite3
+import unittest
+from src.config.schema import EVALUATIONS, USER_SKILLS, ensure_schema
+from src.database import close_all_pools
+from src.database.category_manager import CategoryManager
+from src.database.evaluation_manager import EvaluationManager
+from src.database.group_manager import GroupManager
+from src.database.user_manager import UserManager
+from src.database.index_audit import AUDITED_QUERIES, AuditQuery, audit, format_report, main
+from src.database.migrations import V20261017120000__add_lookup_indexes as lookup_indexes
+from src.migrate import run_migrations
+
+TEST_DB = "test_index_audit.db"
+USER_SKILLS_DB = "test_index_audit_user_skills.db"
+
+class TestIndexAudit(unittest.TestCase):
+    """インデックス監査のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        for manager in (GroupManager, CategoryManager, UserManager, EvaluationManager):
+            manager(TEST_DB)
+        close_all_pools()
+        self.conn = sqlite3.connect(TEST_DB)
+
+    def _assert_no_failures(self, results, schema):
+        self.assertEqual(len(results),
+                         sum(1 for query in AUDITED_QUERIES if query.schema == schema))
+        failures = [result for result in results if not result.ok]
+        self.assertEqual(failures, [], format_report(results))
+
+    def test_no_scans_on_new_database(self):
+        """マネージャーが作成したデータベースにテーブルスキャンが残らないことのテスト"""
+        self._assert_no_failures(audit(self.conn), EVALUATIONS.name)
+
+    def test_no_scans_on_user_skills_database(self):
+        """skill_matrix_manager のスキーマのテスト"""
+        conn = sqlite3.connect(USER_SKILLS_DB)
+        try:
+            ensure_schema(conn, USER_SKILLS.name)
+            self._assert_no_failures(audit(conn), USER_SKILLS.name)
+        finally:
+            conn.close()
+
+    def test_startup_database(self):
+        """起動時の順序で作成したデータベースの監査コマンドのテスト"""
+        self.conn.close()
+        close_all_pools()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(TEST_DB + suffix):
+                os.remove(TEST_DB + suffix)
+        run_migrations(TEST_DB)
+        self.assertEqual(main([TEST_DB]), 0)
+        self.conn = sqlite3.connect(TEST_DB)
+
+    def test_detects_scan_without_index(self):
+        """インデックスがない場合のスキャン検出のテスト"""
+        self.conn.execute("DROP INDEX idx_users_group_id")
+        query = AuditQuery("users by group", "SELECT * FROM users WHERE group_id = ?")
+        result = audit(self.conn, [query])[0]
+        self.assertFalse(result.ok)
+        lookup_indexes.upgrade(self.conn.cursor())
+        self.assertTrue(audit(self.conn, [query])[0].ok)
+
+    def test_missing_table_fails(self):
+        """存在しないテーブルのクエリは監査できず失敗とするテスト"""
+        query = AuditQuery("missing", "SELECT * FROM no_such_table WHERE id = ?")
+        result = audit(self.conn, [query])[0]
+        self.assertIsNotNone(result.skipped)
+        self.assertFalse(result.ok)
+
+    def test_unknown_schema_fails(self):
+        """スキーマのバージョンが不明なデータベースの監査コマンドのテスト"""
+        self.conn.execute("PRAGMA user_version = 0")
+        self.conn.commit()
+        self.assertEqual(main([TEST_DB]), 1)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+        close_all_pools()
+        for path in (TEST_DB, USER_SKILLS_DB):
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+if __name__ == '__main__':
+    unittest.main()
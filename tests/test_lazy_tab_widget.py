@@ -0,0 +1,72 @@
+"""遅延生成タブウィジェットのテスト
+Created: 2026-10-17 17:30:05
+Author: GingaDza
+"""
+import time
+import unittest
+from PyQt5.QtWidgets import QApplication, QLabel
+from src.views.components.lazy_tab_widget import LazyTabWidget
+
+class TestLazyTabWidget(unittest.TestCase):
+    """遅延生成タブウィジェットのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.built = []
+        self.tabs = LazyTabWidget(evict_after_ms=50)
+
+    def _factory(self, name):
+        def build():
+            self.built.append(name)
+            return QLabel(name)
+        return build
+
+    def test_only_current_tab_is_built(self):
+        """表示中のタブのみ生成されることのテスト"""
+        pages = [self.tabs.addLazyTab(self._factory(n), n) for n in ("a", "b", "c")]
+        self.assertEqual(self.built, ["a"])
+        self.assertEqual(self.tabs.materialized_count(), 1)
+
+        self.tabs.setCurrentIndex(2)
+        self.assertEqual(self.built, ["a", "c"])
+        self.assertEqual(pages[2].content.text(), "c")
+        self.tabs.setCurrentIndex(0)
+        self.assertEqual(self.built, ["a", "c"])
+
+    def test_insert_keeps_pages_lazy(self):
+        """挿入したタブが生成されないことのテスト"""
+        self.tabs.addLazyTab(self._factory("a"), "a")
+        self.tabs.insertLazyTab(0, self._factory("b"), "b")
+        self.assertEqual(self.built, ["a"])
+        self.assertEqual(self.tabs.tabText(0), "b")
+
+    def test_eviction(self):
+        """非表示のタブの破棄と再生成のテスト"""
+        evicted = []
+        self.tabs.evicted.connect(evicted.append)
+        first = self.tabs.addLazyTab(self._factory("a"), "a")
+        pinned = self.tabs.addLazyTab(self._factory("b"), "b", evictable=False)
+        self.tabs.setCurrentIndex(1)
+        third = self.tabs.addLazyTab(self._factory("c"), "c")
+        self.tabs.setCurrentIndex(2)
+        time.sleep(0.06)
+
+        self.assertEqual(self.tabs.evict_hidden(), [first])
+        self.assertEqual(evicted, [first])
+        self.assertFalse(first.is_materialized)
+        self.assertTrue(pinned.is_materialized)
+        self.assertTrue(third.is_materialized)
+
+        self.tabs.setCurrentIndex(0)
+        self.assertEqual(self.built, ["a", "b", "c", "a"])
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.tabs.deleteLater()
+
+if __name__ == '__main__':
+    unittest.main()
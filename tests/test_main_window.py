@@ -0,0 +1,125 @@
+"""メインウィンドウのテスト
+Created: 2026-10-18 10:20:17
+Author: GingaDza
+"""
+import os
+import unittest
+from unittest.mock import patch
+from PyQt5.QtGui import QCloseEvent
+from PyQt5.QtWidgets import QApplication, QMessageBox, QWidget
+from src.database import clear_reference_cache, close_all_pools
+from src.database.evaluation_manager import EvaluationManager
+from src.views.main_window import MainWindow
+
+TEST_DB = "test_main_window.db"
+
+class FailingDatabase:
+    """スキルレベルの書き込みが常に失敗するデータベース"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def set_evaluations_by_category(self, evaluations):
+        self.writes += 1
+        return False
+
+class TestMainWindow(unittest.TestCase):
+    """メインウィンドウのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.window = MainWindow()
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.window.skill_edits.discard()
+        self.window.close()
+        self.window.deleteLater()
+
+    def test_radar_chart(self):
+        """設定のバックエンドで作成したレーダーチャートへのカテゴリー平均の反映のテスト"""
+        self.window.categories = ['プログラミング', 'デザイン']
+        self.window.category_ids = [1, 2]
+        self.window.current_user_id = 1
+        self.window.update_radar_chart({1: 3.5})
+        self.assertEqual(self.window.radar_chart.data, {'プログラミング': 3.5, 'デザイン': 0})
+
+    def _fail_pending_edit(self):
+        """書き込みに失敗する未書き込みの編集と、スキルタブ内のウィジェットを用意する"""
+        self.window.db = FailingDatabase()
+        self.window.current_user_id = 1
+        self.window._update_skill_levels(1, {'Python': 3})
+        editor = QWidget()
+        self.window.skill_tabs.addTab(editor, 'プログラミング')
+        return editor
+
+    def test_failure_dialog_does_not_flush_again(self):
+        """失敗通知のダイアログがフォーカスを奪っても再書き込み・再通知しないことのテスト"""
+        editor = self._fail_pending_edit()
+        warnings = []
+
+        def warning(*args):
+            warnings.append(args)
+            # ダイアログの表示でスキルタブからフォーカスが外れる
+            self.window._on_focus_changed(editor, None)
+
+        with patch.object(QMessageBox, 'warning', side_effect=warning):
+            self.window._on_focus_changed(editor, None)
+        self.assertEqual(len(warnings), 1)
+        self.assertEqual(self.window.db.writes, 1)
+        self.assertEqual(self.window.skill_edits.pending(), {(1, 1, 'Python'): 3})
+
+        # ダイアログを閉じた後はフォーカス移動で再試行する
+        with patch.object(QMessageBox, 'warning') as warning:
+            self.window._on_focus_changed(editor, None)
+        self.assertEqual(warning.call_count, 1)
+        self.assertEqual(self.window.db.writes, 2)
+
+    def test_close_shows_each_dialog_once(self):
+        """終了時の書き込み失敗で通知と確認のダイアログが1回ずつ表示されることのテスト"""
+        editor = self._fail_pending_edit()
+
+        def leave_tabs(*args):
+            self.window._on_focus_changed(editor, None)
+            return QMessageBox.No
+
+        event = QCloseEvent()
+        with patch.object(QMessageBox, 'warning', side_effect=leave_tabs) as warning, \
+                patch.object(QMessageBox, 'question', side_effect=leave_tabs) as question:
+            self.window.closeEvent(event)
+        self.assertEqual(warning.call_count, 1)
+        self.assertEqual(question.call_count, 1)
+        self.assertEqual(self.window.db.writes, 1)
+        self.assertFalse(event.isAccepted())
+        self.assertEqual(len(self.window.skill_edits), 1)
+
+    def test_unrated_level_deletes_evaluation(self):
+        """レベル 0 の編集が評価を削除し、同じバッチの他の編集も保存されることのテスト"""
+        manager = EvaluationManager(TEST_DB)
+        self.addCleanup(self._remove_test_db)
+        with manager.get_connection() as conn:
+            conn.executemany("INSERT INTO skills (id, category_id, name) VALUES (?, ?, ?)",
+                             [(1, 1, 'Py'), (2, 1, 'JS')])
+        manager.set_evaluations_bulk(1, {1: 3})
+        self.window.db = manager
+        self.window.current_user_id = 1
+        self.window._update_skill_levels(1, {'Py': 0, 'JS': 4})
+        self.assertTrue(self.window.skill_edits.flush())
+        self.assertEqual(self.window._user_levels, {1: {'JS': 4}})
+        self.window._update_skill_levels(1, {'Py': 2})
+        self.assertTrue(self.window.skill_edits.flush())
+        self.assertEqual(len(self.window.skill_edits), 0)
+        self.assertEqual(manager.get_user_skill_summary(1).levels, {1: {'Py': 2, 'JS': 4}})
+
+    def _remove_test_db(self):
+        close_all_pools()
+        clear_reference_cache()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""マイグレーション実行のテスト
+Created: 2026-10-17 22:58:04
+Author: GingaDza
+"""
+import importlib.util
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from src.database.migrations import MigrationManager, discover_migrations
+
+MIGRATIONS = {
+    "V2__add_level.py": "def upgrade(cursor):\n"
+                        "    cursor.execute('ALTER TABLE items ADD COLUMN level INTEGER')\n",
+    "V1__create_items.py": "def upgrade(cursor):\n"
+                           "    cursor.execute('CREATE TABLE items (id INTEGER PRIMARY KEY)')\n",
+    "V10__broken.py": "def upgrade(cursor):\n"
+                      "    cursor.execute('CREATE TABLE extra (id INTEGER)')\n"
+                      "    cursor.execute('INVALID SQL')\n",
+    "helpers.py": "",
+}
+
+class TestMigrationManager(unittest.TestCase):
+    """マイグレーション実行のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.temp_dir.cleanup()
+
+    def _write(self, *names):
+        """マイグレーションファイルを書き出し、検出結果を返す
+
+        一時ディレクトリはパッケージではないため、モジュールは事前に読み込んでおく。
+        """
+        for name in names:
+            (self.directory / name).write_text(MIGRATIONS[name])
+        package = f"test_migrations_{id(self)}"
+        migrations = discover_migrations(self.directory, package=package)
+        for migration in migrations:
+            spec = importlib.util.spec_from_file_location(
+                migration.module, self.directory / f"{migration.version}__{migration.name}.py"
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            sys.modules[migration.module] = module
+        return migrations
+
+    def _manager(self, *names):
+        return MigrationManager(self.db_path, self._write(*names))
+
+    def _tables(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )}
+
+    def test_discover_orders_by_version(self):
+        """バージョン番号の数値順で検出されることのテスト"""
+        migrations = self._write("V2__add_level.py", "V1__create_items.py",
+                                 "V10__broken.py", "helpers.py")
+        self.assertEqual([m.version for m in migrations], ["V1", "V2", "V10"])
+        self.assertEqual(migrations[0].name, "create_items")
+
+    def test_discover_package_migrations(self):
+        """同梱のマイグレーションが検出されることのテスト"""
+        versions = [m.version for m in discover_migrations()]
+        self.assertIn("V20250208140405", versions)
+        self.assertEqual(versions, sorted(versions))
+
+    def test_migrate_applies_pending_once(self):
+        """未適用分のみ適用し、最新なら何もしないことのテスト"""
+        manager = self._manager("V1__create_items.py", "V2__add_level.py")
+        result = manager.migrate()
+        self.assertEqual([version for version, _ in result.applied], ["V1", "V2"])
+        self.assertTrue(all(seconds >= 0 for _, seconds in result.applied))
+        self.assertEqual(manager.get_applied_migrations(), ["V1", "V2"])
+
+        result = manager.migrate()
+        self.assertTrue(result.up_to_date)
+        self.assertEqual(manager.get_pending_migrations(), [])
+
+    def test_failed_migration_rolls_back_all(self):
+        """失敗した場合は同じ実行の全マイグレーションが取り消されることのテスト"""
+        manager = self._manager("V1__create_items.py", "V10__broken.py")
+        with self.assertRaises(sqlite3.Error):
+            manager.migrate()
+        self.assertEqual(self._tables(), set())
+        self.assertEqual(manager.get_applied_migrations(), [])
+
+    def test_up_to_date_check_is_read_only(self):
+        """最新のスキーマではDDLを実行しないことのテスト"""
+        manager = self._manager("V1__create_items.py")
+        manager.migrate()
+        statements = []
+        original = manager._connect
+
+        def traced():
+            conn = original()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        manager._connect = traced
+        self.assertTrue(manager.migrate().up_to_date)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith("SELECT"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""QPainter版レーダーチャートのテスト
+Created: 2026-10-17 18:52:03
+Author: GingaDza
+"""
+import os
+import sys
+import unittest
+from PyQt5.QtWidgets import QApplication
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.views.custom_widgets import NativeRadarChart, create_radar_chart
+
+
+class TestNativeRadarChart(unittest.TestCase):
+    """QPainter版レーダーチャートのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.chart = NativeRadarChart()
+        self.chart.resize(400, 400)
+
+    def test_geometry_reused_between_updates(self):
+        """同じカテゴリー構成とサイズでは背景を再利用することのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3}, {"A": 3, "B": 3, "C": 3})
+        self.chart.grab()
+        background = self.chart._background
+        self.chart.update_data({"A": 4, "B": 5, "C": 1})
+        self.chart.grab()
+        self.assertIs(self.chart._background, background)
+
+        self.chart.update_data({"A": 1, "B": 2})
+        self.chart.grab()
+        self.assertIsNot(self.chart._background, background)
+
+    def test_polygon_scaled_to_radius(self):
+        """レベルが半径に比例して配置されることのテスト"""
+        self.chart.update_data({"A": 5, "B": 0, "C": 0, "D": 0})
+        self.chart.grab()
+        center, radius = self.chart._center, self.chart._radius
+        points = self.chart.polygon([5, 0, 0, 0])
+        self.assertAlmostEqual(points[0].x() - center.x(), radius)
+        self.assertAlmostEqual(points[0].y(), center.y())
+        self.assertEqual(points[1], center)
+
+    def test_list_data_uses_categories(self):
+        """リストで渡したデータがカテゴリー順に対応付けられることのテスト"""
+        self.chart.set_categories(["技術", "管理"])
+        self.chart.update_data([2, 4])
+        self.assertEqual(self.chart.data, {"技術": 2, "管理": 4})
+
+    def test_factory_selects_backend(self):
+        """バックエンド指定でウィジェットを切り替えることのテスト"""
+        self.assertIsInstance(create_radar_chart(backend="native"), NativeRadarChart)
+        from skill_matrix_manager.views.custom_widgets.radar_chart import RadarChart
+        self.assertIsInstance(create_radar_chart(backend="matplotlib"), RadarChart)
+        with self.assertRaises(ValueError):
+            create_radar_chart(backend="svg")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""レーダーチャートのテスト
+Created: 2026-10-17 18:05:40
+Author: GingaDza
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.views.custom_widgets import radar_chart
+from skill_matrix_manager.views.custom_widgets.radar_chart import RadarChart
+
+class TestRadarChart(unittest.TestCase):
+    """レーダーチャートのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.chart = RadarChart()
+
+    def test_artists_reused_for_same_categories(self):
+        """同じカテゴリー構成ではアーティストを再利用することのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3})
+        line = self.chart._current_line
+        fill = self.chart._current_fill
+        self.chart.update_data({"A": 4, "B": 5, "C": 1})
+        self.assertIs(self.chart._current_line, line)
+        self.assertIs(self.chart._current_fill, fill)
+        np.testing.assert_array_equal(line.get_ydata(), [4, 5, 1, 4])
+        np.testing.assert_array_equal(fill.get_xy()[:, 1][:4], [4, 5, 1, 4])
+
+    def test_layout_rebuilt_when_categories_change(self):
+        """カテゴリー構成が変わったときのみ作り直すことのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3})
+        line = self.chart._current_line
+        self.chart.update_data({"A": 1, "B": 2, "C": 3, "D": 4})
+        self.assertIsNot(self.chart._current_line, line)
+        self.assertEqual([t.get_text() for t in self.chart.ax.get_xticklabels()],
+                         ["A", "B", "C", "D"])
+
+    def test_target_and_gap(self):
+        """目標レベルとギャップ表示のテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3}, {"A": 3, "B": 2, "C": 3})
+        target = self.chart._target_line
+        self.assertIsNotNone(self.chart._legend)
+        self.assertIsNotNone(self.chart._gap_fill)
+        self.chart.update_data({"A": 2, "B": 2, "C": 3}, {"A": 4, "B": 2, "C": 3})
+        self.assertIs(self.chart._target_line, target)
+        self.assertEqual(len(self.chart.ax.collections), 1)
+        self.chart.update_data({"A": 2, "B": 2, "C": 3})
+        self.assertIsNone(self.chart._target_line)
+        self.assertEqual(len(self.chart.ax.collections), 0)
+
+    def test_empty_data(self):
+        """空データのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3})
+        self.chart.update_data({})
+        self.assertEqual(len(self.chart.ax.lines), 0)
+
+    def test_resize_is_coalesced(self):
+        """リサイズ中はスナップショットを表示し、完了後に1回だけ描画することのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3})
+        self.chart.resize(300, 300)
+        self.chart.show()
+        self.app.processEvents()
+        self.chart._finish_resize()
+        self.app.processEvents()
+        # 遅い環境でもリサイズの途中でタイマーが満了しないようにする
+        self.chart._resize_timer.setInterval(60000)
+        with patch.object(self.chart.canvas, "draw") as draw:
+            for size in range(310, 400, 10):
+                self.chart.resize(size, size)
+                self.app.processEvents()
+            self.assertTrue(self.chart.canvas.deferred)
+            draw.assert_not_called()
+        self.chart._finish_resize()
+        self.assertFalse(self.chart.canvas.deferred)
+        width, height = self.chart.figure.get_size_inches() * self.chart.figure.dpi
+        self.assertEqual((round(width), round(height)),
+                         (self.chart.canvas.width(), self.chart.canvas.height()))
+
+    def test_layout_cached_per_size_bucket(self):
+        """サイズバケットごとのレイアウトキャッシュのテスト"""
+        self.chart.update_data({"A": 1, "B": 2, "C": 3})
+        with patch.object(self.chart.figure, "tight_layout") as tight_layout:
+            self.chart._apply_layout()
+            self.chart._apply_layout()
+        self.assertEqual(tight_layout.call_count, 0)
+
+        self.chart._layout_cache.clear()
+        with patch.object(self.chart.figure, "tight_layout") as tight_layout:
+            self.chart._apply_layout()
+            self.chart._apply_layout()
+        self.assertEqual(tight_layout.call_count, 1)
+
+    def test_layout_cache_is_bounded(self):
+        """カテゴリー構成が変わり続けてもレイアウトキャッシュが上限を超えないことのテスト"""
+        with patch.object(radar_chart, "LAYOUT_CACHE_SIZE", 3):
+            for i in range(5):
+                self.chart.update_data({f"A{i}": 1, "B": 2, "C": 3})
+        self.assertEqual(len(self.chart._layout_cache), 3)
+        self.assertIn(self.chart._layout_key, [key[0] for key in self.chart._layout_cache])
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.chart.deleteLater()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""レーダーチャート一覧の出力画面のテスト
+Created: 2026-10-18 11:02:36
+Author: GingaDza
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from PyQt5.QtWidgets import (
+    QApplication, QFileDialog, QMessageBox, QProgressBar, QPushButton, QWidget
+)
+from src.database import EvaluationManager, close_all_pools
+from src.views.radar_export import RadarExportController, export_user_radar_pdf
+from src.views.system_management.widget import SystemManagementWidget
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.database.manager import DatabaseManager
+from skill_matrix_manager.views.system_tab.system_tab import SystemTab
+
+class TestRadarExport(unittest.TestCase):
+    """レーダーチャート一覧の出力画面のテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "charts.pdf")
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        self.temp_dir.cleanup()
+
+    def test_system_management_button(self):
+        """システム管理タブのPDF出力ボタンが batch チャネルで出力を開始することのテスト"""
+        widget = SystemManagementWidget()
+        self.assertEqual(widget.db_path, os.path.join("data", "skill_matrix.db"))
+        widget.radar_export.service = MagicMock()
+        with patch.object(QFileDialog, 'getSaveFileName', return_value=(self.path, "")):
+            widget.export_radar_btn.click()
+        args = widget.radar_export.service.submit.call_args[0]
+        self.assertEqual(args[1:5], (export_user_radar_pdf, widget.db_path, self.path, None))
+        self.assertFalse(widget.export_radar_btn.isEnabled())
+
+    def test_controller_progress_and_result(self):
+        """出力の進捗と完了でボタン・進捗バーが更新されることのテスト"""
+        widget = QWidget()
+        button, progress_bar = QPushButton(widget), QProgressBar(widget)
+        controller = RadarExportController(widget, button, progress_bar)
+        controller.service = MagicMock()
+        controller.start("skills.db", self.path, 3)
+        self.assertEqual(controller.service.submit.call_args[0][1:5],
+                         (export_user_radar_pdf, "skills.db", self.path, 3))
+        self.assertFalse(button.isEnabled())
+        controller.report_progress(2, 4)
+        self.assertEqual((progress_bar.value(), progress_bar.maximum()), (2, 4))
+        on_result = controller.service.submit.call_args[1]["on_result"]
+        with patch.object(QMessageBox, 'information') as information:
+            on_result(4)
+        information.assert_called_once()
+        self.assertTrue(button.isEnabled())
+        self.assertFalse(progress_bar.isVisible())
+
+    def test_system_tab_export_type(self):
+        """skill_matrix_manager のシステム管理タブで「レーダーチャート一覧」がPDFを出力することのテスト"""
+        db = MagicMock()
+        tab = SystemTab(db)
+        io_tab = tab.create_io_tab()  # 参照を保持しないとコンボボックスごと破棄される
+        tab.export_type.setCurrentText("レーダーチャート一覧")
+        service = MagicMock()
+        with patch.object(QFileDialog, 'getSaveFileName', return_value=(self.path, "")), \
+                patch("skill_matrix_manager.views.system_tab.system_tab.get_data_service",
+                      return_value=service):
+            tab.export_data()
+        self.assertEqual(service.submit.call_args[0][1:], (db.export_radar_pdf, self.path))
+
+    def test_system_tab_export_types(self):
+        """skill_matrix_manager のシステム管理タブの出力が export_type ごとに異なることのテスト"""
+        db = MagicMock()
+        tab = SystemTab(db)
+        io_tab = tab.create_io_tab()  # 参照を保持しないとコンボボックスごと破棄される
+        service = MagicMock()
+        for export_type, file_path, export in (
+                ("スキルレベルデータ", "levels.csv", db.export_levels_csv),
+                ("全データ", "all.csv", db.export_csv),
+                ("全データ", "all.xlsx", db.export_xlsx)):
+            tab.export_type.setCurrentText(export_type)
+            with patch.object(QFileDialog, 'getSaveFileName', return_value=(file_path, "")), \
+                    patch("skill_matrix_manager.views.system_tab.system_tab.get_data_service",
+                          return_value=service):
+                tab.export_data()
+            self.assertEqual(service.submit.call_args[0][1:], (export, file_path))
+
+    def test_system_tab_import_type(self):
+        """skill_matrix_manager のシステム管理タブの取り込みが import_type に従うことのテスト"""
+        db = MagicMock()
+        tab = SystemTab(db)
+        io_tab = tab.create_io_tab()  # 参照を保持しないとコンボボックスごと破棄される
+        service = MagicMock()
+        for import_type, levels in (("グループリスト", False), ("スキルレベルデータ", True)):
+            tab.import_type.setCurrentText(import_type)
+            with patch.object(QFileDialog, 'getOpenFileName', return_value=("a.csv", "")), \
+                    patch("skill_matrix_manager.views.system_tab.system_tab.get_data_service",
+                          return_value=service):
+                tab.import_data()
+            self.assertEqual(service.submit.call_args[0][1:], (db.import_csv, "a.csv", None, levels))
+
+    def test_database_manager_export(self):
+        """skill_matrix_manager のデータベースからのPDF出力のテスト"""
+        db = DatabaseManager(os.path.join(self.temp_dir.name, "test.db"))
+        self.assertGreaterEqual(db.export_radar_pdf(self.path), 1)
+        with open(self.path, "rb") as f:
+            self.assertTrue(f.read(5).startswith(b"%PDF"))
+
+    def test_database_manager_levels_roundtrip(self):
+        """skill_matrix_manager のスキルレベルデータの出力を取り込めることのテスト"""
+        db = DatabaseManager(os.path.join(self.temp_dir.name, "test.db"))
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("INSERT INTO user_skills (user_id, skill_id, level) VALUES (1, 1, 3), (2, 3, 0)")
+        conn.commit()
+        conn.close()
+        levels_path = os.path.join(self.temp_dir.name, "levels.csv")
+        written = db.export_levels_csv(levels_path)
+        self.assertEqual(written, 1)
+        result = db.import_csv(levels_path, levels=True)
+        self.assertEqual((result.imported, sum(result.created.values())), (written, 0))
+
+    def test_export_user_radar_pdf_schemas(self):
+        """データベースのスキーマに応じたテーブルからのPDF出力のテスト"""
+        evaluations_db = os.path.join(self.temp_dir.name, "evaluations.db")
+        manager = EvaluationManager(evaluations_db)
+        with manager.get_connection() as conn:
+            conn.execute("INSERT INTO categories (id, name) VALUES (1, 'プログラミング')")
+            conn.execute("INSERT INTO skills (id, category_id, name) VALUES (1, 1, 'Python')")
+            conn.execute("INSERT INTO users (id, name) VALUES (1, '山田')")
+        manager.set_evaluations_bulk(1, {1: 4})
+        self.assertEqual(export_user_radar_pdf(evaluations_db, self.path), 1)
+
+        user_skills_db = os.path.join(self.temp_dir.name, "user_skills.db")
+        pages = DatabaseManager(user_skills_db).export_radar_pdf(self.path)
+        self.assertEqual(export_user_radar_pdf(user_skills_db, self.path), pages)
+
+        unknown_db = os.path.join(self.temp_dir.name, "unknown.db")
+        sqlite3.connect(unknown_db).close()
+        with self.assertRaises(ValueError):
+            export_user_radar_pdf(unknown_db, self.path)
+
+if __name__ == '__main__':
+    unittest.main()
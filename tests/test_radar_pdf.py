@@ -0,0 +1,77 @@
+"""レーダーチャート一覧PDF出力のテスト
+Created: 2026-10-17 19:48:21
+Author: GingaDza
+"""
+import os
+import tempfile
+import unittest
+from src.analytics import SkillMatrix
+from src.data_io import (
+    PageLayout, RadarChartSpec, charts_from_matrix, export_matrix_radar_pdf,
+    export_radar_pdf, iter_chunks
+)
+
+class TestRadarPdf(unittest.TestCase):
+    """レーダーチャート一覧PDF出力のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "charts.pdf")
+        self.matrix = SkillMatrix(
+            [(i, f"ユーザー{i}", 1 if i <= 5 else 2) for i in range(1, 9)],
+            [(10, "Python", 1), (11, "SQL", 1), (20, "UI設計", 2)],
+        )
+        for user_id in range(1, 9):
+            self.matrix.set_user_levels(user_id, {10: user_id % 5 + 1, 20: 3})
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.temp_dir.cleanup()
+
+    def test_charts_from_matrix(self):
+        """行列からカテゴリー平均のチャートを生成することのテスト"""
+        charts = list(charts_from_matrix(self.matrix, [1, 2], {1: "技術", 2: "デザイン"}))
+        self.assertEqual(charts[0], RadarChartSpec("ユーザー1", ("技術", "デザイン"), (2.0, 3.0)))
+        self.assertEqual(charts[1].current, (3.0, 3.0))
+
+    def test_export_writes_vector_pages(self):
+        """ページが画像ではなくベクター（文字・パス）で書き込まれることのテスト"""
+        charts = [RadarChartSpec("user", ("A", "B", "C"), (1, 2, 3), (3, 3, 3))] * 7
+        self.assertEqual(export_radar_pdf(charts, self.path, PageLayout(dpi=40)), 2)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        self.assertIn(b"/Font", data)
+        self.assertNotIn(b"/Subtype /Image", data)
+
+    def test_iter_chunks(self):
+        """チャンク分割のテスト"""
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            list(iter_chunks([], 0))
+
+    def test_export_streams_pages_with_progress(self):
+        """ページ単位の書き込みと進捗通知のテスト"""
+        progress = []
+        charts = (RadarChartSpec(f"u{i}", ("A", "B", "C"), (1, 2, 3), (3, 3, 3))
+                  for i in range(13))
+        pages = export_radar_pdf(charts, self.path, PageLayout(dpi=40),
+                                 progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(pages, 3)
+        self.assertEqual(progress, [(6, None), (12, None), (13, None)])
+        with open(self.path, "rb") as f:
+            self.assertTrue(f.read(5).startswith(b"%PDF"))
+
+    def test_export_matrix_group(self):
+        """グループ指定時の総数のテスト"""
+        progress = []
+        pages = export_matrix_radar_pdf(
+            self.matrix, self.path, self.matrix.group_user_ids(1),
+            progress=lambda done, total: progress.append((done, total))
+        )
+        self.assertEqual(pages, 1)
+        self.assertEqual(progress, [(5, 5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""参照データキャッシュのテスト
+Created: 2026-10-17 13:30:45
+Author: GingaDza
+"""
+import os
+import unittest
+from src.database import (
+    close_all_pools, clear_reference_cache, get_cache_stats, reference_cache
+)
+from src.database.category_manager import CategoryManager
+from src.database.evaluation_manager import EvaluationManager
+from src.database.group_manager import GroupManager
+
+TEST_DB = "test_reference_cache.db"
+
+class TestReferenceCache(unittest.TestCase):
+    """参照データキャッシュのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        clear_reference_cache()
+        reference_cache.reset_stats()
+        self.groups = GroupManager(TEST_DB)
+        self.categories = CategoryManager(TEST_DB)
+
+    def test_groups_cached_and_invalidated(self):
+        """グループ一覧のキャッシュと作成時の無効化のテスト"""
+        self.groups.create_group("開発")
+        self.assertEqual([g.name for g in self.groups.get_all_groups()], ["開発"])
+        self.groups.get_all_groups()
+        stats = get_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+        self.groups.create_group("営業")
+        self.assertEqual([g.name for g in self.groups.get_all_groups()], ["営業", "開発"])
+        self.assertEqual(get_cache_stats()['misses'], 2)
+
+    def test_categories_cached_per_parent(self):
+        """親カテゴリー別のキャッシュのテスト"""
+        parent_id = self.categories.create_category("技術")
+        self.categories.create_category("言語", parent_id)
+        self.assertEqual(len(self.categories.get_categories()), 1)
+        self.assertEqual(len(self.categories.get_categories(parent_id)), 1)
+        self.categories.get_categories(parent_id)
+        self.assertEqual(get_cache_stats()['hits'], 1)
+
+        self.categories.create_category("DB", parent_id)
+        self.assertEqual(len(self.categories.get_categories(parent_id)), 2)
+
+    def test_returned_list_is_a_copy(self):
+        """呼び出し側でのリスト変更がキャッシュに影響しないことのテスト"""
+        self.groups.create_group("開発")
+        self.groups.get_all_groups().clear()
+        self.assertEqual(len(self.groups.get_all_groups()), 1)
+
+    def test_returned_models_are_copies(self):
+        """呼び出し側でのモデル変更がキャッシュに影響しないことのテスト"""
+        self.groups.create_group("開発")
+        self.groups.get_all_groups()[0].name = "営業"
+        self.assertEqual(self.groups.get_all_groups()[0].name, "開発")
+
+        parent_id = self.categories.create_category("技術")
+        category = self.categories.get_categories()[0]
+        category.name = "デザイン"
+        category.add_skill("Python")
+        category.add_child("言語")
+        cached = self.categories.get_categories()[0]
+        self.assertEqual((cached.id, cached.name), (parent_id, "技術"))
+        self.assertEqual((cached.skills, cached.children), ([], []))
+
+    def test_skill_ids_cached(self):
+        """スキル名解決のキャッシュのテスト"""
+        manager = EvaluationManager(TEST_DB)
+        with manager.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO skills (id, category_id, name) VALUES (?, ?, ?)",
+                [(1, 1, "Python"), (2, 2, "Python")]
+            )
+        self.assertEqual(manager.resolve_skill_ids(["Python"], category_id=2), {"Python": 2})
+        self.assertEqual(manager.resolve_skill_ids(["Python", "Go"], category_id=2), {"Python": 2})
+        self.assertEqual(get_cache_stats()['hits'], 1)
+
+    def test_skills_by_category(self):
+        """カテゴリー別スキル一覧のテスト"""
+        with self.categories.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO skills (id, category_id, name) VALUES (?, ?, ?)",
+                [(1, 1, "SQL"), (2, 1, "Python"), (3, 2, "設計")]
+            )
+        skills = self.categories.get_skills_by_category()
+        self.assertEqual(skills, {1: [(2, "Python"), (1, "SQL")], 2: [(3, "設計")]})
+        skills[1].clear()
+        self.assertEqual(len(self.categories.get_skills_by_category()[1]), 2)
+
+    def test_replaced_file_drops_entries(self):
+        """データベースファイル置換時のキャッシュ破棄のテスト"""
+        loads = []
+        load = lambda: loads.append(1) or len(loads)
+        self.assertEqual(reference_cache.get_or_load(TEST_DB, "x", (), load), 1)
+        close_all_pools()
+        with open(TEST_DB + ".new", "wb"):
+            pass
+        os.replace(TEST_DB + ".new", TEST_DB)
+        self.assertEqual(reference_cache.get_or_load(TEST_DB, "x", (), load), 2)
+
+    def test_loader_error_not_cached(self):
+        """読み込み失敗時にキャッシュしないことのテスト"""
+        def fail():
+            raise RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            reference_cache.get_or_load(TEST_DB, "x", (), fail)
+        self.assertEqual(reference_cache.get_or_load(TEST_DB, "x", (), lambda: 1), 1)
+        self.assertEqual(get_cache_stats()['entries'], 1)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        clear_reference_cache()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+if __name__ == '__main__':
+    unittest.main()
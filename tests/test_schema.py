@@ -0,0 +1,147 @@
+"""スキーマレジストリのテスト
+Created: 2026-10-17 23:31:52
+Author: GingaDza
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.config.schema import EVALUATIONS, SCHEMAS, USER_SKILLS, ensure_schema, get_schema
+from src.database import close_all_pools
+from src.database.migrations import MigrationManager, discover_migrations
+from src.database.category_manager import CategoryManager
+from src.database.evaluation_manager import EvaluationManager
+from src.database.group_manager import GroupManager
+from src.database.user_manager import UserManager
+from src.migrate import run_migrations
+
+class TestSchema(unittest.TestCase):
+    """スキーマレジストリのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        self.temp_dir.cleanup()
+
+    def _columns(self, table):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        finally:
+            conn.close()
+
+    def _tables(self, conn):
+        return {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )}
+
+    def test_versions_are_unique(self):
+        """スキーマ間で user_version が重複しないことのテスト"""
+        versions = [schema.version for schema in SCHEMAS.values()]
+        self.assertEqual(len(versions), len(set(versions)))
+
+    def test_unknown_schema(self):
+        """未定義のスキーマ名のテスト"""
+        with self.assertRaises(ValueError):
+            get_schema("unknown")
+
+    def test_ensure_schema_runs_once(self):
+        """user_version が一致していればDDLを実行しないことのテスト"""
+        conn = sqlite3.connect(self.db_path)
+        self.assertTrue(ensure_schema(conn, USER_SKILLS.name))
+        self.assertEqual(self._tables(conn),
+                         {"groups", "users", "skills", "user_skills", "skill_gap_settings"})
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], USER_SKILLS.version)
+
+        statements = []
+        conn.set_trace_callback(statements.append)
+        self.assertFalse(ensure_schema(conn, USER_SKILLS.name))
+        self.assertEqual(statements, ["PRAGMA user_version"])
+        conn.close()
+
+    def test_managers_share_bootstrap(self):
+        """マネージャーが同じスキーマを共有し、2回目以降は確認しないことのテスト"""
+        GroupManager(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(self._tables(conn),
+                         {"groups", "categories", "users", "skills", "evaluations"})
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], EVALUATIONS.version)
+        conn.close()
+
+        manager = UserManager(self.db_path)
+        checkouts = manager.get_pool_stats()["checkouts"]
+        GroupManager(self.db_path)
+        self.assertEqual(manager.get_pool_stats()["checkouts"], checkouts)
+
+    def test_replaced_file_is_checked_again(self):
+        """ファイルが置き換えられた場合はスキーマを作成し直すことのテスト"""
+        GroupManager(self.db_path)
+        os.remove(self.db_path)
+        manager = GroupManager(self.db_path)
+        self.assertIsNotNone(manager.create_group("開発部"))
+
+    def test_startup_order(self):
+        """起動時の順序（マイグレーション → マネージャー）で空のファイルから使えることのテスト"""
+        run_migrations(self.db_path)
+        self.assertTrue({"id", "category_id", "name"} <= self._columns("skills"))
+
+        group_id = GroupManager(self.db_path).create_group("開発部")
+        category_id = CategoryManager(self.db_path).create_category("プログラミング")
+        user_id = UserManager(self.db_path).create_user("山田", group_id)
+        evaluations = EvaluationManager(self.db_path)
+        with evaluations.get_connection() as conn:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], EVALUATIONS.version)
+            conn.execute("INSERT INTO skills (category_id, name) VALUES (?, ?)",
+                         (category_id, "Python"))
+        self.assertTrue(evaluations.set_evaluations_bulk(user_id, {"Python": 4}, category_id))
+        self.assertEqual(evaluations.get_user_skill_summary(user_id).levels,
+                         {category_id: {"Python": 4}})
+        self.assertEqual([e.level for e in evaluations.get_user_evaluations(user_id)], [4])
+        self.assertTrue(run_migrations(self.db_path).up_to_date)
+
+    def test_legacy_skills_table(self):
+        """初期マイグレーションの旧定義で作成した skills テーブルの変換のテスト"""
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript("""
+            CREATE TABLE skills (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER,
+                category_id INTEGER,
+                level INTEGER DEFAULT 1
+            );
+        """)
+        conn.close()
+        run_migrations(self.db_path)
+        self.assertIn("name", self._columns("skills"))
+
+    def test_upgraded_database_matches_fresh(self):
+        """初期マイグレーションのみ適用済みのデータベースが新規作成と同じ形になることのテスト"""
+        initial = [m for m in discover_migrations() if m.version == "V20250208140405"]
+        MigrationManager(self.db_path, initial).migrate()
+        self.assertIn("user_id", self._columns("skills"))  # 適用済みの定義は変えない
+        run_migrations(self.db_path)
+        fresh_path = os.path.join(self.temp_dir.name, "fresh.db")
+        run_migrations(fresh_path)
+        upgraded, fresh = sqlite3.connect(self.db_path), sqlite3.connect(fresh_path)
+        try:
+            self.assertEqual(self._tables(upgraded), self._tables(fresh))
+            for conn in (upgraded, fresh):
+                self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0],
+                                 EVALUATIONS.version)
+            for table in self._tables(fresh):
+                fresh_columns = {row[1] for row in fresh.execute(f"PRAGMA table_info({table})")}
+                self.assertLessEqual(fresh_columns, {
+                    row[1] for row in upgraded.execute(f"PRAGMA table_info({table})")
+                })
+        finally:
+            upgraded.close()
+            fresh.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""スキルギャップ分析エンジンのテスト
+Created: 2026-10-18 01:20:44
+Author: GingaDza
+"""
+import math
+import sqlite3
+import unittest
+import numpy as np
+from src.analytics import SkillGapReport, SkillMatrix, USER_SKILLS_SOURCE
+
+class TestSkillGapReport(unittest.TestCase):
+    """スキルギャップ分析エンジンのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, name TEXT, category TEXT);
+            CREATE TABLE user_skills (user_id INTEGER, skill_id INTEGER, level INTEGER);
+            INSERT INTO users VALUES (1, '山田', 1), (2, '鈴木', 1), (3, '佐藤', 2), (4, '未所属', NULL);
+            INSERT INTO skills VALUES (10, 'Python', 'プログラミング'), (11, 'SQL', 'プログラミング'),
+                                      (20, 'UI設計', 'デザイン');
+            INSERT INTO user_skills VALUES (1, 10, 4), (1, 11, 2), (2, 10, 2), (3, 20, 5), (3, 10, 1),
+                                           (4, 10, 3), (4, 20, 3);
+        """)
+        self.matrix = SkillMatrix.from_connection(self.conn, USER_SKILLS_SOURCE)
+        self.report = SkillGapReport.from_matrix(self.matrix, {20: 4, 10: 3, 99: 5})
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+
+    def test_shortfall(self):
+        """不足分の行列のテスト（未評価は目標全体が不足、行列にないスキルは無視）"""
+        self.assertEqual(self.report.skill_ids, (10, 20))
+        np.testing.assert_array_equal(self.report.targets, [3, 4])
+        np.testing.assert_array_equal(self.report.shortfall, [[0, 4], [1, 4], [2, 0], [0, 1]])
+        np.testing.assert_array_equal(self.report.user_totals, [4, 5, 2, 1])
+        np.testing.assert_allclose(self.report.averages, [2.5, 4.0])
+        self.assertEqual(self.report.user_gaps(2), {10: 1, 20: 4})
+        self.assertEqual(self.report.users_below_target, 4)
+
+    def test_group_and_org(self):
+        """グループ別・組織全体の平均不足分のテスト（未所属は組織全体のみに含む）"""
+        self.assertEqual(self.report.group_ids, (1, 2))
+        np.testing.assert_allclose(self.report.group_means, [[0.5, 4.0], [2.0, 0.0]])
+        np.testing.assert_allclose(self.report.skill_means, [0.75, 2.25])
+        self.assertAlmostEqual(self.report.org_mean, 1.5)
+
+    def test_rankings(self):
+        """ランキングのテスト"""
+        self.assertEqual(self.report.top_users(), [(2, 5), (1, 4), (3, 2), (4, 1)])
+        self.assertEqual(self.report.top_users(2), [(2, 5), (1, 4)])
+        self.assertEqual(self.report.top_skills(), [(20, 2.25), (10, 0.75)])
+        self.assertEqual(self.report.top_groups(), [(1, 2.25), (2, 1.0)])
+
+    def test_histograms(self):
+        """不足分の分布のテスト"""
+        np.testing.assert_array_equal(self.report.shortfall_histogram(10), [2, 1, 1, 0, 0, 0])
+        np.testing.assert_array_equal(self.report.shortfall_histogram(20), [1, 1, 0, 0, 2, 0])
+        np.testing.assert_array_equal(self.report.shortfall_histogram(), [3, 2, 1, 0, 2, 0])
+
+    def test_out_of_range_levels(self):
+        """範囲外のレベルが他スキルの分布に混ざらないことのテスト"""
+        matrix = SkillMatrix([(1, '山田', 1), (2, '鈴木', 1)], [(10, 'Python', 'c'), (11, 'SQL', 'c')])
+        matrix.update_levels([1, 2], [10, 10], [-3, 9])
+        report = SkillGapReport.from_matrix(matrix, {10: 3, 11: 2})
+        self.assertEqual(report.user_gaps(1), {10: 3, 11: 2})
+        np.testing.assert_array_equal(report.shortfall_histogram(10), [1, 0, 0, 1, 0, 0])
+        np.testing.assert_array_equal(report.shortfall_histogram(11), [0, 0, 2, 0, 0, 0])
+
+    def test_filter_and_empty(self):
+        """スキルの絞り込みと目標なしのテスト"""
+        report = SkillGapReport.from_matrix(self.matrix, {10: 3, 20: 4}, skill_ids=[20])
+        self.assertEqual(report.skill_ids, (20,))
+        self.assertEqual(report.top_users(), [(1, 4), (2, 4), (4, 1)])
+
+        empty = SkillGapReport.from_matrix(self.matrix, {})
+        self.assertEqual(empty.shortfall.shape, (4, 0))
+        self.assertEqual(empty.top_users(), [])
+        self.assertEqual(empty.top_groups(), [])
+        self.assertTrue(math.isnan(empty.org_mean))
+
+if __name__ == '__main__':
+    unittest.main()
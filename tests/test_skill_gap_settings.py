@@ -0,0 +1,136 @@
+"""スキルギャップ設定の一意化とアップサートのテスト
+Created: 2026-10-18 01:42:15
+Author: GingaDza
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from src.database.migrations import V20261018013000__unique_skill_gap_settings as unique_settings
+
+# skill_matrix_manager は src をインポートルートとする
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from skill_matrix_manager.database.manager import DatabaseManager
+from skill_matrix_manager.views.system_tab.system_tab import SystemTab
+
+# 一意キー追加前（user_version 202）のテーブルと重複行
+LEGACY_SQL = """
+    CREATE TABLE skill_gap_settings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_id INTEGER,
+        skill_id INTEGER,
+        target_level INTEGER,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX idx_skill_gap_settings_category_id ON skill_gap_settings (category_id, skill_id);
+    INSERT INTO skill_gap_settings (category_id, skill_id, target_level) VALUES
+        (1, 1, 3), (1, 2, 4), (1, 1, 5), (3, 3, 2), (1, 2, 1);
+    PRAGMA user_version = 202;
+"""
+
+class TestSkillGapSettings(unittest.TestCase):
+    """スキルギャップ設定の一意化とアップサートのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test.db")
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.temp_dir.cleanup()
+
+    def _create_legacy(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(LEGACY_SQL)
+        conn.close()
+
+    def _rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(
+                "SELECT category_id, skill_id, target_level FROM skill_gap_settings"
+                " ORDER BY category_id, skill_id"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def _indexes(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return {row[1] for row in conn.execute("PRAGMA index_list(skill_gap_settings)")}
+        finally:
+            conn.close()
+
+    def test_migration(self):
+        """マイグレーションによる重複行の削除と一意インデックスのテスト"""
+        self._create_legacy()
+        conn = sqlite3.connect(self.db_path)
+        unique_settings.upgrade(conn.cursor())
+        conn.commit()
+        with self.assertRaises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO skill_gap_settings (category_id, skill_id) VALUES (1, 1)")
+        unique_settings.downgrade(conn.cursor())
+        conn.execute("INSERT INTO skill_gap_settings (category_id, skill_id) VALUES (1, 1)")
+        conn.close()
+
+    def test_legacy_database_is_deduplicated(self):
+        """既存データベースの重複行を最後に書き込まれた値で一意化するテスト"""
+        self._create_legacy()
+        db = DatabaseManager(self.db_path)
+        self.assertEqual(self._rows(), [(1, 1, 5), (1, 2, 1), (3, 3, 2)])
+        self.assertEqual(self._indexes(), {"idx_skill_gap_settings_key"})
+        self.assertEqual(db.get_skill_gap_settings(1), {1: 5, 2: 1})
+
+    def test_save_upserts(self):
+        """保存を繰り返しても行数がスキル数を超えないことのテスト"""
+        db = DatabaseManager(self.db_path)
+        db.save_skill_gap_settings({1: {1: 3, 2: 4}, 3: {3: 2}})
+        db.save_skill_gap_settings({1: {1: 5}})
+        db.save_skill_gap_settings({})
+        self.assertEqual(self._rows(), [(1, 1, 5), (1, 2, 4), (3, 3, 2)])
+        self.assertEqual(db.get_skill_gap_settings(), {1: 5, 2: 4, 3: 2})
+
+    def test_save_deletes_cleared_targets(self):
+        """目標レベルが None のスキルの設定を削除することのテスト"""
+        db = DatabaseManager(self.db_path)
+        db.save_skill_gap_settings({1: {1: 3, 2: 4}, 3: {3: 2}})
+        db.save_skill_gap_settings({1: {1: 5, 2: None}, 3: {4: None}})
+        self.assertEqual(self._rows(), [(1, 1, 5), (3, 3, 2)])
+
+    def test_tab_clears_blank_targets(self):
+        """スキルギャップ設定タブで空欄にした目標が保存時に削除されることのテスト"""
+        app = QApplication.instance() or QApplication([])
+        db = DatabaseManager(self.db_path)
+        db.save_skill_gap_settings({1: {1: 3, 2: 4}})
+        tab = SystemTab(db)
+        gap_tab = tab.create_skill_gap_tab()  # 参照を保持しないと表ごと破棄される
+        tab._on_skill_gap_data_loaded(tab._read_skill_gap_data())
+        for row in range(tab.skill_table.rowCount()):
+            if tab.skill_table.item(row, 0).text() == "JavaScript":
+                tab.skill_table.item(row, 2).setText("")
+        with patch.object(QMessageBox, 'information'):
+            tab.save_skill_gap_settings()
+        self.assertEqual(self._rows(), [(1, 1, 3)])
+        self.assertEqual(tab._gap_targets, {1: 3})
+
+    def test_destroyed_tab_ignores_late_result(self):
+        """スキルギャップ設定タブの破棄後に届いた読み込み結果を捨てることのテスト"""
+        app = QApplication.instance() or QApplication([])
+        db = DatabaseManager(self.db_path)
+        tab = SystemTab(db)
+        loaded = []
+        tab._on_skill_gap_data_loaded = loaded.append
+        with patch.object(SystemTab, '_read_skill_gap_data',
+                          side_effect=lambda: time.sleep(0.2)):
+            tab.create_skill_gap_tab()  # 参照を保持しないため直ちに破棄される
+            time.sleep(0.4)
+            app.processEvents()
+        self.assertEqual(loaded, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""スキルマトリックス演算エンジンのテスト
+Created: 2026-10-17 14:40:27
+Author: GingaDza
+"""
+import math
+import sqlite3
+import unittest
+from unittest.mock import patch
+import numpy as np
+from src.analytics import SkillMatrix, USER_SKILLS_SOURCE
+from src.analytics import skill_matrix
+
+class TestSkillMatrix(unittest.TestCase):
+    """スキルマトリックス演算エンジンのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, name TEXT, category TEXT);
+            CREATE TABLE user_skills (user_id INTEGER, skill_id INTEGER, level INTEGER);
+            INSERT INTO users VALUES (1, '山田', 1), (2, '鈴木', 1), (3, '佐藤', 2), (4, '未所属', NULL);
+            INSERT INTO skills VALUES (10, 'Python', 'プログラミング'), (11, 'SQL', 'プログラミング'),
+                                      (20, 'UI設計', 'デザイン');
+            INSERT INTO user_skills VALUES (1, 10, 4), (1, 11, 2), (2, 10, 2), (3, 20, 5), (3, 10, 1);
+        """)
+        self.matrix = SkillMatrix.from_connection(self.conn, USER_SKILLS_SOURCE)
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+
+    def test_load(self):
+        """1回の読み込みによる行列構築のテスト"""
+        self.assertEqual(self.matrix.shape, (4, 3))
+        self.assertEqual(self.matrix.levels.dtype, np.int8)
+        self.assertEqual(self.matrix.user_levels(1), {10: 4, 11: 2})
+        self.assertEqual(self.matrix.user_levels(4), {})
+        self.assertEqual(self.matrix.group_user_ids(1), [1, 2])
+        np.testing.assert_array_equal(self.matrix.user_groups, [1, 1, 2, -1])
+        with self.assertRaises(ValueError):
+            self.matrix.user_groups[0] = 2
+
+    def test_load_in_chunks(self):
+        """評価をチャンク単位で読み込んでも同じ行列になることのテスト"""
+        with patch.object(skill_matrix, "LOAD_CHUNK_SIZE", 2):
+            matrix = SkillMatrix.from_connection(self.conn, USER_SKILLS_SOURCE)
+        np.testing.assert_array_equal(matrix.levels, self.matrix.levels)
+
+    def test_group_sums(self):
+        """グループ別の合計と人数のテスト（未所属は除く）"""
+        group_ids, sums, members = self.matrix.group_sums(self.matrix.levels)
+        np.testing.assert_array_equal(group_ids, [1, 2])
+        np.testing.assert_array_equal(sums, [[6, 2, 0], [1, 0, 5]])
+        np.testing.assert_array_equal(members, [2, 1])
+
+    def test_group_averages(self):
+        """グループ平均のテスト（未評価は除外）"""
+        averages = self.matrix.group_averages()
+        self.assertEqual(sorted(averages), [1, 2])
+        np.testing.assert_allclose(averages[1][:2], [3.0, 2.0])
+        self.assertTrue(math.isnan(averages[1][2]))
+
+    def test_category_averages(self):
+        """カテゴリー平均のテスト"""
+        self.assertEqual(self.matrix.category_averages(1), {'プログラミング': 3.0})
+        self.assertEqual(self.matrix.category_averages(3), {'プログラミング': 1.0, 'デザイン': 5.0})
+
+    def test_update_levels_with_unknown_ids(self):
+        """行列にないIDを含む一括更新と、IDが昇順でない行列への反映のテスト"""
+        matrix = SkillMatrix([(7, 'A', 1), (3, 'B', 1)], [(9, 'X', 'c1'), (2, 'Y', 'c2')])
+        matrix.update_levels(np.array([3, 99, 7, 7]), np.array([2, 9, 1, 9]), np.array([4, 5, 1, 3]))
+        np.testing.assert_array_equal(matrix.levels, [[3, 0], [0, 4]])
+        matrix.add_users([(1, 'C', None)])
+        matrix.update_levels([1], [9], [2])
+        self.assertEqual(matrix.user_levels(1), {9: 2})
+
+    def test_category_means_without_skills(self):
+        """スキルがなくなったカテゴリーの平均が NaN になることのテスト"""
+        self.matrix.remove_skill(20)
+        means = self.matrix.category_means([1, 3])
+        np.testing.assert_allclose(means[:, 0], [3.0, 1.0])
+        self.assertTrue(np.isnan(means[:, 1]).all())
+
+    def test_gaps(self):
+        """目標レベルに対する不足分のテスト"""
+        gaps = self.matrix.gaps({10: 3, 20: 4}, user_ids=[1, 2, 3])
+        np.testing.assert_array_equal(gaps, [[0, 0, 4], [1, 0, 4], [2, 0, 0]])
+
+    def test_rank_users(self):
+        """ランキングのテスト"""
+        self.assertEqual(self.matrix.rank_users([10]), [(1, 4.0), (2, 2.0), (3, 1.0)])
+        self.assertEqual(self.matrix.rank_users(user_ids=[1, 3]), [(1, 3.0), (3, 3.0)])
+
+    def test_incremental_updates(self):
+        """行・列の増分更新のテスト"""
+        self.matrix.set_level(4, 20, 3)
+        self.matrix.add_skills([(30, 'Docker', 'インフラ')])
+        self.matrix.add_users([(5, '高橋', 2)])
+        self.matrix.set_user_levels(5, {30: 5, 10: 3})
+        self.assertEqual(self.matrix.shape, (5, 4))
+        self.assertEqual(self.matrix.user_levels(5), {10: 3, 30: 5})
+        self.assertEqual(self.matrix.category_skill_ids('インフラ'), [30])
+
+        self.matrix.remove_skill(11)
+        self.matrix.remove_user(2)
+        self.assertEqual(self.matrix.shape, (4, 3))
+        self.assertEqual(self.matrix.user_levels(1), {10: 4})
+        self.assertEqual(self.matrix.user_levels(5), {10: 3, 30: 5})
+        np.testing.assert_allclose(self.matrix.group_averages()[1][:1], [4.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""ユーザー一括登録のテスト
+Created: 2026-10-17 11:05:37
+Author: GingaDza
+"""
+import os
+import sqlite3
+import unittest
+from src.database import close_all_pools
+from src.database.migrations import V20261018090000__add_user_employee_id as employee_ids
+from src.database.user_manager import UserManager, _user_from_row
+
+TEST_DB = "test_user_bulk.db"
+
+class TestUserBulk(unittest.TestCase):
+    """ユーザー一括登録のテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.manager = UserManager(TEST_DB)
+
+    def _count_users(self):
+        with self.manager.get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    def test_create_users_bulk(self):
+        """一括作成のテスト"""
+        users = (
+            {'employee_id': f"E{i:05d}", 'name': f"ユーザー{i}", 'group_id': 1}
+            for i in range(1200)
+        )
+        result = self.manager.create_users_bulk(users, chunk_size=500)
+        self.assertEqual(result.inserted, 1200)
+        self.assertEqual(result.skipped, 0)
+        self.assertEqual(self._count_users(), 1200)
+
+    def test_create_users_bulk_skips_invalid_and_duplicates(self):
+        """名前なし・社員番号重複のスキップのテスト"""
+        result = self.manager.create_users_bulk([
+            {'employee_id': "E1", 'name': "山田", 'group_id': 1},
+            {'employee_id': "E1", 'name': "山田（重複）", 'group_id': 1},
+            {'employee_id': "E2", 'name': "", 'group_id': 1},
+            {'name': "社員番号なし", 'group_id': None},
+        ])
+        self.assertEqual(result.inserted, 2)
+        self.assertEqual(result.skipped, 2)
+
+    def test_bulk_in_outer_block_does_not_commit(self):
+        """外側のブロックのトランザクションを途中でコミットしないことのテスト"""
+        with self.assertRaises(RuntimeError):
+            with self.manager.get_connection() as conn:
+                conn.execute("INSERT INTO users (name) VALUES ('外側')")
+                self.manager.create_users_bulk([{'name': "山田"}], chunk_size=1)
+                self.manager.upsert_users_by_employee_id([{'employee_id': "E1", 'name': "鈴木"}])
+                raise RuntimeError
+        self.assertEqual(self._count_users(), 0)
+
+    def test_failed_chunk_rolls_back_only_itself(self):
+        """失敗したチャンクのみ取り消し、残りのチャンクは保存することのテスト"""
+        with self.manager.get_connection() as conn:
+            conn.execute("""
+                CREATE TRIGGER reject_ng BEFORE INSERT ON users WHEN NEW.name = 'NG'
+                BEGIN SELECT RAISE(ABORT, 'rejected'); END
+            """)
+        result = self.manager.create_users_bulk(
+            [{'name': "山田"}, {'name': "鈴木"}, {'name': "NG"}, {'name': "佐藤"}], chunk_size=2
+        )
+        self.assertEqual((result.inserted, result.failed), (2, 2))
+        self.assertEqual(self._count_users(), 2)
+
+    def test_upsert_normalizes_group_ids(self):
+        """CSV由来の文字列のグループIDを整数に揃えて変更なしと判定することのテスト"""
+        self.manager.create_users_bulk([{'employee_id': "E1", 'name': "山田", 'group_id': 1}])
+        result = self.manager.upsert_users_by_employee_id([
+            {'employee_id': "E1", 'name': "山田", 'group_id': "1"},
+            {'employee_id': "E2", 'name': "鈴木", 'group_id': " 2 "},
+            {'employee_id': "E3", 'name': "佐藤", 'group_id': ""},
+            {'employee_id': "E4", 'name': "田中", 'group_id': "開発部"},
+        ])
+        self.assertEqual((result.inserted, result.updated, result.skipped), (2, 0, 2))
+        with self.manager.get_connection() as conn:
+            self.assertEqual(dict(conn.execute(
+                "SELECT employee_id, group_id FROM users WHERE employee_id IN ('E2', 'E3')"
+            ).fetchall()), {"E2": 2, "E3": None})
+
+    def test_upsert_users_by_employee_id(self):
+        """社員番号による登録・更新のテスト"""
+        self.manager.create_users_bulk([
+            {'employee_id': "E1", 'name': "山田", 'group_id': 1},
+            {'employee_id': "E2", 'name': "鈴木", 'group_id': 1},
+        ])
+        result = self.manager.upsert_users_by_employee_id(iter([
+            {'employee_id': "E1", 'name': "山田", 'group_id': 1},    # 変更なし
+            {'employee_id': "E2", 'name': "鈴木", 'group_id': 2},    # 所属変更
+            {'employee_id': "E3", 'name': "佐藤", 'group_id': 2},    # 新規
+            {'employee_id': "E3", 'name': "佐藤花子", 'group_id': 2},  # 重複は後勝ち
+            {'employee_id': None, 'name': "不明", 'group_id': 2},
+        ]), chunk_size=2)
+        self.assertEqual(result.inserted, 1)
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(result.skipped, 3)
+        self.assertEqual(result.total, 5)
+
+        with self.manager.get_connection() as conn:
+            rows = dict(conn.execute(
+                "SELECT employee_id, name FROM users ORDER BY employee_id"
+            ).fetchall())
+        self.assertEqual(rows, {"E1": "山田", "E2": "鈴木", "E3": "佐藤花子"})
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        close_all_pools()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+class TestEmployeeIdMigration(unittest.TestCase):
+    """社員番号列のない既存データベースのテスト"""
+
+    def setUp(self):
+        """初期マイグレーションの旧定義で users テーブルを作成"""
+        self.conn = sqlite3.connect(TEST_DB)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                group_id INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            INSERT INTO users (name, group_id) VALUES ('山田', 1);
+        """)
+
+    def test_row_without_column(self):
+        """列の追加前の行から社員番号なしのユーザーを作成するテスト"""
+        user = _user_from_row(self.conn.execute("SELECT * FROM users").fetchone())
+        self.assertEqual((user.name, user.employee_id), ("山田", None))
+
+    def test_migration(self):
+        """列と一意インデックスの追加のテスト"""
+        employee_ids.upgrade(self.conn.cursor())
+        employee_ids.upgrade(self.conn.cursor())
+        self.conn.execute("INSERT INTO users (employee_id, name) VALUES ('E1', '鈴木')")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.conn.execute("INSERT INTO users (employee_id, name) VALUES ('E1', '佐藤')")
+
+    def test_manager_on_legacy_database(self):
+        """既存データベースを開いたマネージャーで社員番号を扱えることのテスト"""
+        self.conn.close()
+        manager = UserManager(TEST_DB)
+        self.assertIsNone(manager.get_user(1).employee_id)
+        result = manager.upsert_users_by_employee_id([
+            {'employee_id': "E1", 'name': "鈴木", 'group_id': 1},
+        ])
+        self.assertEqual((result.inserted, result.failed), (1, 0))
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.conn.close()
+        close_all_pools()
+        if os.path.exists(TEST_DB):
+            os.remove(TEST_DB)
+
+if __name__ == '__main__':
+    unittest.main()
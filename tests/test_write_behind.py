@@ -0,0 +1,99 @@
+"""書き込みの遅延バッファのテスト
+Created: 2026-10-18 00:51:27
+Author: GingaDza
+"""
+import unittest
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+from src.views.components.write_behind import WriteBehindBuffer
+
+class TestWriteBehindBuffer(unittest.TestCase):
+    """書き込みの遅延バッファのテスト"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.writes = []
+        self.result = True
+        self.buffer = WriteBehindBuffer(self._writer, delay_ms=30)
+        self.flushed = []
+        self.failed = []
+        self.buffer.flushed.connect(self.flushed.append)
+        self.buffer.failed.connect(lambda batch, error: self.failed.append((batch, error)))
+
+    def _writer(self, batch):
+        self.writes.append(dict(batch))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    def _wait(self, ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec_()
+
+    def test_coalesces_edits_per_key(self):
+        """同じキーへの連続した編集が1回の書き込みにまとまることのテスト"""
+        for level in range(1, 6):
+            self.buffer.put((1, "Python"), level)
+        self.buffer.update({(1, "SQL"): 2, (2, "Python"): 3})
+        self.assertEqual(self.writes, [])
+        self.assertEqual(len(self.buffer), 3)
+
+        self._wait(100)
+        self.assertEqual(self.writes, [{(1, "Python"): 5, (1, "SQL"): 2, (2, "Python"): 3}])
+        self.assertEqual(self.flushed, self.writes)
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_timer_restarts_on_edit(self):
+        """編集が続く間は書き込まないことのテスト"""
+        for level in (1, 2, 3):
+            self.buffer.put("key", level)
+            self._wait(15)
+        self.assertEqual(self.writes, [])
+        self._wait(60)
+        self.assertEqual(self.writes, [{"key": 3}])
+
+    def test_flush_writes_immediately(self):
+        """flush で待たずに書き込むことのテスト"""
+        self.assertTrue(self.buffer.flush())
+        self.assertEqual(self.writes, [])
+
+        self.buffer.put("key", 1)
+        self.assertTrue(self.buffer.flush())
+        self.assertEqual(self.writes, [{"key": 1}])
+        self._wait(60)
+        self.assertEqual(len(self.writes), 1)
+
+    def test_failed_flush_keeps_edits(self):
+        """書き込みに失敗した編集がバッファに残ることのテスト"""
+        self.buffer.put("a", 1)
+        self.result = False
+        self.assertFalse(self.buffer.flush())
+        self.assertEqual(self.failed, [({"a": 1}, None)])
+
+        error = RuntimeError("locked")
+        self.result = error
+        self.buffer.put("b", 2)
+        self.assertFalse(self.buffer.flush())
+        self.assertEqual(self.failed[-1], ({"a": 1, "b": 2}, error))
+
+        self.result = True
+        self.buffer.put("a", 3)
+        self.assertTrue(self.buffer.flush())
+        self.assertEqual(self.writes[-1], {"a": 3, "b": 2})
+
+    def test_discard(self):
+        """破棄した編集は書き込まないことのテスト"""
+        self.buffer.put("a", 1)
+        self.buffer.discard()
+        self._wait(60)
+        self.assertEqual(self.writes, [])
+        self.assertEqual(self.buffer.pending(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""ストリーミングXLSXライターのテスト
+Created: 2026-10-17 22:31:18
+Author: GingaDza
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+import zipfile
+from xml.etree import ElementTree
+from src.data_io import XlsxWriter, export_skill_matrix_xlsx
+from src.data_io.xlsx_writer import _column_name
+
+NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+class TestXlsxWriter(unittest.TestCase):
+    """ストリーミングXLSXライターのテスト"""
+
+    def setUp(self):
+        """テスト環境のセットアップ"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "matrix.xlsx")
+
+    def tearDown(self):
+        """テスト環境のクリーンアップ"""
+        self.temp_dir.cleanup()
+
+    def _parts(self):
+        with zipfile.ZipFile(self.path) as z:
+            return {name: ElementTree.fromstring(z.read(name)) for name in z.namelist()}
+
+    def _cells(self):
+        """シートのセルを (参照, 値) の一覧で返す（共有文字列は展開する）"""
+        parts = self._parts()
+        strings = [si.find("m:t", NS).text for si in parts["xl/sharedStrings.xml"]]
+        cells = []
+        for cell in parts["xl/worksheets/sheet1.xml"].iter(f"{{{NS['m']}}}c"):
+            kind = cell.get("t")
+            if kind == "s":
+                value = strings[int(cell.find("m:v", NS).text)]
+            elif kind == "inlineStr":
+                value = cell.find("m:is/m:t", NS).text
+            else:
+                value = cell.find("m:v", NS).text
+            cells.append((cell.get("r"), value))
+        return cells
+
+    def test_parts_are_well_formed(self):
+        """すべてのパーツが整形式のXMLであることのテスト"""
+        with XlsxWriter(self.path, "シート<1>") as writer:
+            writer.writerow(["name", "level"])
+            writer.writerow(["山田", 3])
+        parts = self._parts()
+        for name in ("[Content_Types].xml", "_rels/.rels", "xl/workbook.xml",
+                     "xl/_rels/workbook.xml.rels", "xl/styles.xml",
+                     "xl/worksheets/sheet1.xml", "xl/sharedStrings.xml"):
+            self.assertIn(name, parts)
+        sheet = parts["xl/workbook.xml"].find("m:sheets/m:sheet", NS)
+        self.assertEqual(sheet.get("name"), "シート<1>")
+
+    def test_cell_values(self):
+        """値の種類ごとのセルのテスト"""
+        with XlsxWriter(self.path) as writer:
+            writer.writerow(["a & <b>", 5, 2.5, True, None, "", float("nan"), " x\x01"])
+        self.assertEqual(self._cells(), [
+            ("A1", "a & <b>"), ("B1", "5"), ("C1", "2.5"), ("D1", "1"), ("H1", " x"),
+        ])
+
+    def test_shared_strings_deduplicated(self):
+        """共有文字列の重複除去と上限超過時のインライン文字列のテスト"""
+        with XlsxWriter(self.path, max_shared_strings=2) as writer:
+            writer.writerows([["開発部", "山田"], ["開発部", "鈴木"], ["開発部", "山田"]])
+        sst = self._parts()["xl/sharedStrings.xml"]
+        self.assertEqual(sst.get("uniqueCount"), "2")
+        self.assertEqual(sst.get("count"), "5")
+        self.assertEqual([value for _, value in self._cells()],
+                         ["開発部", "山田", "開発部", "鈴木", "開発部", "山田"])
+
+    def test_column_name(self):
+        """列名の変換のテスト"""
+        self.assertEqual([_column_name(i) for i in (0, 25, 26, 51, 52, 701, 702)],
+                         ["A", "Z", "AA", "AZ", "BA", "ZZ", "AAA"])
+
+    def test_export_skill_matrix(self):
+        """スキルマトリックスのXLSX出力のテスト"""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE categories (id INTEGER PRIMARY KEY, name TEXT);
+            CREATE TABLE skills (id INTEGER PRIMARY KEY, category_id INTEGER, name TEXT);
+            CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, group_id INTEGER);
+            CREATE TABLE evaluations (user_id INTEGER, skill_id INTEGER, level INTEGER);
+            INSERT INTO groups VALUES (1, '開発部');
+            INSERT INTO categories VALUES (1, 'プログラミング');
+            INSERT INTO skills VALUES (10, 1, 'Python'), (11, 1, 'SQL');
+            INSERT INTO users VALUES (1, '山田', 1), (2, '鈴木', NULL);
+            INSERT INTO evaluations VALUES (1, 10, 4), (2, 11, 2);
+        """)
+        calls = []
+        written = export_skill_matrix_xlsx(conn, self.path,
+                                           progress=lambda done, total: calls.append((done, total)))
+        conn.close()
+        self.assertEqual(written, 2)
+        self.assertEqual(calls[-1], (2, 2))
+        self.assertEqual(self._cells(), [
+            ("A1", "group"), ("B1", "user"), ("C1", "Python"), ("D1", "SQL"),
+            ("A2", "開発部"), ("B2", "山田"), ("C2", "4"),
+            ("B3", "鈴木"), ("D3", "2"),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()